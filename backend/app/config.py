@@ -22,6 +22,61 @@ class Settings(BaseSettings):
     EMAIL_FROM: str
     FRONTEND_URL: str = 'http://meetyfi.eplsio.com'
 
+    # SMTP connection pool
+    SMTP_USE_TLS: bool = True
+    SMTP_TIMEOUT: float = 10
+    SMTP_POOL_SIZE: int = 4
+    SMTP_POOL_IDLE_SECONDS: float = 60
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
+    SMTP_BREAKER_FAILURE_THRESHOLD: int = 3
+    SMTP_BREAKER_RESET_SECONDS: float = 30
+
+    # Email outbox delivery
+    EMAIL_OUTBOX_WORKERS: int = 2
+    EMAIL_OUTBOX_BATCH_SIZE: int = 20
+    EMAIL_OUTBOX_POLL_SECONDS: float = 1.0
+    EMAIL_MAX_ATTEMPTS: int = 6
+    EMAIL_RETRY_BASE_SECONDS: int = 30
+    EMAIL_RETRY_MAX_SECONDS: int = 3600
+    EMAIL_SENDING_LEASE_SECONDS: int = 300
+    # Meeting request and status emails wait this long so that several to one
+    # recipient go out as one digest; every such email is delayed by up to
+    # this much. 0 sends every notification on its own
+    NOTIFICATION_DIGEST_WINDOW_SECONDS: int = 60
+    EMAIL_FANOUT_CONCURRENCY: int = 4  # Parallel SMTP sessions per outbox batch
+    EMAIL_FANOUT_TIMEOUT_SECONDS: float = 30
+
+    # Manager availability
+    WORKDAY_START: str = "09:00"
+    WORKDAY_END: str = "18:00"
+    AVAILABILITY_SLOT_MINUTES: int = 30
+    BUSY_BITMAP_GRANULARITY_MINUTES: int = 5
+    BUSY_BITMAP_TTL_SECONDS: float = 300
+    MEETING_LIST_CACHE_ENTRIES: int = 5000  # Serialized meeting list pages kept in memory
+    MEETING_LIST_CACHE_TTL_SECONDS: float = 60
+    RECURRENCE_CONFLICT_HORIZON_DAYS: int = 90  # How far ahead a new series is checked for conflicts
+    MEETING_IMPORT_MAX_ROWS: int = 10000  # Rows accepted by one bulk import
+    MEETING_STATUS_BATCH_MAX: int = 200  # Status changes accepted by one batch request
+    SCHEDULE_PLAN_MAX_REQUESTS: int = 1000  # Pending requests considered by one schedule plan
+    PROPOSED_DATE_SWEEP_INTERVAL_SECONDS: int = 300
+    PROPOSED_DATE_SWEEP_BATCH_SIZE: int = 500  # Requests auto-cancelled per sweep at most
+
+    # Meeting reminders
+    REMINDER_LEAD_MINUTES: int = 30  # How long before an accepted meeting its reminder is sent
+    REMINDER_TICK_SECONDS: int = 60  # Must divide an hour
+    REMINDER_HORIZON_HOURS: int = 24  # How far ahead meetings are held in memory
+    REMINDER_RELOAD_SECONDS: int = 3600
+
+    # Verification tokens and OTPs
+    OTP_EXPIRE_MINUTES: int = 10
+    VERIFICATION_TOKEN_EXPIRE_DAYS: int = 7
+    VERIFICATION_SWEEP_INTERVAL_SECONDS: int = 3600
+
+    # Access token revocation
+    REVOCATION_REFRESH_SECONDS: int = 60
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+
     class Config:
         # The env_file tells pydantic where to load environment variables from
         env_file = ".env"
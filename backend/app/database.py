@@ -1,9 +1,11 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Float, Text, Enum
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Float, Text, Enum, Index, DDL, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, literal_column
 import enum
+from datetime import timedelta
 from app.data import Base
+from app.utils.recurrence import RecurrenceRule, Series
 
 class UserType(str, enum.Enum):
     MANAGER = "manager"
@@ -32,9 +34,6 @@ class Manager(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     manager_id = Column(String(8), unique=True, index=True, nullable=False)
-    
-    otp = Column(String, nullable=True)  
-    otp_created_at = Column(DateTime, nullable=True)
 
     employees = relationship("Employee", back_populates="manager")
     meetings = relationship("Meeting", back_populates="manager")
@@ -45,7 +44,7 @@ class ProposedDate(Base):
     id = Column(Integer, primary_key=True, index=True)
     meeting_id = Column(Integer, ForeignKey("meetings.id"), index=True, nullable=False)
     date = Column(DateTime(timezone=True), nullable=False)
-    status = Column(String, default="pending", nullable=False)
+    status = Column(String, default="pending", nullable=False)  # pending or expired, see app/utils/proposed_dates.py
     proposed_by_id = Column(Integer, nullable=False)  # ID of the user who proposed this date
     proposed_by_type = Column(String, nullable=False)  # Type of user who proposed (manager/employee)
     is_selected = Column(Boolean, default=False)  # Add this field
@@ -54,6 +53,11 @@ class ProposedDate(Base):
 
     meeting = relationship("Meeting", back_populates="proposed_dates")
 
+    __table_args__ = (
+        # Expiry sweeps: open dates that have passed
+        Index("ix_proposed_dates_status_date", "status", "date"),
+    )
+
 class Employee(Base):
     __tablename__ = "employees"
 
@@ -66,7 +70,7 @@ class Employee(Base):
     phone = Column(String, nullable=True)
     profile_picture = Column(String, nullable=True)
     is_verified = Column(Boolean, default=False)
-    verification_token = Column(String, nullable=True)
+    verification_token_hash = Column(String(64), unique=True, index=True, nullable=True)  # SHA-256 of the emailed token
     manager_id = Column(Integer, ForeignKey("managers.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -88,6 +92,25 @@ class Location(Base):
 
     employee = relationship("Employee", back_populates="locations")
 
+def meeting_search_document(title, description, client_name, client_email):
+    """
+    Postgres tsvector over the searchable meeting fields
+
+    Constants are inlined so queries compile to exactly the expression the
+    GIN index was built on. Emails are indexed whole and split at "@" and
+    "." so that either form matches.
+    """
+    def field(column):
+        return func.coalesce(column, literal_column("''"))
+
+    text = field(title)
+    for column in (description, client_name, client_email):
+        text = text.op("||")(literal_column("' '")).op("||")(field(column))
+    text = text.op("||")(literal_column("' '")).op("||")(
+        func.translate(field(client_email), literal_column("'@.'"), literal_column("'  '"))
+    )
+    return func.to_tsvector(literal_column("'simple'::regconfig"), text)
+
 class Meeting(Base):
     __tablename__ = "meetings"
 
@@ -96,6 +119,11 @@ class Meeting(Base):
     description = Column(Text, nullable=True)
     date = Column(DateTime(timezone=True))
     duration = Column(Integer)  # in minutes
+    ends_at = Column(DateTime(timezone=True), nullable=True)  # date + duration, kept in sync on write
+    recurrence_rule = Column(String, nullable=True)  # RRULE subset, see app/utils/recurrence.py
+    recurrence_until = Column(DateTime(timezone=True), nullable=True)  # Start of the last occurrence; NULL = no end
+    reminder_sent_at = Column(DateTime(timezone=True), nullable=True)  # Set once the reminder email is queued
+    version = Column(Integer, default=1, server_default="1", nullable=False)  # Bumped on every change; the ETag of a meeting
     location = Column(String, nullable=True)
     status = Column(String, default="pending", nullable=False)
     rejection_reason = Column(String, nullable=True)
@@ -113,6 +141,82 @@ class Meeting(Base):
     manager = relationship("Manager", back_populates="meetings")
     employees = relationship("EmployeeMeeting", back_populates="meeting")
     proposed_dates = relationship("ProposedDate", back_populates="meeting", cascade="all, delete-orphan")
+    exceptions = relationship("MeetingException", back_populates="meeting", cascade="all, delete-orphan")
+
+    # ORM flushes check and bump the version; Core UPDATEs bump it themselves
+    __mapper_args__ = {"version_id_col": version}
+
+    __table_args__ = (
+        # Overlap lookups: a GiST range index on Postgres, a composite B-tree elsewhere
+        Index(
+            "ix_meetings_manager_period",
+            "manager_id",
+            func.tstzrange(date, ends_at),
+            postgresql_using="gist",
+            postgresql_where=date.isnot(None)
+        ).ddl_if(dialect="postgresql"),
+        Index("ix_meetings_manager_date_ends_at", "manager_id", "date", "ends_at").ddl_if(
+            callable_=lambda ddl, target, bind, **kw: bind.dialect.name != "postgresql"
+        ),
+        # Full-text search on Postgres (SQLite uses an FTS5 table, see app/utils/meeting_search.py)
+        Index(
+            "ix_meetings_search",
+            meeting_search_document(title, description, client_name, client_email),
+            postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+        # Upcoming meetings across managers, for the reminder scheduler
+        Index("ix_meetings_date_status", "date", "status"),
+        # Recurring series are few per manager; keep them out of the overlap indexes' way
+        Index(
+            "ix_meetings_manager_series",
+            "manager_id",
+            "recurrence_until",
+            postgresql_where=recurrence_rule.isnot(None),
+            sqlite_where=recurrence_rule.isnot(None)
+        ),
+    )
+
+def meeting_end(start, duration):
+    """End time of a meeting, or None while it has no date"""
+    if start is None or duration is None:
+        return None
+    return start + timedelta(minutes=duration)
+
+@event.listens_for(Meeting, "before_insert")
+@event.listens_for(Meeting, "before_update")
+def _set_meeting_end(mapper, connection, target):
+    target.ends_at = meeting_end(target.date, target.duration)
+    if target.recurrence_rule and target.date is not None:
+        target.recurrence_until = Series(
+            RecurrenceRule.parse(target.recurrence_rule), target.date, target.duration or 0, None
+        ).compute_last_start()
+    else:
+        target.recurrence_until = None
+
+# The GiST index mixes an integer and a range column
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql")
+)
+
+class MeetingException(Base):
+    """A single occurrence of a recurring meeting that was cancelled or moved"""
+    __tablename__ = "meeting_exceptions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), nullable=False)
+    original_start = Column(DateTime(timezone=True), nullable=False)
+    is_cancelled = Column(Boolean, default=False, nullable=False)
+    new_date = Column(DateTime(timezone=True), nullable=True)
+    new_duration = Column(Integer, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    meeting = relationship("Meeting", back_populates="exceptions")
+
+    __table_args__ = (
+        Index("ix_meeting_exceptions_meeting_start", "meeting_id", "original_start", unique=True),
+    )
 
 class EmployeeMeeting(Base):
     __tablename__ = "employee_meetings"
@@ -124,6 +228,77 @@ class EmployeeMeeting(Base):
     employee = relationship("Employee", back_populates="meetings")
     meeting = relationship("Meeting", back_populates="employees")
 
+    __table_args__ = (
+        Index("ix_employee_meetings_meeting_employee", "meeting_id", "employee_id"),
+    )
+
+class MeetingParticipant(Base):
+    """
+    Who a meeting shows up for, with its date copied in
+
+    Denormalized from meetings, employee_meetings and proposed_dates so a
+    user's meeting feed is a range scan on (user_type, user_id, date).
+    For requests without a selected date, `date` is the earliest proposed one.
+    """
+    __tablename__ = "meeting_participants"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_type = Column(String, nullable=False)
+    user_id = Column(Integer, nullable=False)
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), nullable=False)
+    role = Column(String, nullable=False)  # organizer, requester or attendee
+    date = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_meeting_participants_user_date", "user_type", "user_id", "date"),
+        Index("ix_meeting_participants_meeting_user", "meeting_id", "user_type", "user_id", unique=True),
+    )
+
+class OneTimePassword(Base):
+    __tablename__ = "one_time_passwords"
+
+    id = Column(Integer, primary_key=True, index=True)
+    email = Column(String, nullable=False)
+    purpose = Column(String, nullable=False)  # e.g. "manager_signup"
+    code_hash = Column(String(64), nullable=False)  # SHA-256 of the emailed code
+    expires_at = Column(DateTime, index=True, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_one_time_passwords_email_purpose", "email", "purpose"),
+    )
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    key = Column(String, unique=True, index=True, nullable=False)  # "jti:<jti>" or "<user_type>:<user_id>"
+    revoked_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, index=True, nullable=False)  # After this, affected tokens have expired anyway
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    recipient = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    html_content = Column(Text, nullable=False)
+    text_content = Column(Text, nullable=True)
+    status = Column(String, default="pending", nullable=False)  # pending, sending, sent, dead, coalesced
+    category = Column(String, nullable=True)  # Set for notifications that may be merged into a digest
+    payload = Column(Text, nullable=True)  # JSON summary of the notification, used to build digests
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime, nullable=False)
+    locked_at = Column(DateTime, nullable=True)  # When a worker claimed the row
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+        Index("ix_email_outbox_recipient_status", "recipient", "status"),
+    )
+
 class Admin(Base):
     __tablename__ = "admins"
 
@@ -131,4 +306,17 @@ class Admin(Base):
     email = Column(String, unique=True, index=True)
     password = Column(String)
     name = Column(String)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class CalendarVersion(Base):
+    __tablename__ = "calendar_versions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_type = Column(String, nullable=False)
+    user_id = Column(Integer, nullable=False)
+    version = Column(Integer, default=1, nullable=False)  # Bumped whenever one of the user's meetings changes
+    updated_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_calendar_versions_user", "user_type", "user_id", unique=True),
+    )
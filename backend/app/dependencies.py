@@ -5,6 +5,7 @@ from app.database import Manager, Employee, Admin, UserType
 from app.config import settings
 from app.utils.security import verify_token
 from app.data import get_db_session
+from app.utils.revocation import revocation_list
 
 def get_db():
     db = get_db_session()  # Ensure this function returns a Session object, not a generator
@@ -34,6 +35,10 @@ async def get_current_user(authorization: str = Header(...), db: Session = Depen
         if user_id is None or user_type is None:
             raise credentials_exception
 
+        # Bloom filter check first; only probable hits reach the database
+        if revocation_list.is_revoked(db, payload):
+            raise credentials_exception
+
         if user_type == UserType.MANAGER:
             user = db.query(Manager).filter(Manager.id == user_id).first()
         elif user_type == UserType.EMPLOYEE:
@@ -73,3 +78,8 @@ async def get_current_admin(current_user = Depends(get_current_user)):
             detail="Not authorized to access this resource"
         )
     return current_user
+
+
+async def get_token_payload(authorization: str = Header(...), current_user = Depends(get_current_user)):
+    """Decoded claims of the bearer token used for the current request"""
+    return verify_token(authorization.split(" ")[1])
@@ -1,4 +1,5 @@
 from fastapi import HTTPException, status
+from typing import Any, Dict, List, Optional
 
 class CustomException(HTTPException):
     """Base class for custom exceptions"""
@@ -86,6 +87,39 @@ class InvalidMeetingStatusException(CustomException):
             detail=detail
         )
 
+class MeetingConflictException(CustomException):
+    """Exception raised when a meeting overlaps participants' existing meetings"""
+    def __init__(self, meeting_ids: List[int], employee_ids: List[int]):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "Meeting conflicts with existing meetings",
+                "conflicting_meeting_ids": meeting_ids,
+                "conflicting_employee_ids": employee_ids
+            }
+        )
+
+class PreconditionFailedException(CustomException):
+    """Exception raised when an If-Match header no longer matches the resource"""
+    def __init__(self, detail: str = "The resource was modified since it was read", etag: Optional[str] = None):
+        super().__init__(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=detail
+        )
+        if etag:
+            self.headers = {"ETag": etag}
+
+class MeetingImportException(CustomException):
+    """Exception raised when rows of a bulk meeting import are rejected"""
+    def __init__(self, message: str, errors: List[Dict[str, Any]], status_code: int = status.HTTP_422_UNPROCESSABLE_ENTITY):
+        super().__init__(
+            status_code=status_code,
+            detail={
+                "message": message,
+                "errors": errors
+            }
+        )
+
 class ValidationException(CustomException):
     """Exception raised for validation errors"""
     def __init__(self, detail: str):
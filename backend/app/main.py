@@ -1,10 +1,23 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.data import SessionLocal
+from app.data import SessionLocal, create_tables, engine
 from app.routers import auth, managers, employees, admin
 from sqlalchemy.orm import Session
 from app.utils.password import hash_password
 from app.database import Admin
+from app.config import settings
+from app.utils.background import register_task, start_tasks, stop_tasks
+from app.utils.otp import sweep_expired_verifications
+from app.utils.revocation import revocation_list, sweep_expired_revocations
+from app.utils.outbox import deliver_pending
+from app.utils.smtp_pool import smtp_pool
+from app.utils.fanout import shutdown_fanout
+from app.utils.meeting_queries import backfill_meeting_end_times
+from app.utils.meeting_search import ensure_search_index
+from app.utils.participants import backfill_participants
+from app.utils.reminders import reminder_scheduler
+from app.utils.proposed_dates import sweep_expired_proposed_dates
+from app.utils.schema_upgrades import upgrade_schema
 
 app = FastAPI(
     title="Meetyfi-Backend",
@@ -44,10 +57,46 @@ def create_default_admin():
         print("Admin already exists.")
     db.close()
 
+register_task(
+    "verification-sweeper",
+    settings.VERIFICATION_SWEEP_INTERVAL_SECONDS,
+    sweep_expired_verifications
+)
+register_task(
+    "revocation-refresh",
+    settings.REVOCATION_REFRESH_SECONDS,
+    sweep_expired_revocations
+)
+register_task(
+    "proposed-date-sweeper",
+    settings.PROPOSED_DATE_SWEEP_INTERVAL_SECONDS,
+    sweep_expired_proposed_dates
+)
+register_task("meeting-reminders", settings.REMINDER_TICK_SECONDS, reminder_scheduler.run)
+for worker in range(settings.EMAIL_OUTBOX_WORKERS):
+    register_task(f"email-outbox-{worker + 1}", settings.EMAIL_OUTBOX_POLL_SECONDS, deliver_pending)
+
 @app.on_event("startup")
 def startup_event():
+    create_tables()
+    upgrade_schema(engine)
     create_default_admin()
-    
+    db = SessionLocal()
+    try:
+        revocation_list.rebuild(db)
+        backfill_meeting_end_times(db)
+        ensure_search_index(db)
+        backfill_participants(db)
+        reminder_scheduler.load(db)
+    finally:
+        db.close()
+    start_tasks()
+
+@app.on_event("shutdown")
+def shutdown_event():
+    stop_tasks()
+    shutdown_fanout()
+    smtp_pool.close_all()
 
 @app.get("/")
 async def root():
@@ -10,6 +10,7 @@ from app.services.admin_service import (
     get_manager_requests, update_manager_status,
     get_all_managers
 )
+from app.utils.outbox import get_outbox_metrics
 from app.dependencies import get_db, get_current_admin
 
 router = APIRouter()
@@ -45,4 +46,12 @@ async def list_managers(
     db: Session = Depends(get_db)
 ):
     """Get all managers"""
-    return get_all_managers(db, page, limit)
\ No newline at end of file
+    return get_all_managers(db, page, limit)
+
+@router.get("/email/metrics")
+async def email_metrics(
+    current_admin = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Email outbox delivery metrics"""
+    return get_outbox_metrics(db)
@@ -11,9 +11,9 @@ from app.schemas.auth import (
 )
 from app.services.auth_service import (
     register_manager, verify_manager_otp,
-    login_user, verify_employee
+    login_user, verify_employee, logout_user
 )
-from app.dependencies import get_db_session
+from app.dependencies import get_db_session, get_token_payload
 
 router = APIRouter()
 
@@ -47,4 +47,13 @@ async def verify_employee_account(
     db: Session = Depends(get_db_session)
 ):
     """Employee verification and password setup"""
-    return verify_employee(db, request)
\ No newline at end of file
+    return verify_employee(db, request)
+
+@router.post("/logout")
+async def logout(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db_session)
+):
+    """Revoke the current access token"""
+    logout_user(db, payload)
+    return {"message": "Logged out successfully"}
@@ -1,19 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, status, Query, Header, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
 
 from app.schemas.employee import (
     EmployeeProfileResponse, EmployeeProfileUpdate,
-    ManagerResponse, ManagerAvailabilityResponse,
+    ManagerResponse, ManagerAvailabilityResponse, ManagerFreeSlotsResponse,
     LocationCreateRequest, MeetingRequestCreate,
     MeetingListResponse
 )
 from app.services.employee_service import (
     get_employee_profile, update_employee_profile,
     get_manager_details, get_manager_availability,
-    post_location, request_meeting, get_employee_meetings
+    post_location, request_meeting, get_employee_meetings, cancel_meeting
 )
+from app.services.availability_service import get_free_slots, parse_clock
+from app.database import UserType
+from app.utils.calendar_feed import FEED_COLUMNS, calendar_response
+from app.utils.meeting_etags import if_match_versions, set_meeting_etag
+from app.utils.meeting_queries import employee_meetings_query
+from app.utils.response_cache import meeting_list_cache
 from app.dependencies import get_db, get_current_employee
 
 router = APIRouter()
@@ -46,22 +52,34 @@ async def get_manager(
 @router.get("/managers/availability", response_model=ManagerAvailabilityResponse)
 async def get_availability(
     date: date = Query(..., description="Date to check availability (YYYY-MM-DD)"),
-    time: str = Query(..., description="Time to check availability (HH:MM)"),
+    time_str: str = Query(..., alias="time", description="Time to check availability (HH:MM)"),
     current_employee = Depends(get_current_employee),
     db: Session = Depends(get_db)
 ):
     """Get manager availability for a specific date and time"""
-    # Parse the time string to a time object
-    try:
-        hour, minute = map(int, time.split(':'))
-        time_obj = time(hour=hour, minute=minute)
-    except (ValueError, TypeError):
-        raise HTTPException(
-            status_code=400, 
-            detail="Invalid time format. Please use HH:MM format (e.g., 14:30)"
-        )
-    
-    return get_manager_availability(db, current_employee.id, date, time_obj)
+    time_obj = parse_clock(time_str)
+    return get_manager_availability(db, current_employee.manager_id, date, time_obj)
+
+@router.get("/managers/availability/slots", response_model=ManagerFreeSlotsResponse)
+async def get_availability_slots(
+    date: date = Query(..., description="First day to list free slots for (YYYY-MM-DD)"),
+    days: int = Query(1, ge=1, le=7, description="Number of days, up to a week"),
+    slot_minutes: Optional[int] = Query(None, ge=5, le=480, description="Slot length in minutes"),
+    work_start: Optional[str] = Query(None, description="Start of working hours (HH:MM)"),
+    work_end: Optional[str] = Query(None, description="End of working hours (HH:MM)"),
+    current_employee = Depends(get_current_employee),
+    db: Session = Depends(get_db)
+):
+    """Get every free slot of the manager for a day or week"""
+    return get_free_slots(
+        db,
+        current_employee.manager_id,
+        date,
+        days,
+        slot_minutes,
+        parse_clock(work_start) if work_start else None,
+        parse_clock(work_end) if work_end else None
+    )
 
 @router.post("/location", response_model=dict)
 async def create_location(
@@ -80,8 +98,38 @@ async def create_meeting_request(
     db: Session = Depends(get_db)
 ):
     """Request a meeting with manager and client"""
-    meeting_id = request_meeting(db, current_employee.id, meeting)
-    return {"message": "Meeting request with client sent successfully", "meeting_id": meeting_id}
+    result = request_meeting(db, current_employee.id, meeting)
+    return {"message": "Meeting request with client sent successfully", **result}
+
+@router.delete("/meetings/{meeting_id}")
+async def cancel_meeting_request(
+    meeting_id: int,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    current_employee = Depends(get_current_employee),
+    db: Session = Depends(get_db)
+):
+    """Cancel a pending meeting request (supports If-Match with the meeting's ETag)"""
+    meeting = cancel_meeting(db, current_employee.id, meeting_id, if_match_versions(if_match, meeting_id))
+    set_meeting_etag(response, meeting)
+    return {"message": "Meeting cancelled successfully"}
+
+@router.get("/meetings.ics")
+async def get_calendar_feed(
+    if_none_match: Optional[str] = Header(None),
+    current_employee = Depends(get_current_employee),
+    db: Session = Depends(get_db)
+):
+    """iCalendar feed of all meetings (supports If-None-Match)"""
+    employee_id = current_employee.id
+    return calendar_response(
+        db,
+        UserType.EMPLOYEE.value,
+        employee_id,
+        f"MeetyFi - {current_employee.name}",
+        lambda session: employee_meetings_query(session, employee_id, session.query(*FEED_COLUMNS)),
+        if_none_match
+    )
 
 @router.get("/meetings", response_model=MeetingListResponse)
 async def list_meetings(
@@ -90,8 +138,17 @@ async def list_meetings(
     date_to: Optional[date] = None,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    search: Optional[str] = Query(None, max_length=200),
     current_employee = Depends(get_current_employee),
     db: Session = Depends(get_db)
 ):
     """Get all meetings"""
-    return get_employee_meetings(db, current_employee.id, status, date_from, date_to, page, limit)
\ No newline at end of file
+    key = ("employee", current_employee.id, status, date_from, date_to, page, limit, search)
+    return meeting_list_cache.respond(
+        current_employee.manager_id,
+        key,
+        lambda: MeetingListResponse.model_validate(get_employee_meetings(
+            db, current_employee.id, page, limit, status,
+            date_from=date_from, date_to=date_to, search=search
+        )).model_dump_json().encode()
+    )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Query, Header, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
@@ -7,15 +7,24 @@ from app.schemas.manager import (
     ManagerProfileResponse, ManagerProfileUpdate,
     EmployeeCreateRequest, EmployeeResponse, EmployeeListResponse,
     EmployeeLocationResponse, MeetingCreateRequest, MeetingResponse,
-    MeetingListResponse, MeetingStatusUpdateRequest
+    MeetingListResponse, MeetingStatusUpdateRequest, OccurrenceUpdateRequest,
+    MeetingStatusBatchItem, MeetingStatusBatchResponse,
+    ProposedDateRankingResponse, ScheduleAssignment, SchedulePlanResponse, MeetingDateSelectRequest
 )
 from app.services.manager_service import (
     get_manager_profile, update_manager_profile,
     add_employee, get_employees, get_employee_by_id,
     delete_employee, get_employee_locations,
-    create_meeting, get_meetings, update_meeting_status, delete_meeting
-    
+    create_meeting, get_meetings, update_meeting_status, delete_meeting,
+    rank_proposed_dates, update_occurrence, import_meetings, update_meeting_statuses,
+    plan_pending_requests, apply_schedule_plan, select_meeting_date
 )
+from app.config import settings
+from app.database import UserType
+from app.utils.calendar_feed import FEED_COLUMNS, calendar_response
+from app.utils.meeting_etags import if_match_versions, set_meeting_etag
+from app.utils.meeting_queries import manager_meetings_query
+from app.utils.response_cache import meeting_list_cache
 from app.dependencies import get_db, get_current_manager
 import logging
 
@@ -112,6 +121,23 @@ async def view_employee_locations(
     """View employee locations"""
     return get_employee_locations(db, current_manager.id, date)
 
+@router.get("/meetings.ics")
+async def get_calendar_feed(
+    if_none_match: Optional[str] = Header(None),
+    current_manager = Depends(get_current_manager),
+    db: Session = Depends(get_db)
+):
+    """iCalendar feed of all meetings (supports If-None-Match)"""
+    manager_id = current_manager.id
+    return calendar_response(
+        db,
+        UserType.MANAGER.value,
+        manager_id,
+        f"MeetyFi - {current_manager.name}",
+        lambda session: manager_meetings_query(session, manager_id, session.query(*FEED_COLUMNS)),
+        if_none_match
+    )
+
 @router.get("/meetings", response_model=MeetingListResponse)
 async def list_meetings(
     status: Optional[str] = None,
@@ -119,11 +145,19 @@ async def list_meetings(
     date_to: Optional[date] = None,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    search: Optional[str] = Query(None, max_length=200),
     current_manager = Depends(get_current_manager),
     db: Session = Depends(get_db)
 ):
     """View all meetings"""
-    return get_meetings(db, current_manager.id, status, date_from, date_to, page, limit)
+    key = ("manager", current_manager.id, status, date_from, date_to, page, limit, search)
+    return meeting_list_cache.respond(
+        current_manager.id,
+        key,
+        lambda: MeetingListResponse.model_validate(
+            get_meetings(db, current_manager.id, status, date_from, date_to, page, limit, search)
+        ).model_dump_json().encode()
+    )
 
 @router.post("/meetings", response_model=dict)
 async def schedule_meeting(
@@ -135,23 +169,102 @@ async def schedule_meeting(
     meeting_id = create_meeting(db, current_manager.id, meeting)
     return {"message": "Meeting created successfully", "meeting_id": meeting_id}
 
+@router.post("/meetings/bulk", response_model=dict)
+async def import_meetings_bulk(
+    request: Request,
+    current_manager = Depends(get_current_manager),
+    db: Session = Depends(get_db)
+):
+    """Create many meetings at once from CSV (text/csv) or a JSON array of meetings"""
+    body = await request.body()
+    result = import_meetings(db, current_manager.id, body, request.headers.get("content-type", ""))
+    return {"message": f"Imported {result['created']} meetings", **result}
+
+@router.get("/meetings/{meeting_id}/proposed-dates/ranking", response_model=ProposedDateRankingResponse)
+async def get_proposed_date_ranking(
+    meeting_id: int,
+    current_manager = Depends(get_current_manager),
+    db: Session = Depends(get_db)
+):
+    """Rank a meeting request's proposed dates by conflicts and free time around them"""
+    return rank_proposed_dates(db, current_manager.id, meeting_id)
+
+@router.get("/meetings/schedule-plan", response_model=SchedulePlanResponse)
+async def get_schedule_plan(
+    current_manager = Depends(get_current_manager),
+    db: Session = Depends(get_db)
+):
+    """Propose non-overlapping dates for as many pending requests as possible"""
+    return plan_pending_requests(db, current_manager.id)
+
+@router.post("/meetings/schedule-plan", response_model=dict)
+async def apply_plan(
+    assignments: List[ScheduleAssignment] = Body(..., min_length=1, max_length=settings.SCHEDULE_PLAN_MAX_REQUESTS),
+    current_manager = Depends(get_current_manager),
+    db: Session = Depends(get_db)
+):
+    """Set the dates of a schedule plan in one call"""
+    result = apply_schedule_plan(db, current_manager.id, assignments)
+    return {"message": f"Scheduled {result['updated']} meetings", **result}
+
+@router.put("/meetings/status", response_model=MeetingStatusBatchResponse)
+async def update_meetings_status(
+    updates: List[MeetingStatusBatchItem] = Body(..., min_length=1, max_length=settings.MEETING_STATUS_BATCH_MAX),
+    current_manager = Depends(get_current_manager),
+    db: Session = Depends(get_db)
+):
+    """Accept, reject or cancel many meetings at once"""
+    return update_meeting_statuses(db, current_manager.id, updates)
+
 @router.put("/meetings/{meeting_id}/status", response_model=dict)
 async def update_meeting(
     meeting_id: int,
     status_update: MeetingStatusUpdateRequest,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     current_manager = Depends(get_current_manager),
     db: Session = Depends(get_db)
 ):
-    """Accept or reject meeting"""
-    meeting = update_meeting_status(db, current_manager.id, meeting_id, status_update)
+    """Accept or reject meeting (supports If-Match with the meeting's ETag)"""
+    meeting = update_meeting_status(
+        db, current_manager.id, meeting_id, status_update, if_match_versions(if_match, meeting_id)
+    )
+    set_meeting_etag(response, meeting)
     return {"message": f"Meeting {status_update.status}", "meeting": meeting}
 
+@router.put("/meetings/{meeting_id}/date", response_model=dict)
+async def select_date(
+    meeting_id: int,
+    selection: MeetingDateSelectRequest,
+    response: Response,
+    current_manager = Depends(get_current_manager),
+    db: Session = Depends(get_db)
+):
+    """Pick one of a meeting request's proposed dates"""
+    meeting = select_meeting_date(db, current_manager.id, meeting_id, selection.date)
+    set_meeting_etag(response, meeting)
+    return {"message": "Meeting date selected", "meeting": meeting}
+
+@router.put("/meetings/{meeting_id}/occurrences", response_model=dict)
+async def update_meeting_occurrence(
+    meeting_id: int,
+    occurrence: OccurrenceUpdateRequest,
+    current_manager = Depends(get_current_manager),
+    db: Session = Depends(get_db)
+):
+    """Cancel or move one occurrence of a recurring meeting"""
+    exception = update_occurrence(db, current_manager.id, meeting_id, occurrence)
+    return {"message": "Occurrence updated", "occurrence": exception}
+
 @router.delete("/meetings/{meeting_id}")
 async def cancel_meeting(
     meeting_id: int,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     current_manager = Depends(get_current_manager),
     db: Session = Depends(get_db)
 ):
-    """Cancel a meeting"""
-    delete_meeting(db, current_manager.id, meeting_id)
+    """Cancel a meeting (supports If-Match with the meeting's ETag)"""
+    meeting = delete_meeting(db, current_manager.id, meeting_id, if_match_versions(if_match, meeting_id))
+    set_meeting_etag(response, meeting)
     return {"message": "Meeting cancelled successfully"}
\ No newline at end of file
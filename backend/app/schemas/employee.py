@@ -46,7 +46,18 @@ class ManagerAvailabilityResponse(BaseModel):
     date: str
     time: str
     status: str
-    available_slots: Dict[str, str] = {}  # Include this to satisfy the
+    available_slots: Dict[str, str] = {}  # Free slot start -> end for the day
+
+class FreeSlotDay(BaseModel):
+    date: str
+    slots: List[TimeSlot]
+
+class ManagerFreeSlotsResponse(BaseModel):
+    manager_id: int
+    slot_minutes: int
+    work_start: str
+    work_end: str
+    days: List[FreeSlotDay]
 
 # Location
 class LocationCreateRequest(BaseModel):
@@ -74,6 +85,7 @@ class MeetingRequestCreate(BaseModel):
     duration: int = Field(..., gt=0, le=480)  # Max 8 hours
     location: Optional[str] = None
     client_info: ClientInfo  # Added client information
+    allow_conflicts: bool = False  # Book even if participants are already busy
 
     @field_validator('proposed_dates')
     def validate_dates(cls, v):
@@ -85,11 +97,16 @@ class ClientInfoResponse(BaseModel):
     email: str
     phone: Optional[str] = None
 
+class ProposedDateResponse(BaseModel):
+    date: datetime
+    is_selected: bool = False
+    status: str = "pending"  # "expired" once passed without being selected
+
 class MeetingResponse(BaseModel):
     id: int
     title: str
     description: Optional[str] = None
-    date: datetime
+    date: Optional[datetime] = None  # None until a proposed date is selected
     duration: int
     location: Optional[str] = None
     status: MeetingStatus
@@ -97,6 +114,8 @@ class MeetingResponse(BaseModel):
     manager: Dict[str, Any]  # Basic manager info
     client_info: ClientInfoResponse  # Added client information
     created_at: datetime
+    proposed_dates: Optional[List[ProposedDateResponse]] = None  # Only on the employee's own requests
+    version: int = 1  # Send back as If-Match: "meeting-<id>-v<version>"
 
 class MeetingListResponse(BaseModel):
     meetings: List[MeetingResponse]
@@ -1,8 +1,9 @@
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 from enum import Enum
 
+from app.utils.recurrence import RecurrenceRule, Series
 from app.utils.validators import validate_phone
 
 class ManagerProfileResponse(BaseModel):
@@ -99,6 +100,34 @@ class MeetingCreateRequest(BaseModel):
     employee_ids: Optional[List[int]] = None  # Optional for client meetings
     location: Optional[str] = None
     client_info: ClientInfo  # Added client information
+    allow_conflicts: bool = False  # Book even if participants are already busy
+    recurrence_rule: Optional[str] = None  # e.g. "FREQ=WEEKLY;BYDAY=MO;COUNT=12"
+
+    @field_validator('recurrence_rule')
+    def validate_recurrence_rule(cls, v):
+        if v:
+            return str(RecurrenceRule.parse(v))
+        return None
+
+    @model_validator(mode='after')
+    def validate_series(self):
+        if self.recurrence_rule:
+            # Raises ValueError if the series cannot be represented from this start
+            Series(RecurrenceRule.parse(self.recurrence_rule), self.date, self.duration)
+        return self
+
+class OccurrenceUpdateRequest(BaseModel):
+    original_start: datetime  # Start of the occurrence as the series generates it
+    cancel: bool = False
+    new_date: Optional[datetime] = None
+    new_duration: Optional[int] = Field(None, gt=0, le=480)
+    allow_conflicts: bool = False
+
+    @model_validator(mode='after')
+    def validate_change(self):
+        if self.cancel == (self.new_date is not None):
+            raise ValueError("Either cancel the occurrence or give its new_date")
+        return self
 
 class EmployeeInMeeting(BaseModel):
     id: int
@@ -116,15 +145,17 @@ class MeetingResponse(BaseModel):
     id: int
     title: str
     description: Optional[str] = None
-    date: datetime
+    date: Optional[datetime] = None  # None until a proposed date is selected
     duration: int
     location: Optional[str] = None
     status: MeetingStatus
     rejection_reason: Optional[str] = None
     created_by_type: str
     created_at: datetime
+    recurrence_rule: Optional[str] = None  # Set for recurring meetings; `date` is then the occurrence
     client_info: ClientInfoResponse  # Added client information
     employees: List[EmployeeInMeeting]
+    version: int = 1  # Send back as If-Match: "meeting-<id>-v<version>"
 
 class MeetingListResponse(BaseModel):
     meetings: List[MeetingResponse]
@@ -141,4 +172,58 @@ class MeetingStatusUpdateRequest(BaseModel):
         valid_statuses = ["pending", "accepted", "rejected", "cancelled"]
         if v.lower() not in valid_statuses:
             raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
-        return v.lower()  # Always return lowercase
\ No newline at end of file
+        return v.lower()  # Always return lowercase
+
+class MeetingStatusBatchItem(MeetingStatusUpdateRequest):
+    id: int
+
+class MeetingStatusBatchResult(BaseModel):
+    id: int
+    status: str
+    updated: bool
+    error: Optional[str] = None
+
+class MeetingStatusBatchResponse(BaseModel):
+    results: List[MeetingStatusBatchResult]
+    updated: int
+
+class ParticipantRef(BaseModel):
+    type: str
+    id: int
+
+class RankedProposedDate(BaseModel):
+    rank: int
+    proposed_date_id: int
+    date: datetime
+    end: datetime
+    is_selected: bool
+    conflict_count: int
+    conflicting_participants: List[ParticipantRef]
+    conflicting_meeting_ids: List[int]
+    slack_before_minutes: int
+    slack_after_minutes: int
+
+class ProposedDateRankingResponse(BaseModel):
+    meeting_id: int
+    proposed_dates: List[RankedProposedDate]
+
+class MeetingDateSelectRequest(BaseModel):
+    date: datetime
+
+class ScheduleAssignment(BaseModel):
+    meeting_id: int
+    date: datetime
+
+class PlannedMeeting(ScheduleAssignment):
+    title: str
+    proposed_date_id: int
+    end: datetime
+
+class UnplannedMeeting(BaseModel):
+    meeting_id: int
+    title: str
+    reason: str
+
+class SchedulePlanResponse(BaseModel):
+    assignments: List[PlannedMeeting]
+    unassigned: List[UnplannedMeeting]
@@ -95,6 +95,7 @@ class MeetingResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
     client_info: ClientInfoResponse  # Added client information
+    version: int = 1  # Send back as If-Match: "meeting-<id>-v<version>"
     
     # These fields will be populated based on the viewer's role
     employees: Optional[List[EmployeeInMeeting]] = None
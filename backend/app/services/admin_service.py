@@ -3,10 +3,12 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta
 
-from app.database import Manager, Employee, Meeting, MeetingStatus
+from app.database import Manager, Employee, Meeting, MeetingStatus, UserType
 from app.exceptions import CustomException
 from app.schemas.admin import ManagerRequestItem 
 from app.utils.email import send_manager_approval_email, send_manager_rejection_email
+from app.utils.participants import remove_participant
+from app.utils.revocation import revocation_list
 
 def get_manager_requests(db: Session, status: Optional[str] = None, skip: int = 0, limit: int = 100):
     """
@@ -129,14 +131,14 @@ def update_manager_status(db: Session, manager_id: int, status_update):
     if not is_approved and status_update.reason:
         manager.rejection_reason = status_update.reason
 
-    db.commit()
-    db.refresh(manager)
-
-    # Send email notification
+    # Queue email notification with the status change
     if is_approved:
-        send_manager_approval_email(manager.email, manager.name)
+        send_manager_approval_email(db, manager.email, manager.name)
     else:
-        send_manager_rejection_email(manager.email, manager.name, status_update.reason)
+        send_manager_rejection_email(db, manager.email, manager.name, status_update.reason)
+
+    db.commit()
+    db.refresh(manager)
 
     return manager
 
@@ -239,8 +241,10 @@ def delete_manager(manager_id: int, db: Session):
     if not manager:
         raise CustomException(status_code=404, detail="Manager not found")
 
-    # Delete the manager (cascade should handle associated records)
+    # Delete the manager (cascade should handle associated records) and sign them out
     db.delete(manager)
+    remove_participant(db, UserType.MANAGER.value, manager_id)
+    revocation_list.revoke_subject(db, UserType.MANAGER.value, manager_id)
     db.commit()
 
     return True
\ No newline at end of file
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, date, time
 import jwt
 import secrets
 import string
+import uuid
 import random
 from typing import Dict, Any, Optional
 
@@ -16,6 +17,9 @@ from app.schemas.auth import (
 from app.config import settings
 from app.utils.email import send_otp_email, send_employee_verification_email
 from app.utils.password import hash_password, verify_password
+from app.utils.security import hash_token
+from app.utils.otp import store_otp, consume_otp, MANAGER_SIGNUP
+from app.utils.revocation import revocation_list
 from app.exceptions import (
     CredentialsException, UserNotFoundException, 
     OTPVerificationException, VerificationTokenException
@@ -41,8 +45,9 @@ def create_access_token(data: Dict[str, Any]) -> str:
         str: JWT token
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    now = datetime.utcnow()
+    expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    to_encode.update({"exp": expire, "iat": now, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -85,20 +90,20 @@ def register_manager(db: Session, manager_data: ManagerSignupRequest):
         phone=manager_data.phone,
         profile_picture=manager_data.profile_picture,
         manager_id=random_manager_id,  # Add the random manager_id
-        otp=otp,
-        otp_created_at=datetime.utcnow(),
         is_verified=False,
         is_approved=False
     )
 
     try:
         db.add(new_manager)
+        store_otp(db, manager_data.email, MANAGER_SIGNUP, otp)
+
+        # Queue OTP email with the signup
+        send_otp_email(db, manager_data.email, otp, manager_data.name)
+
         db.commit()
         db.refresh(new_manager)
 
-        # Send OTP email
-        send_otp_email(manager_data.email, otp, manager_data.name)
-
         return {
             "manager_id": new_manager.id,  # Database ID
             "custom_manager_id": random_manager_id,  # Random manager ID
@@ -128,17 +133,16 @@ def verify_manager_otp(db: Session, request: VerifyOTPRequest):
             detail="Manager not found"
         )
 
-    # Check if OTP matches
-    if manager.otp != request.otp:
+    # Check the OTP against its hashed, unexpired record (and consume it)
+    if not consume_otp(db, request.email, MANAGER_SIGNUP, request.otp):
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid OTP"
+            detail="Invalid or expired OTP"
         )
 
     # Mark manager as verified
     manager.is_verified = True
-    manager.otp = None  # Clear OTP after verification
-    manager.otp_expiry = None  # Clear OTP expiry
 
     db.commit()
 
@@ -264,27 +268,28 @@ def create_employee(db: Session, manager_id: str, name: str, email: str, role: O
         role=role,
         department=department,
         manager_id=manager_id,
-        verification_token=verification_token,
-        verification_token_created_at=datetime.utcnow(),
+        verification_token_hash=hash_token(verification_token),
+        token_expiry=datetime.utcnow() + timedelta(days=settings.VERIFICATION_TOKEN_EXPIRE_DAYS),
         is_verified=False
     )
     
     try:
         db.add(new_employee)
-        db.commit()
-        db.refresh(new_employee)
         
         # Get manager details
         manager = db.query(Manager).filter(Manager.id == manager_id).first()
         
-        # Send verification email
+        # Queue verification email with the new employee
         send_employee_verification_email(
-            email, 
-            name, 
-            verification_token, 
-            manager.name, 
-            manager.company_name
+            db,
+            email=email,
+            manager_name=manager.name,
+            company_name=manager.company_name,
+            verification_token=verification_token
         )
+
+        db.commit()
+        db.refresh(new_employee)
         
         return new_employee.id
     except IntegrityError:
@@ -306,8 +311,10 @@ def verify_employee(db: Session, verify_data: EmployeeVerifyRequest) -> Dict[str
         Dict: Contains access token and user data
     """
     try:
-        # Find employee by verification token
-        employee = db.query(Employee).filter(Employee.verification_token == verify_data.verification_token).first()
+        # Find employee by the digest of the verification token (unique index probe)
+        employee = db.query(Employee).filter(
+            Employee.verification_token_hash == hash_token(verify_data.verification_token)
+        ).first()
 
         if not employee:
             raise HTTPException(
@@ -326,7 +333,7 @@ def verify_employee(db: Session, verify_data: EmployeeVerifyRequest) -> Dict[str
         hashed_password = hash_password(verify_data.password)
         employee.password = hashed_password
         employee.is_verified = True
-        employee.verification_token = None
+        employee.verification_token_hash = None
         employee.token_expiry = None
 
         db.commit()
@@ -355,6 +362,9 @@ def verify_employee(db: Session, verify_data: EmployeeVerifyRequest) -> Dict[str
             "message": "Account verified successfully"
         }
 
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         # Log the specific error for debugging
@@ -362,4 +372,19 @@ def verify_employee(db: Session, verify_data: EmployeeVerifyRequest) -> Dict[str
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error verifying employee: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+def logout_user(db: Session, payload: Dict[str, Any]) -> None:
+    """
+    Revoke the access token a user is currently signed in with
+
+    Args:
+        db: Database session
+        payload: Decoded claims of the token to revoke
+    """
+    jti = payload.get("jti")
+    if not jti:
+        raise CredentialsException("Token cannot be revoked")
+
+    revocation_list.revoke_token(db, jti, datetime.utcfromtimestamp(payload["exp"]))
+    db.commit()
@@ -0,0 +1,79 @@
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Optional
+from datetime import date, datetime, time, timedelta
+
+from app.config import settings
+from app.database import Manager
+from app.exceptions import UserNotFoundException, ValidationException
+from app.utils.intervals import split_slots
+from app.utils.busy_cache import busy_cache
+
+MAX_RANGE_DAYS = 7
+
+def parse_clock(value: str) -> time:
+    """Parse an HH:MM time of day"""
+    try:
+        hour, minute = map(int, value.split(":"))
+        return time(hour=hour, minute=minute)
+    except (ValueError, TypeError, AttributeError):
+        raise ValidationException("Invalid time format. Please use HH:MM format (e.g., 14:30)")
+
+def get_free_slots(
+    db: Session,
+    manager_id: int,
+    start_date: date,
+    days: int = 1,
+    slot_minutes: Optional[int] = None,
+    work_start: Optional[time] = None,
+    work_end: Optional[time] = None
+) -> Dict[str, Any]:
+    """
+    Get every free slot in a manager's working hours for one or more days
+
+    Args:
+        db: Database session
+        manager_id: ID of the manager
+        start_date: First day
+        days: Number of days (up to a week)
+        slot_minutes: Slot length (defaults to AVAILABILITY_SLOT_MINUTES)
+        work_start: Start of working hours (defaults to WORKDAY_START)
+        work_end: End of working hours (defaults to WORKDAY_END)
+
+    Returns:
+        Dict: Free slots per day
+    """
+    manager = db.query(Manager.id).filter(Manager.id == manager_id).first()
+    if not manager:
+        raise UserNotFoundException("Manager")
+
+    slot_minutes = slot_minutes or settings.AVAILABILITY_SLOT_MINUTES
+    work_start = work_start or parse_clock(settings.WORKDAY_START)
+    work_end = work_end or parse_clock(settings.WORKDAY_END)
+    if not 1 <= days <= MAX_RANGE_DAYS:
+        raise ValidationException(f"days must be between 1 and {MAX_RANGE_DAYS}")
+    if work_end <= work_start:
+        raise ValidationException("Working hours must end after they start")
+
+    # Answered from the cached occupancy bitmaps; uncached days are loaded
+    # together, with one query for the whole range
+    busy_cache.prefetch(db, manager_id, start_date, days)
+    slot = timedelta(minutes=slot_minutes)
+    day_list = []
+    for offset in range(days):
+        day = start_date + timedelta(days=offset)
+        free = busy_cache.free_intervals(db, manager_id, datetime.combine(day, work_start), datetime.combine(day, work_end))
+        day_list.append({
+            "date": day.isoformat(),
+            "slots": [
+                {"start_time": slot_start, "end_time": slot_end}
+                for slot_start, slot_end in split_slots(free, slot)
+            ]
+        })
+
+    return {
+        "manager_id": manager_id,
+        "slot_minutes": slot_minutes,
+        "work_start": work_start.strftime("%H:%M"),
+        "work_end": work_end.strftime("%H:%M"),
+        "days": day_list
+    }
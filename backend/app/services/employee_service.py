@@ -1,15 +1,30 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import func
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta, date, timezone, time
 
-from app.database import Employee, Manager, Meeting, Location, MeetingStatus, ProposedDate
+from app.database import (
+    Employee, Manager, Meeting, MeetingParticipant, Location, MeetingStatus, ProposedDate, UserType, meeting_end
+)
 from app.schemas.employee import (
     EmployeeProfileUpdate, LocationCreateRequest, MeetingRequestCreate
 )
-from app.exceptions import NotFoundException, PermissionDeniedException
+from app.exceptions import MeetingConflictException, NotFoundException, PermissionDeniedException, UserNotFoundException
 from app.utils.email import send_meeting_notification
+from app.utils.intervals import split_slots
+from app.services.availability_service import parse_clock
+from app.utils.busy_cache import busy_cache
+from app.utils.response_cache import meeting_list_cache
+from app.utils.reminders import reminder_scheduler
+from app.utils.calendar_feed import bump_calendar_versions, meeting_calendar_owners
+from app.utils.meeting_queries import employee_meetings_query, find_conflicts, set_meeting_status, status_change_error
+from app.utils.meeting_search import apply_search
+from app.utils.participants import add_participants, participant_rows
+from app.utils.meeting_lists import (
+    list_query, managers_for, meeting_item, page_rows, proposed_dates_for, window_bounds, windowed_page
+)
+from app.config import settings
 
 def get_employee_profile(db: Session, employee_id: int) -> Dict[str, Any]:
     """
@@ -53,7 +68,8 @@ def get_employee_profile(db: Session, employee_id: int) -> Dict[str, Any]:
 
 def get_manager_availability(db: Session, manager_id: int, date_param: date, time_param: time) -> dict:
     """
-    Check if a manager is available at a specific date and time
+    Check if a manager is available at a specific date and time, along
+    with the free slots for the rest of that day
 
     Args:
         db: Database session
@@ -62,52 +78,38 @@ def get_manager_availability(db: Session, manager_id: int, date_param: date, tim
         time_param: Time to check availability
 
     Returns:
-        dict: Manager's availability status for the specific date and time
+        dict: Availability status for the slot and the day's free slots
     """
     # Check if manager exists
     manager = db.query(Manager).filter(Manager.id == manager_id).first()
     if not manager:
         raise UserNotFoundException("Manager not found")
 
-    # Round time to nearest 30-minute slot
-    minutes = time_param.minute
-    if minutes < 30:
-        rounded_minutes = 0
-    else:
-        rounded_minutes = 30
-
-    slot_time = datetime.combine(date_param, time(hour=time_param.hour, minute=rounded_minutes))
-    next_slot = slot_time + timedelta(minutes=30)
-
-    # Get meetings that might overlap with this time slot
-    meetings = db.query(Meeting).filter(
-        Meeting.manager_id == manager_id,
-        Meeting.status.in_(["accepted", "pending"]),
-        Meeting.date <= next_slot,
-        Meeting.date + timedelta(minutes=Meeting.duration) >= slot_time
-    ).all()
-
-    # Check if this specific time slot overlaps with any meeting
-    is_available = True
-    for meeting in meetings:
-        meeting_start = meeting.date
-        meeting_end = meeting_start + timedelta(minutes=meeting.duration)
-
-        if (slot_time >= meeting_start and slot_time < meeting_end) or \
-           (next_slot > meeting_start and next_slot <= meeting_end) or \
-           (slot_time <= meeting_start and next_slot >= meeting_end):
-            is_available = False
-            break
-
-    # Return simple availability status
+    # Round time down to the start of its slot
+    slot_minutes = settings.AVAILABILITY_SLOT_MINUTES
+    minutes = (time_param.hour * 60 + time_param.minute) // slot_minutes * slot_minutes
+    slot_time = datetime.combine(date_param, time(hour=minutes // 60, minute=minutes % 60))
+    next_slot = slot_time + timedelta(minutes=slot_minutes)
+
+    # Answered from the cached occupancy bitmap for the day
+    is_available = busy_cache.is_free(db, manager_id, slot_time, next_slot)
+
+    # Also return the day's free slots so clients don't need a call per slot
+    work_start = parse_clock(settings.WORKDAY_START)
+    work_end = parse_clock(settings.WORKDAY_END)
+    free = busy_cache.free_intervals(db, manager_id, datetime.combine(date_param, work_start), datetime.combine(date_param, work_end))
+    available_slots = {
+        slot_start.strftime("%H:%M"): slot_end.strftime("%H:%M")
+        for slot_start, slot_end in split_slots(free, timedelta(minutes=slot_minutes))
+    }
+
     return {
         "date": date_param.isoformat(),
         "time": time_param.strftime("%H:%M"),
         "status": "available" if is_available else "unavailable",
-        "available_slots": {}  # Empty dict to satisfy the response model
+        "available_slots": available_slots
     }
 
-    
 def update_employee_profile(db: Session, employee_id: int, profile_data: EmployeeProfileUpdate) -> Dict[str, Any]:
     """
     Update employee profile
@@ -134,6 +136,8 @@ def update_employee_profile(db: Session, employee_id: int, profile_data: Employe
     
     db.commit()
     db.refresh(employee)
+    # The manager's meeting lists show attendees
+    meeting_list_cache.bump(employee.manager_id)
     
     # Return updated profile
     return get_employee_profile(db, employee_id)
@@ -202,17 +206,24 @@ def post_location(db: Session, employee_id: int, location_data: LocationCreateRe
         "timestamp": new_location.timestamp
     }
 
-def request_meeting(db: Session, employee_id: int, meeting_data: MeetingRequestCreate) -> int:
+def request_meeting(db: Session, employee_id: int, meeting_data: MeetingRequestCreate) -> Dict[str, Any]:
     """
     Request a meeting with the manager and a client
 
+    Each proposed date is checked for conflicts on its own. The request is
+    rejected only if every date conflicts; otherwise conflicting dates are
+    kept as options (ranked last when the manager picks one) and reported.
+
     Args:
         db: Database session
         employee_id: ID of the employee
         meeting_data: Meeting request data
 
     Returns:
-        int: ID of the created meeting
+        Dict: ID of the created meeting and the IDs of its conflicting proposed dates
+
+    Raises:
+        MeetingConflictException: If every proposed date conflicts
     """
     employee = db.query(Employee).filter(Employee.id == employee_id).first()
     if not employee:
@@ -223,6 +234,21 @@ def request_meeting(db: Session, employee_id: int, meeting_data: MeetingRequestC
     if not manager:
         raise UserNotFoundException("Manager not found")
 
+    # At least one proposed date must be free for the manager and the employee
+    conflicts_by_date = {}
+    if not meeting_data.allow_conflicts:
+        for date_obj in meeting_data.proposed_dates:
+            conflicts = find_conflicts(
+                db, employee.manager_id, [(date_obj, meeting_end(date_obj, meeting_data.duration))], [employee_id]
+            )
+            if conflicts["meeting_ids"]:
+                conflicts_by_date[date_obj] = conflicts
+        if len(conflicts_by_date) == len(meeting_data.proposed_dates):
+            raise MeetingConflictException(
+                sorted({meeting_id for conflicts in conflicts_by_date.values() for meeting_id in conflicts["meeting_ids"]}),
+                sorted({busy_id for conflicts in conflicts_by_date.values() for busy_id in conflicts["employee_ids"]})
+            )
+
     # Create new meeting with client info
     new_meeting = Meeting(
         title=meeting_data.title,
@@ -239,10 +265,10 @@ def request_meeting(db: Session, employee_id: int, meeting_data: MeetingRequestC
     )
 
     db.add(new_meeting)
-    db.commit()
-    db.refresh(new_meeting)
+    db.flush()
 
     # Add proposed dates
+    conflicting_options = []
     for date_obj in meeting_data.proposed_dates:
         proposed_date = ProposedDate(
             meeting_id=new_meeting.id,
@@ -252,114 +278,118 @@ def request_meeting(db: Session, employee_id: int, meeting_data: MeetingRequestC
             status="pending"  # Use string instead of enum
         )
         db.add(proposed_date)
+        if date_obj in conflicts_by_date:
+            conflicting_options.append(proposed_date)
+    db.flush()
+    conflicting_ids = [option.id for option in conflicting_options]
+
+    add_participants(db, participant_rows(
+        new_meeting.id, manager.id, min(meeting_data.proposed_dates), requester_id=employee_id
+    ))
+
+    # Queue notification to manager with all proposed dates
+    send_meeting_notification(
+        db,
+        manager.email,                # email
+        meeting_data.title,           # meeting_title
+        meeting_data.proposed_dates,  # meeting_date (list of proposed dates)
+        meeting_data.location,        # meeting_location
+        f"{employee.name}",           # created_by
+        True,                         # is_request
+        meeting_id=new_meeting.id
+    )
 
+    bump_calendar_versions(db, [(UserType.MANAGER.value, manager.id), (UserType.EMPLOYEE.value, employee_id)])
     db.commit()
+    busy_cache.apply_meeting(new_meeting)
+    reminder_scheduler.apply_meeting(new_meeting)
+    meeting_list_cache.bump(new_meeting.manager_id)
 
-    # Since we need to pass a single datetime to send_meeting_notification,
-    # use the first proposed date for the notification
-    if meeting_data.proposed_dates and len(meeting_data.proposed_dates) > 0:
-        first_date = meeting_data.proposed_dates[0]
-        
-        # Send notification to manager
-        send_meeting_notification(
-            manager.email,                # email
-            meeting_data.title,           # meeting_title
-            first_date,                   # meeting_date (using first proposed date)
-            meeting_data.location,        # meeting_location
-            f"{employee.name}",           # created_by
-            True                          # is_request
-        )
-    
-    return new_meeting.id
+    return {
+        "meeting_id": new_meeting.id,
+        "conflicting_proposed_date_ids": conflicting_ids
+    }
 
-def get_employee_meetings(db: Session, employee_id: int, page: int = 1, limit: int = 10, status: Optional[str] = None) -> Dict[str, Any]:
+def get_employee_meetings(
+    db: Session,
+    employee_id: int,
+    page: int = 1,
+    limit: int = 10,
+    status: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    search: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Get meetings for an employee
 
+    With both `date_from` and `date_to` (and no search), recurring meetings
+    are listed as their occurrences inside the window, as in the manager list.
+
     Args:
         db: Database session
         employee_id: ID of the employee
         page: Page number
         limit: Items per page
         status: Filter by meeting status
+        date_from: Only meetings on or after this date
+        date_to: Only meetings on or before this date
+        search: Search string, ranks matches by relevance
 
     Returns:
         Dict: Meetings with pagination info
     """
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
-    if not employee:
+    if not db.query(Employee.id).filter(Employee.id == employee_id).first():
         raise NotFoundException("Employee not found")
 
     # Base query for meetings where employee is involved
-    query = db.query(Meeting).filter(
-        or_(
-            and_(
-                Meeting.created_by_id == employee_id,
-                Meeting.created_by_type == "employee"
-            ),
-            Meeting.employees.any(id=employee_id)
-        )
-    )
+    query = employee_meetings_query(db, employee_id, list_query(db))
 
     # Apply status filter if provided
     if status:
         query = query.filter(Meeting.status == status)
 
-    # Get total count
-    total = query.count()
-
-    # Get paginated results
-    meetings = query.order_by(Meeting.created_at.desc()).offset((page - 1) * limit).limit(limit).all()
+    if search:
+        query = apply_search(db, query, search)
+
+    # Dates are filtered and sorted on the participant row, so a page is a
+    # range scan of ix_meeting_participants_user_date
+    order_by = (MeetingParticipant.date.desc(), MeetingParticipant.meeting_id.desc())
+    if date_from is not None and date_to is not None and not search:
+        # Recurring meetings are listed as their occurrences in the window
+        window_start, window_end = window_bounds(date_from, date_to)
+        total, entries = windowed_page(
+            db,
+            query.filter(
+                Meeting.recurrence_rule.is_(None),
+                MeetingParticipant.date >= window_start,
+                MeetingParticipant.date < window_end
+            ),
+            query.filter(Meeting.recurrence_rule.isnot(None)),
+            window_start, window_end, page, limit,
+            *order_by
+        )
+    else:
+        if date_from:
+            query = query.filter(MeetingParticipant.date >= date_from)
+        if date_to:
+            query = query.filter(MeetingParticipant.date <= date_to)
+        total, rows = page_rows(query, page, limit, *order_by)
+        entries = [(row, row.date) for row in rows]
+
+    # Managers and proposed dates for the whole page, one query each
+    managers = managers_for(db, [row.manager_id for row, _ in entries])
+    proposed = proposed_dates_for(db, [
+        row.id for row, _ in entries
+        if row.created_by_type == "employee" and row.created_by_id == employee_id
+    ])
 
-    # Format response
     meeting_list = []
-    for meeting in meetings:
-        # Get manager details
-        manager = db.query(Manager).filter(Manager.id == meeting.manager_id).first()
-
-        # Get proposed dates if this is an employee-created meeting
-        proposed_dates = []
-        if meeting.created_by_type == "employee" and meeting.created_by_id == employee_id:
-            date_records = db.query(ProposedDate).filter(ProposedDate.meeting_id == meeting.id).all()
-            proposed_dates = [
-                {
-                    "date": date.date,
-                    "is_selected": date.is_selected
-                }
-                for date in date_records
-            ]
-
-        # Include client information
-        client_info = {
-            "name": meeting.client_name,
-            "email": meeting.client_email,
-            "phone": meeting.client_phone
-        }
-
-        meeting_dict = {
-            "id": meeting.id,
-            "title": meeting.title,
-            "description": meeting.description,
-            "date": meeting.date,
-            "duration": meeting.duration,
-            "location": meeting.location,
-            "status": meeting.status,
-            "rejection_reason": meeting.rejection_reason,
-            "created_by_type": meeting.created_by_type,
-            "created_at": meeting.created_at,
-            "client_info": client_info,
-            "manager": {
-                "id": manager.id,
-                "name": manager.name,
-                "email": manager.email,
-                "company_name": manager.company_name,
-                "profile_picture": manager.profile_picture
-            }
-        }
-
-        if proposed_dates:
-            meeting_dict["proposed_dates"] = proposed_dates
-
+    for row, occurrence_date in entries:
+        meeting_dict = meeting_item(row, occurrence_date)
+        meeting_dict["manager"] = managers.get(row.manager_id)
+        if proposed.get(row.id):
+            meeting_dict["proposed_dates"] = proposed[row.id]
         meeting_list.append(meeting_dict)
 
     return {
@@ -370,31 +400,60 @@ def get_employee_meetings(db: Session, employee_id: int, page: int = 1, limit: i
     }
 
 
-def cancel_meeting(db: Session, employee_id: int, meeting_id: int) -> None:
+def cancel_meeting(
+    db: Session,
+    employee_id: int,
+    meeting_id: int,
+    expected_versions: Optional[List[int]] = None
+) -> Dict[str, Any]:
     """
     Cancel a meeting requested by the employee
-    
+
+    Only pending requests can be cancelled; the check and the change are
+    one compare-and-set UPDATE (see set_meeting_status).
+
     Args:
         db: Database session
         employee_id: ID of the employee
         meeting_id: ID of the meeting
+        expected_versions: Versions accepted by the request's If-Match header
+
+    Returns:
+        Dict: The meeting's ID, status and new version
     """
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-    if not meeting:
-        raise NotFoundException("Meeting not found")
-    
-    # Check if employee is the creator of the meeting
-    if meeting.created_by_id != employee_id or meeting.created_by_type != "employee":
-        raise PermissionDeniedException("You can only cancel meetings you created")
-    
-    # Check if meeting can be cancelled
-    if meeting.status != MeetingStatus.PENDING:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot cancel meeting with status: {meeting.status}"
-        )
-    
-    # Update meeting status
-    meeting.status = MeetingStatus.CANCELLED
-    meeting.updated_at = datetime.utcnow()
-    db.commit()
\ No newline at end of file
+    meeting = set_meeting_status(
+        db, meeting_id, MeetingStatus.CANCELLED.value,
+        Meeting.created_by_id == employee_id,
+        Meeting.created_by_type == UserType.EMPLOYEE.value,
+        Meeting.status == MeetingStatus.PENDING.value,
+        expected_versions=expected_versions,
+        updated_at=datetime.utcnow()
+    )
+    if meeting is None:
+        # End the transaction the UPDATE opened before finding out why it matched nothing
+        db.rollback()
+        current = db.query(
+            Meeting.created_by_id, Meeting.created_by_type, Meeting.status, Meeting.version
+        ).filter(Meeting.id == meeting_id).first()
+        if not current:
+            raise NotFoundException("Meeting")
+
+        # Check if employee is the creator of the meeting
+        if current.created_by_id != employee_id or current.created_by_type != UserType.EMPLOYEE.value:
+            raise PermissionDeniedException("You can only cancel meetings you created")
+
+        # Check if meeting can be cancelled
+        if current.status != MeetingStatus.PENDING.value:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot cancel meeting with status: {current.status}"
+            )
+        raise status_change_error(meeting_id, current.status, current.version, MeetingStatus.CANCELLED.value, expected_versions)
+
+    bump_calendar_versions(db, meeting_calendar_owners(db, meeting))
+    db.commit()
+    busy_cache.apply_meeting(meeting)
+    reminder_scheduler.apply_meeting(meeting)
+    meeting_list_cache.bump(meeting.manager_id)
+
+    return {"id": meeting.id, "status": meeting.status, "version": meeting.version}
@@ -1,26 +1,57 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, insert, update, case, exists
 from typing import Dict, List, Any, Optional
 from datetime import datetime, date, timedelta  # Add date here
 
-from app.database import Manager, Employee, Meeting, Location, MeetingStatus, EmployeeMeeting, ProposedDate
+from app.database import (
+    Manager, Employee, Meeting, MeetingException, Location, MeetingStatus, EmployeeMeeting, ProposedDate,
+    UserType, meeting_end
+)
 from app.schemas.manager import (
-    ManagerProfileUpdate, MeetingCreateRequest, MeetingStatusUpdateRequest
+    ManagerProfileUpdate, MeetingCreateRequest, MeetingStatusUpdateRequest,
+    MeetingStatusBatchItem, OccurrenceUpdateRequest, ScheduleAssignment
 )
 
-from app.schemas.employee import MeetingRequestCreate
 from app.utils.validators import MeetingStatusTransitionValidator
-from app.exceptions import UserNotFoundException, PermissionDeniedException
+from app.exceptions import (
+    UserNotFoundException, PermissionDeniedException, ValidationException, MeetingImportException,
+    MeetingConflictException
+)
 from app.utils.email import (
-    send_meeting_notification, send_meeting_status_update, send_employee_verification_email
+    send_meeting_notification, send_meeting_status_update, send_employee_verification_email,
+    send_scheduled_meetings_digest
+)
+from app.utils.security import generate_verification_token, hash_token
+from app.config import settings
+from app.utils.revocation import revocation_list
+from app.utils.fanout import attendees_by_meeting, meeting_recipients, status_update_recipients
+from app.utils.meeting_queries import (
+    SERIES_COLUMNS, ensure_no_conflicts, expand_series, manager_meetings_query,
+    overlapping_meetings, overlapping_series, set_meeting_status, status_change_error
 )
-from app.utils.security import generate_verification_token
+from app.utils.intervals import IntervalSet, sweep
+from app.utils.schedule_optimizer import plan_assignments
+from app.utils.busy_cache import busy_cache
+from app.utils.response_cache import meeting_list_cache
+from app.utils.reminders import reminder_scheduler
+from app.utils.recurrence import RecurrenceRule, Series
+from app.utils.meeting_import import parse_meeting_import, validate_meeting_import
+from app.utils.meeting_search import apply_search
+from app.utils.proposed_dates import is_open as is_open_proposed_date
+from app.utils.participants import add_participants, participant_rows, remove_participant, set_participant_date
+from app.utils.meeting_lists import attendees_for, list_query, meeting_item, page_rows, window_bounds, windowed_page
+from app.utils.calendar_feed import bump_calendar_versions, meeting_calendar_owners
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+# How much free time around a proposed date is worth distinguishing when ranking
+RANKING_SLACK_MINUTES = 120
+
 def get_manager_profile(db: Session, manager_id: int) -> Dict[str, Any]:
     """
     Get manager profile
@@ -75,6 +106,8 @@ def update_manager_profile(db: Session, manager_id: int, profile_data: ManagerPr
     
     db.commit()
     db.refresh(manager)
+    # Employees' meeting lists show the manager
+    meeting_list_cache.bump(manager_id)
     
     # Return updated profile
     return get_manager_profile(db, manager_id)
@@ -223,152 +256,308 @@ def get_employee_locations(db: Session, manager_id: int, hours: int = 24) -> Lis
 
     return location_list
 
-def create_meeting(db: Session, manager_id: int, meeting_data: MeetingCreateRequest) -> int:
+def delete_meeting(
+    db: Session,
+    manager_id: int,
+    meeting_id: int,
+    expected_versions: Optional[List[int]] = None
+) -> Dict[str, Any]:
     """
-    Create a new meeting by a manager with a client (directly accepted)
+    Delete/cancel a meeting
+
+    Soft delete: the meeting is marked cancelled with one compare-and-set
+    UPDATE (see set_meeting_status).
 
     Args:
         db: Database session
         manager_id: ID of the manager
-        meeting_data: Meeting creation data
+        meeting_id: ID of the meeting
+        expected_versions: Versions accepted by the request's If-Match header
 
     Returns:
-        int: ID of the created meeting
+        Dict: The meeting's ID, status and new version
     """
-    # Create the meeting with client info
-    new_meeting = Meeting(
-        title=meeting_data.title,
-        description=meeting_data.description,
-        date=meeting_data.date,
-        duration=meeting_data.duration,
-        location=meeting_data.location,
-        status=MeetingStatus.ACCEPTED,  # Directly accepted for manager-created meetings
-        created_by_id=manager_id,
-        created_by_type="manager",
-        manager_id=manager_id,
-        client_name=meeting_data.client_info.name,
-        client_email=meeting_data.client_info.email,
-        client_phone=meeting_data.client_info.phone
+    meeting = set_meeting_status(
+        db, meeting_id, MeetingStatus.CANCELLED.value,
+        Meeting.manager_id == manager_id,
+        expected_versions=expected_versions,
+        updated_at=datetime.utcnow()
     )
+    if meeting is None:
+        # End the transaction the UPDATE opened before finding out why it matched nothing
+        db.rollback()
+        current = db.query(Meeting.manager_id, Meeting.status, Meeting.version).filter(Meeting.id == meeting_id).first()
+        if not current:
+            raise UserNotFoundException("Meeting")
+        # Check if the manager is authorized to delete the meeting
+        if current.manager_id != manager_id:
+            raise PermissionDeniedException("You are not authorized to delete this meeting")
+        raise status_change_error(meeting_id, current.status, current.version, MeetingStatus.CANCELLED.value, expected_versions)
+
+    # Notify the requester and attendees about the cancellation (queued with the change)
+    for email in status_update_recipients(db, [meeting])[meeting.id].values():
+        send_meeting_status_update(
+            db,
+            email,
+            meeting.title,
+            meeting.date,
+            "cancelled",
+            meeting_id=meeting.id
+        )
 
-    db.add(new_meeting)
-    db.commit()
-    db.refresh(new_meeting)
-
-    # Add employees to the meeting if specified
-    if meeting_data.employee_ids:
-        employees = db.query(Employee).filter(
-            and_(
-                Employee.id.in_(meeting_data.employee_ids),
-                Employee.manager_id == manager_id
-            )
-        ).all()
-
-        if len(employees) != len(meeting_data.employee_ids):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="One or more employees do not belong to this manager"
-            )
-
-        for employee in employees:
-            new_meeting.employees.append(employee)
-
-            # Notify employees about the meeting
-            send_meeting_notification(
-                employee.email,
-                employee.name,
-                new_meeting.title,
-                new_meeting.date,
-                new_meeting.location
-            )
-
+    bump_calendar_versions(db, meeting_calendar_owners(db, meeting))
     db.commit()
+    busy_cache.apply_meeting(meeting)
+    reminder_scheduler.apply_meeting(meeting)
+    meeting_list_cache.bump(meeting.manager_id)
 
-    return new_meeting.id
+    return {"id": meeting.id, "status": meeting.status, "version": meeting.version}
 
-def delete_meeting(db: Session, manager_id: int, meeting_id: int) -> None:
+def update_occurrence(
+    db: Session,
+    manager_id: int,
+    meeting_id: int,
+    occurrence_data: OccurrenceUpdateRequest
+) -> Dict[str, Any]:
     """
-    Delete/cancel a meeting
-    
+    Cancel or move one occurrence of a recurring meeting
+
     Args:
         db: Database session
         manager_id: ID of the manager
-        meeting_id: ID of the meeting
+        meeting_id: ID of the recurring meeting
+        occurrence_data: The occurrence and its change
+
+    Returns:
+        Dict: The stored exception
     """
     meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
     if not meeting:
         raise UserNotFoundException("Meeting not found")
-    
-    # Check if the manager is authorized to delete the meeting
+
     if meeting.manager_id != manager_id:
-        raise PermissionDeniedException("You are not authorized to delete this meeting")
-    
-    # Option 1: Hard delete - completely remove the meeting
-    # db.delete(meeting)
-    
-    # Option 2: Soft delete - just mark as cancelled (recommended)
-    meeting.status = "cancelled"
-    meeting.updated_at = datetime.utcnow()
-    
-    db.commit()
-    
-    # Notify employees about the cancellation
-    for employee in meeting.employees:
-        send_meeting_status_update(
-            employee.email,
-            employee.name,
-            meeting.title,
-            "cancelled"
+        raise PermissionDeniedException("You are not authorized to update this meeting")
+
+    if not meeting.recurrence_rule:
+        raise ValidationException("Meeting is not recurring")
+
+    original_start = occurrence_data.original_start.replace(tzinfo=meeting.date.tzinfo)
+    if not Series.from_meeting(meeting).occurs_at(original_start):
+        raise ValidationException("The series has no occurrence at original_start")
+
+    if occurrence_data.new_date and not occurrence_data.allow_conflicts:
+        duration = occurrence_data.new_duration or meeting.duration
+        ensure_no_conflicts(
+            db,
+            manager_id,
+            [(occurrence_data.new_date, meeting_end(occurrence_data.new_date, duration))],
+            [emp_meeting.employee_id for emp_meeting in meeting.employees],
+            exclude_meeting_id=meeting.id
         )
 
+    exception = db.query(MeetingException).filter(
+        MeetingException.meeting_id == meeting.id,
+        MeetingException.original_start == original_start
+    ).first()
+    if not exception:
+        exception = MeetingException(meeting_id=meeting.id, original_start=original_start)
+        db.add(exception)
+    exception.is_cancelled = occurrence_data.cancel
+    exception.new_date = occurrence_data.new_date
+    exception.new_duration = occurrence_data.new_duration
+
+    # Notify attendees about the changed occurrence (queued with the change)
+    for email in meeting_recipients(db, meeting.id):
+        if occurrence_data.cancel:
+            send_meeting_status_update(db, email, meeting.title, original_start, "cancelled", meeting_id=meeting.id)
+        else:
+            send_meeting_status_update(
+                db,
+                email,
+                meeting.title,
+                occurrence_data.new_date,
+                "rescheduled",
+                reason=f"Moved from {original_start:%Y-%m-%d %H:%M}",
+                meeting_id=meeting.id
+            )
+
+    bump_calendar_versions(db, meeting_calendar_owners(db, meeting))
+    db.commit()
+    busy_cache.invalidate(meeting.manager_id)
+    meeting_list_cache.bump(meeting.manager_id)
+
+    return {
+        "meeting_id": meeting.id,
+        "original_start": exception.original_start,
+        "cancelled": exception.is_cancelled,
+        "new_date": exception.new_date,
+        "new_duration": exception.new_duration
+    }
+
 def update_meeting_status(
     db: Session,
     manager_id: int,
     meeting_id: int,
-    status_data: MeetingStatusUpdateRequest
-) -> None:
+    status_data: MeetingStatusUpdateRequest,
+    expected_versions: Optional[List[int]] = None
+) -> Dict[str, Any]:
     """
     Update the status of a meeting
 
+    The transition is checked and applied by one compare-and-set UPDATE
+    (see set_meeting_status); the meeting is only read again to explain a
+    refusal.
+
     Args:
         db: Database session
         manager_id: ID of the manager
         meeting_id: ID of the meeting
         status_data: Status update data
+        expected_versions: Versions accepted by the request's If-Match header
+
+    Returns:
+        Dict: The meeting's ID, status and new version
     """
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-    if not meeting:
-        raise UserNotFoundException("Meeting not found")
+    meeting = set_meeting_status(
+        db, meeting_id, status_data.status,  # Already lowercase from validator
+        Meeting.manager_id == manager_id,
+        expected_versions=expected_versions,
+        rejection_reason=status_data.reason if status_data.status == "rejected" else None,
+        updated_at=datetime.utcnow()
+    )
+    if meeting is None:
+        # End the transaction the UPDATE opened before finding out why it matched nothing
+        db.rollback()
+        current = db.query(Meeting.manager_id, Meeting.status, Meeting.version).filter(Meeting.id == meeting_id).first()
+        if not current:
+            raise UserNotFoundException("Meeting")
+        # Check if the manager is authorized to update the meeting
+        if current.manager_id != manager_id:
+            raise PermissionDeniedException("You are not authorized to update this meeting")
+        raise status_change_error(meeting_id, current.status, current.version, status_data.status, expected_versions)
+
+    # Notify the requester and attendees about the status update (queued with the change)
+    for email in status_update_recipients(db, [meeting])[meeting.id].values():
+        send_meeting_status_update(
+            db,
+            email,
+            meeting.title,
+            meeting.date,
+            meeting.status,
+            meeting.rejection_reason,
+            meeting_id=meeting.id
+        )
 
-    # Check if the manager is authorized to update the meeting
-    if meeting.created_by_id != manager_id or meeting.created_by_type != "manager":
-        raise PermissionDeniedException("You are not authorized to update this meeting")
+    bump_calendar_versions(db, meeting_calendar_owners(db, meeting))
+    db.commit()
+    busy_cache.apply_meeting(meeting)
+    reminder_scheduler.apply_meeting(meeting)
+    meeting_list_cache.bump(meeting.manager_id)
 
-    # Validate status transition
-    try:
-        MeetingStatusTransitionValidator.validate(meeting.status, status_data.status)
-    except ValueError as e:
-        raise InvalidStatusTransitionException(str(e))
+    return {"id": meeting.id, "status": meeting.status, "version": meeting.version}
 
-    # Update the meeting status (ensure lowercase)
-    meeting.status = status_data.status  # Already lowercase from validator
-    meeting.rejection_reason = status_data.reason if status_data.status == "rejected" else None
-    meeting.updated_at = datetime.utcnow()
-    db.commit()
+def update_meeting_statuses(
+    db: Session,
+    manager_id: int,
+    updates: List[MeetingStatusBatchItem]
+) -> Dict[str, Any]:
+    """
+    Apply many status changes at once
 
-    # Notify employees about the status update
-    for employee in meeting.employees:
-        send_meeting_status_update(
-            employee.email,
-            employee.name,
-            meeting.title,
-            meeting.status,
-            meeting.rejection_reason
+    Current statuses are read in one query and checked against
+    MeetingStatusTransitionValidator, then each target status is applied
+    with one conditional UPDATE whose guard repeats the allowed source
+    statuses, so a meeting changed concurrently is reported rather than
+    overwritten. Notifications are queued in the outbox with the change.
+
+    Args:
+        db: Database session
+        manager_id: ID of the manager
+        updates: Meeting IDs with their new status and reason
+
+    Returns:
+        Dict: Per-item results in request order and the number updated
+    """
+    current = {
+        row.id: row.status for row in db.query(Meeting.id, Meeting.status).filter(
+            Meeting.id.in_({item.id for item in updates}),
+            Meeting.manager_id == manager_id
         )
+    }
+
+    counts = Counter(item.id for item in updates)
+    results = [{"id": item.id, "status": item.status, "updated": False, "error": None} for item in updates]
+    by_status: Dict[str, List[tuple]] = defaultdict(list)
+    for index, item in enumerate(updates):
+        if counts[item.id] > 1:
+            results[index]["error"] = "Meeting listed more than once"
+        elif item.id not in current:
+            results[index]["error"] = "Meeting not found"
+        else:
+            try:
+                MeetingStatusTransitionValidator.validate(current[item.id], item.status)
+                by_status[item.status].append((index, item))
+            except ValueError as e:
+                results[index]["error"] = str(e)
+
+    changed = []
+    now = datetime.utcnow()
+    for new_status, entries in by_status.items():
+        reasons = {item.id: item.reason for _, item in entries if item.reason} if new_status == "rejected" else {}
+        rows = db.execute(
+            update(Meeting)
+            .where(
+                Meeting.id.in_([item.id for _, item in entries]),
+                Meeting.manager_id == manager_id,
+                Meeting.status.in_(MeetingStatusTransitionValidator.sources_for(new_status))
+            )
+            .values(
+                status=new_status,
+                rejection_reason=case(reasons, value=Meeting.id, else_=None) if reasons else None,
+                updated_at=now,
+                version=Meeting.version + 1
+            )
+            .returning(
+                Meeting.id, Meeting.title, Meeting.date, Meeting.status, Meeting.rejection_reason,
+                Meeting.created_by_type, Meeting.created_by_id, Meeting.recurrence_rule
+            )
+            .execution_options(synchronize_session=False)
+        ).all()
+        updated_ids = {row.id for row in rows}
+        for index, item in entries:
+            if item.id in updated_ids:
+                results[index]["updated"] = True
+            else:
+                # The guard skipped it: its status changed since it was read
+                results[index]["error"] = "Meeting status changed concurrently"
+        changed.extend(rows)
+
+    recipients = status_update_recipients(db, changed)
+    owners = {(UserType.MANAGER.value, manager_id)}
+    for row in changed:
+        # Notify the requester and attendees (queued with the change, merged into digests)
+        for employee_id, email in recipients[row.id].items():
+            owners.add((UserType.EMPLOYEE.value, employee_id))
+            send_meeting_status_update(
+                db,
+                email,
+                row.title,
+                row.date,
+                row.status,
+                row.rejection_reason,
+                meeting_id=row.id
+            )
 
-from app.utils.email import send_employee_verification_email
-from app.utils.security import generate_verification_token
-from datetime import datetime, timedelta
+    if changed:
+        bump_calendar_versions(db, sorted(owners))
+    db.commit()
+    if changed:
+        busy_cache.invalidate(manager_id)
+        meeting_list_cache.bump(manager_id)
+    for row in changed:
+        reminder_scheduler.apply(row.id, row.date, row.status, recurring=bool(row.recurrence_rule))
+
+    return {"results": results, "updated": len(changed)}
 
 def add_employee(db: Session, manager_id: int, employee_data):
     """
@@ -392,9 +581,9 @@ def add_employee(db: Session, manager_id: int, employee_data):
 
     # Generate verification token
     verification_token = generate_verification_token()
-    token_expiry = datetime.utcnow() + timedelta(days=7)
+    token_expiry = datetime.utcnow() + timedelta(days=settings.VERIFICATION_TOKEN_EXPIRE_DAYS)
 
-    logger.info(f"Generated verification token: {verification_token[:10]}... (expires: {token_expiry})")
+    logger.info(f"Generated verification token (expires: {token_expiry})")
 
     # Create a new employee
     try:
@@ -404,34 +593,26 @@ def add_employee(db: Session, manager_id: int, employee_data):
             role=employee_data.role if hasattr(employee_data, 'role') else None,
             department=employee_data.department if hasattr(employee_data, 'department') else None,
             manager_id=manager_id,
-            verification_token=verification_token,
+            verification_token_hash=hash_token(verification_token),
             token_expiry=token_expiry,
             is_verified=False
         )
 
         logger.info("Adding employee to database")
         db.add(new_employee)
+
+        # Queue the invitation email in the same transaction as the employee
+        send_employee_verification_email(
+            db,
+            email=employee_data.email,
+            manager_name=manager.name,
+            company_name=manager.company_name,
+            verification_token=verification_token
+        )
+
         db.commit()
         db.refresh(new_employee)
-        logger.info(f"Employee added with ID: {new_employee.id}")
-
-        # Send invitation email
-        logger.info("Attempting to send verification email")
-        try:
-            email_sent = send_employee_verification_email(
-                email=employee_data.email,
-                manager_name=manager.name,
-                company_name=manager.company_name,
-                verification_token=verification_token
-            )
-
-            if email_sent:
-                logger.info(f"Verification email sent successfully to {employee_data.email}")
-            else:
-                logger.warning(f"Failed to send verification email to {employee_data.email}")
-        except Exception as e:
-            logger.error(f"Error sending verification email: {str(e)}")
-            # Continue even if email fails - we've already created the employee
+        logger.info(f"Employee added with ID: {new_employee.id}, invitation queued")
 
         return new_employee.id
     except Exception as e:
@@ -507,9 +688,12 @@ def delete_employee(employee_id: int, manager_id: int, db: Session):
             detail="Employee not found or doesn't belong to this manager"
         )
     
-    # Delete the employee
+    # Delete the employee and sign them out everywhere
     db.delete(employee)
+    remove_participant(db, UserType.EMPLOYEE.value, employee_id)
+    revocation_list.revoke_subject(db, UserType.EMPLOYEE.value, employee_id)
     db.commit()
+    meeting_list_cache.bump(manager_id)
     
     return True
 
@@ -519,29 +703,422 @@ def select_meeting_date(
     manager_id: int,
     meeting_id: int,
     selected_date: datetime
-) -> None:
+) -> Dict[str, Any]:
     """
     Select a date for a meeting from proposed dates
+
+    The meeting is updated with one conditional UPDATE whose guard requires
+    the date to be an open (unexpired) proposed date of a request that has
+    not been rejected or cancelled, so a concurrent change or an expired
+    date is refused rather than overwritten.
+
+    Args:
+        db: Database session
+        manager_id: ID of the manager
+        meeting_id: ID of the meeting
+        selected_date: One of the meeting's proposed dates
+
+    Returns:
+        Dict: The meeting's ID and new date
     """
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    meeting = db.query(Meeting.manager_id, Meeting.duration).filter(Meeting.id == meeting_id).first()
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
-
     if meeting.manager_id != manager_id:
         raise HTTPException(status_code=403, detail="You are not authorized to update this meeting")
-    
-    proposed_dates = db.query(ProposedDate).filter(ProposedDate.meeting_id == meeting_id).all()
-    if not any(date.date == selected_date for date in proposed_dates):
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Selected date is not in the proposed dates")
 
-    meeting.date = selected_date
-    for date in proposed_dates:
-        date.is_selected = (date.date == selected_date)
+    now = datetime.utcnow()
+    row = db.execute(
+        update(Meeting)
+        .where(
+            Meeting.id == meeting_id,
+            Meeting.status.in_([MeetingStatus.PENDING.value, MeetingStatus.ACCEPTED.value]),
+            Meeting.recurrence_rule.is_(None),
+            exists().where(
+                ProposedDate.meeting_id == meeting_id,
+                ProposedDate.date == selected_date,
+                is_open_proposed_date(now)
+            )
+        )
+        .values(
+            date=selected_date,
+            # Core UPDATEs skip the ORM hook that keeps ends_at in sync
+            ends_at=meeting_end(selected_date, meeting.duration),
+            reminder_sent_at=None,
+            updated_at=now,
+            version=Meeting.version + 1
+        )
+        .returning(
+            Meeting.id, Meeting.title, Meeting.location, Meeting.status,
+            Meeting.manager_id, Meeting.created_by_type, Meeting.created_by_id, Meeting.version
+        )
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Selected date is not an open proposed date of a pending or accepted meeting"
+        )
+
+    db.execute(
+        update(ProposedDate)
+        .where(ProposedDate.meeting_id == meeting_id)
+        .values(is_selected=(ProposedDate.date == selected_date))
+        .execution_options(synchronize_session=False)
+    )
+    set_participant_date(db, meeting_id, selected_date)
+
+    manager = db.query(Manager.name).filter(Manager.id == manager_id).first()
+    for email in meeting_recipients(db, meeting_id):
+        send_meeting_notification(
+            db,
+            email,
+            row.title,
+            selected_date,
+            row.location,
+            manager.name
+        )
 
+    bump_calendar_versions(db, meeting_calendar_owners(db, row))
     db.commit()
+    busy_cache.apply(row.id, manager_id, selected_date, meeting_end(selected_date, meeting.duration), row.status)
+    reminder_scheduler.apply(row.id, selected_date, row.status)
+    meeting_list_cache.bump(manager_id)
+
+    return {"id": row.id, "date": selected_date, "version": row.version}
+
+def rank_proposed_dates(db: Session, manager_id: int, meeting_id: int) -> Dict[str, Any]:
+    """
+    Rank a pending meeting's proposed dates by who is free
 
-    for employee in meeting.employees:
-        send_meeting_notification(employee.email, employee.name, meeting.title, selected_date)
+    Busy time for the manager and every attendee is loaded in one query
+    and swept once; each proposed date is scored by the participants it
+    conflicts with, then by the free time (slack) around it.
+
+    Args:
+        db: Database session
+        manager_id: ID of the manager
+        meeting_id: ID of the meeting
+
+    Returns:
+        Dict: Proposed dates, best first
+    """
+    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    if not meeting:
+        raise UserNotFoundException("Meeting")
+    if meeting.manager_id != manager_id:
+        raise PermissionDeniedException("You are not authorized to view this meeting")
+
+    proposed = db.query(ProposedDate).filter(ProposedDate.meeting_id == meeting_id).order_by(ProposedDate.date).all()
+    if not proposed:
+        return {"meeting_id": meeting_id, "proposed_dates": []}
+
+    attendee_ids = {
+        row.employee_id for row in db.query(EmployeeMeeting.employee_id).filter(EmployeeMeeting.meeting_id == meeting_id)
+    }
+    if meeting.created_by_type == UserType.EMPLOYEE.value:
+        attendee_ids.add(meeting.created_by_id)
+
+    slack_cap = timedelta(minutes=RANKING_SLACK_MINUTES)
+    slots = [(option, option.date, meeting_end(option.date, meeting.duration)) for option in proposed]
+    window_start = slots[0][1] - slack_cap
+    window_end = max(end for _, _, end in slots) + slack_cap
+
+    # Everyone's busy time: employees only attend their manager's meetings
+    def with_attendance(*columns):
+        return db.query(
+            *columns, Meeting.created_by_type, Meeting.created_by_id, EmployeeMeeting.employee_id
+        ).outerjoin(EmployeeMeeting, and_(
+            EmployeeMeeting.meeting_id == Meeting.id,
+            EmployeeMeeting.employee_id.in_(attendee_ids or [-1])
+        )).filter(Meeting.id != meeting_id)
+
+    rows = overlapping_meetings(
+        db, manager_id, window_start, window_end,
+        query=with_attendance(Meeting.id, Meeting.date, Meeting.ends_at)
+    ).all()
+    series_rows = overlapping_series(
+        db, manager_id, window_start, window_end,
+        query=with_attendance(*SERIES_COLUMNS)
+    ).all()
+
+    participants = defaultdict(set)
+    for row in rows + series_rows:
+        participants[row.id].add(("manager", manager_id))
+        if row.employee_id is not None:
+            participants[row.id].add(("employee", row.employee_id))
+        if row.created_by_type == UserType.EMPLOYEE.value and row.created_by_id in attendee_ids:
+            participants[row.id].add(("employee", row.created_by_id))
+
+    occurrences = [(row, row.date, row.ends_at) for row in rows]
+    occurrences += expand_series(db, series_rows, window_start, window_end)
+    busy = {
+        (start, end, (kind, user_id, row.id))
+        for row, start, end in occurrences
+        for kind, user_id in participants[row.id]
+    }
+
+    segments = sweep(busy)
+    starts = [segment[0] for segment in segments]
+    ends = [segment[1] for segment in segments]
+
+    ranked = []
+    for option, start, end in slots:
+        overlapping = segments[bisect_right(ends, start):bisect_left(starts, end)]
+        labels = set().union(*(segment[2] for segment in overlapping)) if overlapping else set()
+        participants = sorted({(kind, user_id) for kind, user_id, _ in labels})
+
+        before = bisect_right(ends, start) - 1
+        slack_before = min(start - max(ends[before], window_start), slack_cap) if before >= 0 else slack_cap
+        after = bisect_left(starts, end)
+        slack_after = min(min(starts[after], window_end) - end, slack_cap) if after < len(starts) else slack_cap
+        if overlapping:
+            slack_before = slack_after = timedelta(0)
+
+        ranked.append({
+            "proposed_date_id": option.id,
+            "date": start,
+            "end": end,
+            "is_selected": bool(option.is_selected),
+            "conflict_count": len(participants),
+            "conflicting_participants": [{"type": kind, "id": user_id} for kind, user_id in participants],
+            "conflicting_meeting_ids": sorted({meeting_ref for _, _, meeting_ref in labels}),
+            "slack_before_minutes": int(slack_before.total_seconds() // 60),
+            "slack_after_minutes": int(slack_after.total_seconds() // 60)
+        })
+
+    ranked.sort(key=lambda item: (
+        item["conflict_count"],
+        -min(item["slack_before_minutes"], item["slack_after_minutes"]),
+        item["date"]
+    ))
+    for rank, item in enumerate(ranked, start=1):
+        item["rank"] = rank
+
+    return {"meeting_id": meeting_id, "proposed_dates": ranked}
+
+def _busy_intervals(db: Session, manager_id: int, start: datetime, end: datetime) -> IntervalSet:
+    """A manager's busy time in [start, end), one-off meetings and series occurrences"""
+    rows = overlapping_meetings(db, manager_id, start, end, query=db.query(Meeting.date, Meeting.ends_at)).all()
+    series_rows = overlapping_series(db, manager_id, start, end, query=db.query(*SERIES_COLUMNS)).all()
+    return IntervalSet(
+        [(row.date, row.ends_at) for row in rows]
+        + [(occurrence_start, occurrence_end) for _, occurrence_start, occurrence_end in expand_series(db, series_rows, start, end)]
+    )
+
+def _pending_requests(db: Session, manager_id: int, meeting_ids: Optional[List[int]] = None) -> List[Any]:
+    """Pending requests still waiting for a date, oldest first"""
+    query = db.query(Meeting.id, Meeting.title, Meeting.duration).filter(
+        Meeting.manager_id == manager_id,
+        Meeting.status == MeetingStatus.PENDING.value,
+        Meeting.date.is_(None),
+        Meeting.recurrence_rule.is_(None)
+    )
+    if meeting_ids is not None:
+        query = query.filter(Meeting.id.in_(meeting_ids))
+    return query.order_by(Meeting.created_at, Meeting.id).limit(settings.SCHEDULE_PLAN_MAX_REQUESTS).all()
+
+def _request_options(db: Session, requests: List[Any]) -> Dict[int, List[tuple]]:
+    """Future proposed dates of each request as (start, end, proposed date ID)"""
+    durations = {row.id: row.duration for row in requests}
+    options: Dict[int, List[tuple]] = {row.id: [] for row in requests}
+    if not requests:
+        return options
+    rows = db.query(ProposedDate.id, ProposedDate.meeting_id, ProposedDate.date).filter(
+        ProposedDate.meeting_id.in_(list(durations)),
+        is_open_proposed_date()
+    ).order_by(ProposedDate.date)
+    for row in rows:
+        options[row.meeting_id].append((row.date, meeting_end(row.date, durations[row.meeting_id]), row.id))
+    return options
+
+def plan_pending_requests(db: Session, manager_id: int) -> Dict[str, Any]:
+    """
+    Propose a date for as many pending requests as possible
+
+    Each request gets at most one of its future proposed dates, none of
+    which overlap each other or the manager's booked meetings (see
+    plan_assignments). Nothing is written; the plan is applied with
+    apply_schedule_plan.
+
+    Args:
+        db: Database session
+        manager_id: ID of the manager
+
+    Returns:
+        Dict: Planned dates in date order and the requests left without one
+    """
+    requests = _pending_requests(db, manager_id)
+    options = _request_options(db, requests)
+
+    all_options = [option for request_options in options.values() for option in request_options]
+    busy = _busy_intervals(
+        db, manager_id, min(option[0] for option in all_options), max(option[1] for option in all_options)
+    ) if all_options else IntervalSet()
+    plan = plan_assignments(options, busy)
+
+    assignments = []
+    unassigned = []
+    for row in requests:
+        if row.id in plan:
+            start, end, proposed_date_id = plan[row.id]
+            assignments.append({
+                "meeting_id": row.id, "title": row.title, "proposed_date_id": proposed_date_id,
+                "date": start, "end": end
+            })
+        elif not options[row.id]:
+            unassigned.append({"meeting_id": row.id, "title": row.title, "reason": "No future proposed dates"})
+        elif all(not busy.is_free(start, end) for start, end, _ in options[row.id]):
+            unassigned.append({
+                "meeting_id": row.id, "title": row.title,
+                "reason": "Every proposed date overlaps a booked meeting"
+            })
+        else:
+            unassigned.append({
+                "meeting_id": row.id, "title": row.title,
+                "reason": "Proposed dates overlap other planned requests"
+            })
+    assignments.sort(key=lambda item: (item["date"], item["meeting_id"]))
+
+    return {"assignments": assignments, "unassigned": unassigned}
+
+def apply_schedule_plan(db: Session, manager_id: int, assignments: List[ScheduleAssignment]) -> Dict[str, Any]:
+    """
+    Set the dates of a plan from plan_pending_requests in one transaction
+
+    The plan is checked again before anything is written, since meetings
+    may have been booked after it was made: every date must still be one
+    of the request's proposed dates and free, and no two may overlap.
+    Attendees are notified as in select_meeting_date.
+
+    Args:
+        db: Database session
+        manager_id: ID of the manager
+        assignments: Meeting IDs with the date chosen for each
+
+    Returns:
+        Dict: Number of meetings updated
+
+    Raises:
+        ValidationException: If a meeting is listed twice, is not a pending
+            request of this manager, or the date was not proposed
+        MeetingConflictException: If a date is no longer free
+        HTTPException: 409 if a meeting changed while the plan was applied
+    """
+    chosen = {item.meeting_id: item.date for item in assignments}
+    if len(chosen) != len(assignments):
+        raise ValidationException("A meeting is listed more than once")
+
+    meetings = {
+        meeting.id: meeting for meeting in db.query(
+            Meeting.id, Meeting.duration, Meeting.version, Meeting.title, Meeting.location
+        ).filter(
+            Meeting.id.in_(list(chosen)),
+            Meeting.manager_id == manager_id,
+            Meeting.status == MeetingStatus.PENDING.value,
+            Meeting.date.is_(None),
+            Meeting.recurrence_rule.is_(None)
+        )
+    }
+    missing = sorted(set(chosen) - set(meetings))
+    if missing:
+        raise ValidationException(f"Not pending requests awaiting a date: {', '.join(map(str, missing))}")
+
+    # Matched in SQL, like select_meeting_date: the stored dates may be
+    # timezone-aware while the chosen ones are naive
+    now = datetime.utcnow()
+    offered = {
+        row.meeting_id for row in db.query(ProposedDate.meeting_id).filter(
+            or_(*(
+                and_(ProposedDate.meeting_id == meeting_id, ProposedDate.date == selected)
+                for meeting_id, selected in chosen.items()
+            )),
+            is_open_proposed_date(now)
+        )
+    }
+    not_proposed = sorted(set(chosen) - offered)
+    if not_proposed:
+        raise ValidationException(f"Dates not among the proposed dates of meetings: {', '.join(map(str, not_proposed))}")
+
+    ranges = sorted(
+        (selected, meeting_end(selected, meetings[meeting_id].duration), meeting_id)
+        for meeting_id, selected in chosen.items()
+    )
+    busy = _busy_intervals(db, manager_id, ranges[0][0], max(end for _, end, _ in ranges))
+    clashing = {meeting_id for start, end, meeting_id in ranges if not busy.is_free(start, end)}
+    for (_, end, meeting_id), (next_start, _, next_id) in zip(ranges, ranges[1:]):
+        if next_start < end:
+            clashing.update((meeting_id, next_id))
+    if clashing:
+        raise MeetingConflictException(sorted(clashing), [])
+
+    # Each date is set with the same guarded UPDATE as select_meeting_date,
+    # also requiring the version that was read, so a request changed since
+    # then is refused instead of overwritten
+    updated, changed = [], []
+    for meeting_id, selected in chosen.items():
+        meeting = meetings[meeting_id]
+        row = db.execute(
+            update(Meeting)
+            .where(
+                Meeting.id == meeting_id,
+                Meeting.version == meeting.version,
+                Meeting.status == MeetingStatus.PENDING.value,
+                Meeting.date.is_(None),
+                exists().where(
+                    ProposedDate.meeting_id == meeting_id,
+                    ProposedDate.date == selected,
+                    is_open_proposed_date(now)
+                )
+            )
+            .values(
+                date=selected,
+                ends_at=meeting_end(selected, meeting.duration),
+                reminder_sent_at=None,
+                updated_at=now,
+                version=Meeting.version + 1
+            )
+            .returning(Meeting.id, Meeting.date, Meeting.ends_at, Meeting.status, Meeting.created_by_type, Meeting.created_by_id)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if row is None:
+            changed.append(meeting_id)
+        else:
+            updated.append(row)
+    if changed:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Meetings changed while the plan was applied: {', '.join(map(str, sorted(changed)))}"
+        )
+
+    manager = db.query(Manager.name).filter(Manager.id == manager_id).first()
+    attendees = attendees_by_meeting(db, list(chosen))
+    owners = {(UserType.MANAGER.value, manager_id)}
+    for row in updated:
+        meeting = meetings[row.id]
+        db.execute(
+            update(ProposedDate)
+            .where(ProposedDate.meeting_id == row.id)
+            .values(is_selected=(ProposedDate.date == row.date))
+            .execution_options(synchronize_session=False)
+        )
+        set_participant_date(db, row.id, row.date)
+        if row.created_by_type == UserType.EMPLOYEE.value:
+            owners.add((UserType.EMPLOYEE.value, row.created_by_id))
+        for employee_id, email in attendees[row.id]:
+            owners.add((UserType.EMPLOYEE.value, employee_id))
+            send_meeting_notification(db, email, meeting.title, row.date, meeting.location, manager.name)
+
+    bump_calendar_versions(db, sorted(owners))
+    db.commit()
+    for row in updated:
+        busy_cache.apply(row.id, manager_id, row.date, row.ends_at, row.status)
+        reminder_scheduler.apply(row.id, row.date, row.status)
+    meeting_list_cache.bump(manager_id)
+
+    return {"updated": len(updated)}
 
 def create_meeting(db: Session, manager_id: int, meeting_data: MeetingCreateRequest) -> int:
     """
@@ -555,12 +1132,43 @@ def create_meeting(db: Session, manager_id: int, meeting_data: MeetingCreateRequ
     Returns:
         int: ID of the created meeting
     """
+    manager = db.query(Manager).filter(Manager.id == manager_id).first()
+    if not manager:
+        raise UserNotFoundException("Manager not found")
+
+    # Check the attendees before writing anything
+    employees = []
+    if meeting_data.employee_ids:
+        employees = db.query(Employee).filter(
+            and_(
+                Employee.id.in_(meeting_data.employee_ids),
+                Employee.manager_id == manager_id
+            )
+        ).all()
+
+        if len(employees) != len(set(meeting_data.employee_ids)):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="One or more employees do not belong to this manager"
+            )
+
+    if not meeting_data.allow_conflicts:
+        if meeting_data.recurrence_rule:
+            # Check the series' occurrences over the conflict horizon
+            series = Series(RecurrenceRule.parse(meeting_data.recurrence_rule), meeting_data.date, meeting_data.duration)
+            horizon = meeting_data.date + timedelta(days=settings.RECURRENCE_CONFLICT_HORIZON_DAYS)
+            ranges = list(series.between(meeting_data.date, horizon))
+        else:
+            ranges = [(meeting_data.date, meeting_end(meeting_data.date, meeting_data.duration))]
+        ensure_no_conflicts(db, manager_id, ranges, [employee.id for employee in employees])
+
     # Create the meeting with client info
     new_meeting = Meeting(
         title=meeting_data.title,
         description=meeting_data.description,
         date=meeting_data.date,
         duration=meeting_data.duration,
+        recurrence_rule=meeting_data.recurrence_rule,
         location=meeting_data.location,
         status="accepted",
         created_by_id=manager_id,
@@ -572,103 +1180,221 @@ def create_meeting(db: Session, manager_id: int, meeting_data: MeetingCreateRequ
     )
 
     db.add(new_meeting)
-    db.commit()
-    db.refresh(new_meeting)
-
-    # Add employees to the meeting if specified
-    if meeting_data.employee_ids:
-        employees = db.query(Employee).filter(
-            and_(
-                Employee.id.in_(meeting_data.employee_ids),
-                Employee.manager_id == manager_id
-            )
-        ).all()
-
-        if len(employees) != len(meeting_data.employee_ids):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="One or more employees do not belong to this manager"
-            )
+    db.flush()
+    add_participants(db, participant_rows(
+        new_meeting.id, manager_id, new_meeting.date, attendee_ids=[employee.id for employee in employees]
+    ))
 
-        for employee in employees:
-            new_meeting.employees.append(employee)
-
-            # Notify employees about the meeting
-            send_meeting_notification(
-                employee.email,
-                employee.name,
-                new_meeting.title,
-                new_meeting.date,
-                new_meeting.location
-            )
+    # Add employees to the meeting and queue their notifications
+    for employee in employees:
+        db.add(EmployeeMeeting(employee_id=employee.id, meeting_id=new_meeting.id))
+        send_meeting_notification(
+            db,
+            employee.email,
+            new_meeting.title,
+            new_meeting.date,
+            new_meeting.location,
+            manager.name
+        )
 
+    bump_calendar_versions(
+        db,
+        [(UserType.MANAGER.value, manager_id)] + [(UserType.EMPLOYEE.value, employee.id) for employee in employees]
+    )
     db.commit()
+    busy_cache.apply_meeting(new_meeting)
+    reminder_scheduler.apply_meeting(new_meeting)
+    meeting_list_cache.bump(new_meeting.manager_id)
 
     return new_meeting.id
 
-def request_meeting(db: Session, employee_id: int, meeting_data: MeetingRequestCreate) -> int:
+def _import_conflicts(
+    db: Session,
+    manager_id: int,
+    ranges: Dict[int, List[tuple]],
+    checked: List[int]
+) -> List[Dict[str, Any]]:
     """
-    Request a meeting with the manager and a client
+    Conflicts of imported rows with the calendar and with each other
+
+    The manager's busy meetings over the whole import window are read
+    once and swept together with the imported rows.
 
     Args:
         db: Database session
-        employee_id: ID of the employee
-        meeting_data: Meeting request data
+        manager_id: ID of the manager
+        ranges: Busy ranges of every imported row, by row number
+        checked: Rows that must not conflict
 
     Returns:
-        int: ID of the created meeting
+        List: Conflicts per row
     """
-    employee = db.query(Employee).filter(Employee.id == employee_id).first()
-    if not employee:
-        raise NotFoundException("Employee not found")
+    window_start = min(start for row_ranges in ranges.values() for start, _ in row_ranges)
+    window_end = max(end for row_ranges in ranges.values() for _, end in row_ranges)
+
+    labelled = [(start, end, ("row", row)) for row, row_ranges in ranges.items() for start, end in row_ranges]
+    for meeting in overlapping_meetings(
+        db, manager_id, window_start, window_end,
+        query=db.query(Meeting.id, Meeting.date, Meeting.ends_at)
+    ):
+        labelled.append((meeting.date, meeting.ends_at, ("meeting", meeting.id)))
+    series_rows = overlapping_series(db, manager_id, window_start, window_end, query=db.query(*SERIES_COLUMNS)).all()
+    for meeting, start, end in expand_series(db, series_rows, window_start, window_end):
+        labelled.append((start, end, ("meeting", meeting.id)))
+
+    clashes = defaultdict(set)
+    for _, _, labels in sweep(labelled):
+        if len(labels) > 1:
+            for label in labels:
+                if label[0] == "row":
+                    clashes[label[1]] |= labels - {label}
+
+    return [
+        {
+            "row": row,
+            "conflicting_meeting_ids": sorted(key for kind, key in clashes[row] if kind == "meeting"),
+            "conflicting_rows": sorted(key for kind, key in clashes[row] if kind == "row")
+        }
+        for row in checked if clashes.get(row)
+    ]
 
-    # Create new meeting with client info
-    new_meeting = Meeting(
-        title=meeting_data.title,
-        description=meeting_data.description,
-        duration=meeting_data.duration,
-        location=meeting_data.location,
-        status="pending",
-        created_by_id=employee_id,
-        created_by_type="employee",
-        manager_id=employee.manager_id,
-        client_name=meeting_data.client_info.name,
-        client_email=meeting_data.client_info.email,
-        client_phone=meeting_data.client_info.phone
-    )
+def import_meetings(db: Session, manager_id: int, body: bytes, content_type: str) -> Dict[str, Any]:
+    """
+    Create many meetings at once from CSV or a JSON array of meetings
 
+    Every row is validated, its employees checked (one IN query for the
+    whole import) and its conflicts looked up before anything is written.
+    Meetings and attendance are then inserted with multi-row INSERTs in a
+    single transaction, and each employee gets one digest email listing
+    their new meetings, delivered by the outbox.
 
-    db.add(new_meeting)
-    db.commit()
-    db.refresh(new_meeting)
-
-    # Add proposed dates
-    for date in meeting_data.proposed_dates:
-        proposed_date = ProposedDate(
-            meeting_id=new_meeting.id,
-            date=date,
-            proposed_by_id=employee_id,
-            proposed_by_type="employee",
-            status=MeetingStatus.PENDING
-        )
-        db.add(proposed_date)
+    Args:
+        db: Database session
+        manager_id: ID of the manager
+        body: Request body
+        content_type: Content-Type of the body (text/csv or application/json)
 
-    db.commit()
+    Returns:
+        Dict: Number of created meetings and their IDs, in row order
+    """
+    manager = db.query(Manager).filter(Manager.id == manager_id).first()
+    if not manager:
+        raise UserNotFoundException("Manager not found")
 
-    # Get manager details
-    manager = db.query(Manager).filter(Manager.id == employee.manager_id).first()
-
-    # Send notification to manager
-    send_meeting_notification(
-        manager.email,
-        manager.name,
-        f"Meeting request from {employee.name} with client {meeting_data.client_info.name}",
-        new_meeting.title,
-        meeting_data.proposed_dates,
-        new_meeting.id
+    try:
+        records = parse_meeting_import(body, content_type)
+    except ValueError as e:
+        raise ValidationException(str(e))
+    if not records:
+        raise ValidationException("No meetings to import")
+    if len(records) > settings.MEETING_IMPORT_MAX_ROWS:
+        raise ValidationException(f"At most {settings.MEETING_IMPORT_MAX_ROWS} meetings can be imported at once")
+
+    meetings, errors = validate_meeting_import(records)
+    if errors:
+        raise MeetingImportException("Some rows are invalid; nothing was imported", errors)
+
+    # Employee ownership for the whole import in one query
+    requested = {employee_id for meeting in meetings for employee_id in meeting.employee_ids or []}
+    employees = {}
+    if requested:
+        employees = {
+            employee.id: employee for employee in db.query(Employee.id, Employee.email).filter(
+                Employee.id.in_(requested),
+                Employee.manager_id == manager_id
+            )
+        }
+    errors = [
+        {
+            "row": row,
+            "errors": [{
+                "field": "employee_ids",
+                "message": f"Employees {sorted(set(meeting.employee_ids) - set(employees))} do not belong to this manager"
+            }]
+        }
+        for row, meeting in enumerate(meetings, start=1)
+        if meeting.employee_ids and not set(meeting.employee_ids) <= set(employees)
+    ]
+    if errors:
+        raise MeetingImportException("Some rows are invalid; nothing was imported", errors)
+
+    horizon = timedelta(days=settings.RECURRENCE_CONFLICT_HORIZON_DAYS)
+    ranges, last_starts = {}, {}
+    for row, meeting in enumerate(meetings, start=1):
+        if meeting.recurrence_rule:
+            series = Series(RecurrenceRule.parse(meeting.recurrence_rule), meeting.date, meeting.duration)
+            ranges[row] = list(series.between(meeting.date, meeting.date + horizon))
+            last_starts[row] = series.last_start
+        else:
+            ranges[row] = [(meeting.date, meeting_end(meeting.date, meeting.duration))]
+
+    checked = [row for row, meeting in enumerate(meetings, start=1) if not meeting.allow_conflicts]
+    if checked:
+        conflicts = _import_conflicts(db, manager_id, ranges, checked)
+        if conflicts:
+            raise MeetingImportException(
+                "Some rows conflict with existing meetings or with each other; nothing was imported",
+                conflicts,
+                status_code=status.HTTP_409_CONFLICT
+            )
+
+    # Bulk INSERTs skip the ORM events, so the derived columns are set here
+    meeting_ids = list(db.scalars(
+        insert(Meeting).returning(Meeting.id, sort_by_parameter_order=True),
+        [
+            {
+                "title": meeting.title,
+                "description": meeting.description,
+                "date": meeting.date,
+                "duration": meeting.duration,
+                "ends_at": meeting_end(meeting.date, meeting.duration),
+                "recurrence_rule": meeting.recurrence_rule,
+                "recurrence_until": last_starts.get(row),
+                "location": meeting.location,
+                "status": "accepted",
+                "created_by_id": manager_id,
+                "created_by_type": "manager",
+                "manager_id": manager_id,
+                "client_name": meeting.client_info.name,
+                "client_email": meeting.client_info.email,
+                "client_phone": meeting.client_info.phone
+            }
+            for row, meeting in enumerate(meetings, start=1)
+        ]
+    ))
+
+    attendance = [
+        {"employee_id": employee_id, "meeting_id": meeting_id}
+        for meeting_id, meeting in zip(meeting_ids, meetings)
+        for employee_id in dict.fromkeys(meeting.employee_ids or [])
+    ]
+    if attendance:
+        db.execute(insert(EmployeeMeeting), attendance)
+    add_participants(db, [
+        participant
+        for meeting_id, meeting in zip(meeting_ids, meetings)
+        for participant in participant_rows(meeting_id, manager_id, meeting.date, attendee_ids=meeting.employee_ids or [])
+    ])
+
+    # One digest per employee instead of one email per meeting
+    scheduled = defaultdict(list)
+    for meeting_id, meeting in zip(meeting_ids, meetings):
+        for employee_id in dict.fromkeys(meeting.employee_ids or []):
+            scheduled[employee_id].append({"meeting_id": meeting_id, "title": meeting.title, "date": meeting.date})
+    for employee_id, employee_meetings in scheduled.items():
+        send_scheduled_meetings_digest(db, employees[employee_id].email, employee_meetings, manager.name)
+
+    bump_calendar_versions(
+        db,
+        [(UserType.MANAGER.value, manager_id)] + [(UserType.EMPLOYEE.value, employee_id) for employee_id in scheduled]
     )
+    db.commit()
+    busy_cache.invalidate(manager_id)
+    meeting_list_cache.bump(manager_id)
+    for meeting_id, meeting in zip(meeting_ids, meetings):
+        reminder_scheduler.apply(meeting_id, meeting.date, "accepted", recurring=bool(meeting.recurrence_rule))
 
-    return new_meeting.id
+    return {"created": len(meeting_ids), "meeting_ids": meeting_ids}
 
 def get_meetings(
     db: Session,
@@ -677,63 +1403,58 @@ def get_meetings(
     date_from: Optional[date] = None,
     date_to: Optional[date] = None,
     page: int = 1,
-    limit: int = 10
+    limit: int = 10,
+    search: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get meetings for a manager with optional filtering
+
+    Without a date window a recurring meeting is listed once, as its
+    series. With both `date_from` and `date_to` its occurrences inside
+    the window are listed instead, merged by date with one-off meetings.
+    Occurrences are only generated inside the window, and one-off meetings
+    are only read up to the requested page.
+
+    A `search` ranks matching meetings by relevance (newest first among
+    equals) and lists recurring meetings once, as their series.
     """
-    query = db.query(Meeting).filter(Meeting.manager_id == manager_id)
+    query = manager_meetings_query(db, manager_id, list_query(db))
 
     if status:
         query = query.filter(Meeting.status == status)
 
-    if date_from:
-        query = query.filter(Meeting.date >= date_from)
-
-    if date_to:
-        query = query.filter(Meeting.date <= date_to)
-
-    total = query.count()
-
-    meetings = query.order_by(Meeting.date.desc()).offset((page - 1) * limit).limit(limit).all()
-
-    meeting_list = []
-    for meeting in meetings:
-        # Get employees for this meeting
-        employee_list = []
-        for emp_meeting in meeting.employees:
-            employee = emp_meeting.employee
-            employee_list.append({
-                "id": employee.id,
-                "name": employee.name,
-                "email": employee.email,
-                "role": employee.role,
-                "department": employee.department
-            })
-
-        # Include client information
-        client_info = {
-            "name": meeting.client_name,
-            "email": meeting.client_email,
-            "phone": meeting.client_phone
-        }
-
-        meeting_dict = {
-            "id": meeting.id,
-            "title": meeting.title,
-            "description": meeting.description,
-            "date": meeting.date,
-            "duration": meeting.duration,
-            "location": meeting.location,
-            "status": meeting.status,
-            "rejection_reason": meeting.rejection_reason,
-            "created_by_type": meeting.created_by_type,
-            "created_at": meeting.created_at,
-            "client_info": client_info,
-            "employees": employee_list
-        }
-
-        meeting_list.append(meeting_dict)
+    if search:
+        query = apply_search(db, query, search)
+
+    if date_from is not None and date_to is not None and not search:
+        # Both queries use the same half-open window, so a meeting on the
+        # date_to day is listed whether it recurs or not
+        window_start, window_end = window_bounds(date_from, date_to)
+        total, entries = windowed_page(
+            db,
+            query.filter(
+                Meeting.recurrence_rule.is_(None),
+                Meeting.date >= window_start,
+                Meeting.date < window_end
+            ),
+            query.filter(Meeting.recurrence_rule.isnot(None)),
+            window_start, window_end, page, limit,
+            Meeting.date.desc()
+        )
+    else:
+        if date_from:
+            query = query.filter(Meeting.date >= date_from)
+        if date_to:
+            query = query.filter(Meeting.date <= date_to)
+        total, rows = page_rows(query, page, limit, Meeting.date.desc())
+        entries = [(row, row.date) for row in rows]
+
+    # Attendees for the whole page in one query
+    attendees = attendees_for(db, [row.id for row, _ in entries])
+    meeting_list = [
+        dict(meeting_item(row, occurrence_date), employees=attendees[row.id])
+        for row, occurrence_date in entries
+    ]
 
     return {
         "meetings": meeting_list,
@@ -7,6 +7,9 @@ from datetime import datetime
 from app.database import Meeting, Employee, Manager, MeetingStatus
 from app.schemas.meeting import MeetingFilterParams
 from app.exceptions import NotFoundException
+from app.utils.meeting_search import apply_search
+from app.utils.meeting_lists import attendees_for, list_query, managers_for, meeting_item, page_rows
+from app.utils.meeting_queries import employee_meetings_query, manager_meetings_query
 
 def get_meetings(
     db: Session,
@@ -30,13 +33,11 @@ def get_meetings(
     Returns:
         Dict: Meetings with pagination info
     """
-    query = db.query(Meeting)
-
     # Filter by user type
     if user_type == "manager":
-        query = query.filter(Meeting.manager_id == user_id)
+        query = manager_meetings_query(db, user_id, list_query(db))
     elif user_type == "employee":
-        query = query.filter(Meeting.employees.any(id=user_id))
+        query = employee_meetings_query(db, user_id, list_query(db))
     else:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -51,50 +52,17 @@ def get_meetings(
     if filters.end_date:
         query = query.filter(Meeting.date <= filters.end_date)
     if filters.search:
-        search_term = f"%{filters.search}%"
-        query = query.filter(Meeting.title.ilike(search_term))
-
-    # Get total count
-    total = query.count()
-
-    # Get paginated results
-    meetings = query.order_by(Meeting.date.desc()).offset((page - 1) * limit).limit(limit).all()
+        query = apply_search(db, query, filters.search)
 
-    # Format response
-    meeting_list = []
-    for meeting in meetings:
-        meeting_dict = {
-            "id": meeting.id,
-            "title": meeting.title,
-            "description": meeting.description,
-            "date": meeting.date,
-            "duration": meeting.duration,
-            "location": meeting.location,
-            "status": meeting.status,
-            "created_by_type": meeting.created_by_type,
-            "created_at": meeting.created_at
-        }
+    total, rows = page_rows(query, page, limit, Meeting.date.desc())
 
-        # Add manager or employee details based on user type
-        if user_type == "manager":
-            meeting_dict["employees"] = [
-                {
-                    "id": employee.id,
-                    "name": employee.name,
-                    "email": employee.email
-                }
-                for employee in meeting.employees
-            ]
-        elif user_type == "employee":
-            manager = db.query(Manager).filter(Manager.id == meeting.manager_id).first()
-            meeting_dict["manager"] = {
-                "id": manager.id,
-                "name": manager.name,
-                "email": manager.email,
-                "company_name": manager.company_name
-            }
-
-        meeting_list.append(meeting_dict)
+    # Add manager or employee details based on user type, one query per page
+    if user_type == "manager":
+        attendees = attendees_for(db, [row.id for row in rows], fields=("id", "name", "email"))
+        meeting_list = [dict(meeting_item(row), employees=attendees[row.id]) for row in rows]
+    else:
+        managers = managers_for(db, [row.manager_id for row in rows], fields=("id", "name", "email", "company_name"))
+        meeting_list = [dict(meeting_item(row), manager=managers.get(row.manager_id)) for row in rows]
 
     return {
         "meetings": meeting_list,
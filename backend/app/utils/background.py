@@ -0,0 +1,62 @@
+import logging
+import threading
+from typing import Callable, List
+
+from sqlalchemy.orm import Session
+
+from app.data import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+class PeriodicTask:
+    """Run a database job on a daemon thread at a fixed interval"""
+
+    def __init__(self, name: str, interval_seconds: float, job: Callable[[Session], object]):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.job = job
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run_once(self) -> None:
+        db = SessionLocal()
+        try:
+            self.job(db)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Background task {self.name} failed: {str(e)}")
+        finally:
+            db.close()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.run_once()
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+_tasks: List[PeriodicTask] = []
+
+def register_task(name: str, interval_seconds: float, job: Callable[[Session], object]) -> PeriodicTask:
+    """Register a periodic task to be started with the application"""
+    task = PeriodicTask(name, interval_seconds, job)
+    _tasks.append(task)
+    return task
+
+def start_tasks() -> None:
+    for task in _tasks:
+        task.start()
+
+def stop_tasks() -> None:
+    for task in _tasks:
+        task.stop()
@@ -0,0 +1,280 @@
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+from time import monotonic
+from typing import Dict, List, Optional, Set, Tuple
+import threading
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import Meeting
+from app.utils.intervals import Interval
+from app.utils.meeting_queries import BUSY_STATUSES, SERIES_COLUMNS, expand_series, overlapping_meetings, overlapping_series
+
+DayKey = Tuple[int, date]
+
+class _DayEntry:
+    __slots__ = ("masks", "bitmap", "loaded_at")
+
+    def __init__(self, masks: Dict[int, int], loaded_at: float):
+        self.masks = masks
+        self.bitmap = 0
+        for mask in masks.values():
+            self.bitmap |= mask
+        self.loaded_at = loaded_at
+
+    def rebuild(self) -> None:
+        bitmap = 0
+        for mask in self.masks.values():
+            bitmap |= mask
+        self.bitmap = bitmap
+
+class BusyBitmapCache:
+    """
+    In-memory occupancy bitmaps per manager and day
+
+    Each day is split into fixed slots (`granularity_minutes`), one bit
+    per slot, packed into a Python int. A meeting sets every slot it
+    touches, so "free" answers are exact and "busy" answers are
+    conservative for meetings that do not start or end on a slot boundary.
+
+    The mask of each meeting is kept alongside the day's bitmap so that
+    write paths can patch a cached day exactly (`apply`) instead of
+    reloading it. Entries expire after `ttl_seconds`, which bounds how long
+    another process's writes can go unseen.
+    """
+
+    def __init__(self, granularity_minutes: int = 5, ttl_seconds: float = 300, max_entries: int = 10000):
+        if (24 * 60) % granularity_minutes:
+            raise ValueError("granularity_minutes must divide a day evenly")
+        self.granularity = granularity_minutes
+        self.bits_per_day = 24 * 60 // granularity_minutes
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._days: "OrderedDict[DayKey, _DayEntry]" = OrderedDict()
+        self._by_meeting: Dict[int, Set[DayKey]] = {}
+        self._versions: Dict[int, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # Bit arithmetic
+
+    def _bit(self, moment: datetime, day_start: datetime, round_up: bool) -> int:
+        minutes = (moment - day_start).total_seconds() / 60
+        index = int(minutes // self.granularity)
+        if round_up and minutes % self.granularity:
+            index += 1
+        return max(0, min(self.bits_per_day, index))
+
+    def day_masks(self, start: datetime, end: datetime) -> Dict[date, int]:
+        """Bitmask of every slot touched by [start, end), per day it spans"""
+        masks = {}
+        day = start.date()
+        while True:
+            day_start = datetime.combine(day, time.min, tzinfo=start.tzinfo)
+            if day_start >= end:
+                break
+            first = self._bit(max(start, day_start), day_start, round_up=False)
+            last = self._bit(min(end, day_start + timedelta(days=1)), day_start, round_up=True)
+            if last > first:
+                masks[day] = ((1 << (last - first)) - 1) << first
+            day += timedelta(days=1)
+        return masks
+
+    # Loading
+
+    def _load(self, db: Session, manager_id: int, days: List[date], tzinfo=None) -> Dict[date, _DayEntry]:
+        """Entries for `days`, from one meetings query and one series query over their span"""
+        range_start = datetime.combine(min(days), time.min, tzinfo=tzinfo)
+        range_end = datetime.combine(max(days), time.min, tzinfo=tzinfo) + timedelta(days=1)
+        masks: Dict[date, Dict[int, int]] = {day: {} for day in days}
+
+        rows = overlapping_meetings(
+            db, manager_id, range_start, range_end,
+            query=db.query(Meeting.id, Meeting.date, Meeting.ends_at)
+        ).all()
+        for row in rows:
+            for day, mask in self.day_masks(row.date, row.ends_at).items():
+                if day in masks:
+                    masks[day][row.id] = mask
+
+        # Recurring series contribute each day's occurrences under their own ID
+        series = overlapping_series(
+            db, manager_id, range_start, range_end,
+            query=db.query(*SERIES_COLUMNS)
+        ).all()
+        for row, start, end in expand_series(db, series, range_start, range_end):
+            for day, mask in self.day_masks(start, end).items():
+                if day in masks:
+                    masks[day][row.id] = masks[day].get(row.id, 0) | mask
+
+        loaded_at = monotonic()
+        return {day: _DayEntry(day_masks, loaded_at) for day, day_masks in masks.items()}
+
+    def _fresh(self, entry: Optional[_DayEntry], now: float) -> bool:
+        return entry is not None and now - entry.loaded_at < self.ttl_seconds
+
+    def _entry(self, db: Session, manager_id: int, day: date, tzinfo=None) -> _DayEntry:
+        key = (manager_id, day)
+        with self._lock:
+            entry = self._days.get(key)
+            if self._fresh(entry, monotonic()):
+                self._days.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            version = self._versions.get(manager_id, 0)
+
+        entry = self._load(db, manager_id, [day], tzinfo)[day]
+
+        with self._lock:
+            if self._versions.get(manager_id, 0) != version:
+                # A write landed while loading; use this snapshot once, reload next time
+                return entry
+            self._store(key, entry)
+        return entry
+
+    def prefetch(self, db: Session, manager_id: int, first_day: date, days: int, tzinfo=None) -> None:
+        """
+        Load the uncached days of a range together
+
+        A week view would otherwise load each day on its own; the missing
+        days are read with one meetings query and one series query instead.
+        """
+        wanted = [first_day + timedelta(days=offset) for offset in range(days)]
+        with self._lock:
+            now = monotonic()
+            missing = [day for day in wanted if not self._fresh(self._days.get((manager_id, day)), now)]
+            if not missing:
+                return
+            self.misses += len(missing)
+            version = self._versions.get(manager_id, 0)
+
+        entries = self._load(db, manager_id, missing, tzinfo)
+
+        with self._lock:
+            if self._versions.get(manager_id, 0) != version:
+                # A write landed while loading; the days are loaded again when asked for
+                return
+            for day, entry in entries.items():
+                self._store((manager_id, day), entry)
+
+    def _store(self, key: DayKey, entry: _DayEntry) -> None:
+        old = self._days.pop(key, None)
+        if old is not None:
+            self._forget(key, old)
+        self._days[key] = entry
+        for meeting_id in entry.masks:
+            self._by_meeting.setdefault(meeting_id, set()).add(key)
+        while len(self._days) > self.max_entries:
+            evicted_key, evicted = self._days.popitem(last=False)
+            self._forget(evicted_key, evicted)
+
+    def _forget(self, key: DayKey, entry: _DayEntry) -> None:
+        for meeting_id in entry.masks:
+            keys = self._by_meeting.get(meeting_id)
+            if keys:
+                keys.discard(key)
+                if not keys:
+                    del self._by_meeting[meeting_id]
+
+    # Queries
+
+    def day_bitmap(self, db: Session, manager_id: int, day: date, tzinfo=None) -> int:
+        """Occupancy bitmap of a manager's day (bit i = slot i is busy)"""
+        return self._entry(db, manager_id, day, tzinfo).bitmap
+
+    def is_free(self, db: Session, manager_id: int, start: datetime, end: datetime) -> bool:
+        """Whether the manager has no busy slot in [start, end)"""
+        for day, mask in self.day_masks(start, end).items():
+            if self.day_bitmap(db, manager_id, day, start.tzinfo) & mask:
+                return False
+        return True
+
+    def free_intervals(self, db: Session, manager_id: int, window_start: datetime, window_end: datetime) -> List[Interval]:
+        """
+        Free intervals of a manager's day within [window_start, window_end)
+
+        The window must lie within one day and is trimmed to whole slots.
+        """
+        day = window_start.date()
+        day_start = datetime.combine(day, time.min, tzinfo=window_start.tzinfo)
+        bitmap = self.day_bitmap(db, manager_id, day, window_start.tzinfo)
+        first = self._bit(window_start, day_start, round_up=True)
+        last = self._bit(window_end, day_start, round_up=False)
+        step = timedelta(minutes=self.granularity)
+
+        free: List[Interval] = []
+        run_start: Optional[int] = None
+        for index in range(first, last + 1):
+            busy = index == last or bitmap >> index & 1
+            if not busy and run_start is None:
+                run_start = index
+            elif busy and run_start is not None:
+                free.append((day_start + run_start * step, day_start + index * step))
+                run_start = None
+        return free
+
+    # Write-path patching
+
+    def apply(
+        self,
+        meeting_id: int,
+        manager_id: int,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        status: str
+    ) -> None:
+        """
+        Patch cached days after a meeting was created, moved or changed status
+
+        Call after the change is committed. Days that are not cached are
+        left alone; they are loaded fresh when first asked for.
+        """
+        with self._lock:
+            self._versions[manager_id] = self._versions.get(manager_id, 0) + 1
+
+            for key in self._by_meeting.pop(meeting_id, set()):
+                entry = self._days.get(key)
+                if entry is not None and entry.masks.pop(meeting_id, None) is not None:
+                    entry.rebuild()
+
+            if start is None or end is None or status not in BUSY_STATUSES:
+                return
+            for day, mask in self.day_masks(start, end).items():
+                key = (manager_id, day)
+                entry = self._days.get(key)
+                if entry is None:
+                    continue
+                entry.masks[meeting_id] = mask
+                entry.bitmap |= mask
+                self._by_meeting.setdefault(meeting_id, set()).add(key)
+
+    def apply_meeting(self, meeting: Meeting) -> None:
+        if meeting.recurrence_rule:
+            # A series touches many days; drop the manager's days instead of patching them
+            self.invalidate(meeting.manager_id)
+            return
+        status = getattr(meeting.status, "value", meeting.status)
+        self.apply(meeting.id, meeting.manager_id, meeting.date, meeting.ends_at, status)
+
+    def invalidate(self, manager_id: Optional[int] = None) -> None:
+        with self._lock:
+            if manager_id is None:
+                self._days.clear()
+                self._by_meeting.clear()
+                self._versions = {key: version + 1 for key, version in self._versions.items()}
+                return
+            for key in [key for key in self._days if key[0] == manager_id]:
+                self._forget(key, self._days.pop(key))
+            self._versions[manager_id] = self._versions.get(manager_id, 0) + 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._days), "hits": self.hits, "misses": self.misses}
+
+busy_cache = BusyBitmapCache(
+    granularity_minutes=settings.BUSY_BITMAP_GRANULARITY_MINUTES,
+    ttl_seconds=settings.BUSY_BITMAP_TTL_SECONDS
+)
@@ -0,0 +1,254 @@
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+import logging
+
+from fastapi import Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session
+
+from app.data import SessionLocal
+from app.database import CalendarVersion, EmployeeMeeting, Meeting, MeetingException, UserType
+
+logger = logging.getLogger(__name__)
+
+Owner = Tuple[str, int]
+
+# Meeting status -> iCalendar STATUS
+ICS_STATUS = {
+    "accepted": "CONFIRMED",
+    "pending": "TENTATIVE",
+    "rejected": "CANCELLED",
+    "cancelled": "CANCELLED"
+}
+
+FEED_COLUMNS = (
+    Meeting.id, Meeting.title, Meeting.description, Meeting.date, Meeting.ends_at,
+    Meeting.location, Meeting.status, Meeting.created_at, Meeting.updated_at,
+    Meeting.duration, Meeting.recurrence_rule
+)
+
+def meeting_calendar_owners(db: Session, meeting: Meeting) -> List[Owner]:
+    """
+    Users whose calendar feed shows a meeting
+
+    Args:
+        db: Database session
+        meeting: The meeting
+
+    Returns:
+        List: (user_type, user_id) pairs
+    """
+    owners = {(UserType.MANAGER.value, meeting.manager_id)}
+    if meeting.created_by_type == UserType.EMPLOYEE.value:
+        owners.add((UserType.EMPLOYEE.value, meeting.created_by_id))
+    for row in db.query(EmployeeMeeting.employee_id).filter(EmployeeMeeting.meeting_id == meeting.id):
+        owners.add((UserType.EMPLOYEE.value, row.employee_id))
+    return sorted(owners)
+
+def bump_calendar_versions(db: Session, owners: Iterable[Owner]) -> None:
+    """
+    Invalidate the calendar feeds of the given users (not committed)
+
+    Only users who have fetched their feed have a version row; the others
+    get one, and so a fresh ETag, on their first fetch.
+
+    Args:
+        db: Database session
+        owners: (user_type, user_id) pairs
+    """
+    owners = list(owners)
+    if not owners:
+        return
+    db.execute(
+        update(CalendarVersion)
+        .where(or_(*(
+            and_(CalendarVersion.user_type == user_type, CalendarVersion.user_id == user_id)
+            for user_type, user_id in owners
+        )))
+        .values(version=CalendarVersion.version + 1, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+def get_calendar_version(db: Session, user_type: str, user_id: int) -> int:
+    """
+    Current feed version for a user, created on first use
+
+    Args:
+        db: Database session
+        user_type: Type of the user
+        user_id: ID of the user
+
+    Returns:
+        int: Version counter
+    """
+    row = db.query(CalendarVersion.version).filter(
+        CalendarVersion.user_type == user_type,
+        CalendarVersion.user_id == user_id
+    ).first()
+    if row:
+        return row.version
+
+    db.add(CalendarVersion(user_type=user_type, user_id=user_id, version=1, updated_at=datetime.utcnow()))
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another request created it first
+        db.rollback()
+        return get_calendar_version(db, user_type, user_id)
+    return 1
+
+def feed_etag(user_type: str, user_id: int, version: int) -> str:
+    return f'"{user_type}-{user_id}-v{version}"'
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header covers the given strong ETag"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+def _fold(line: str) -> str:
+    """Fold a content line at 75 octets as RFC 5545 requires"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts, current = [], b""
+    for char in line:
+        char_bytes = char.encode("utf-8")
+        if len(current) + len(char_bytes) > (75 if not parts else 74):
+            parts.append(current.decode("utf-8"))
+            current = b""
+        current += char_bytes
+    parts.append(current.decode("utf-8"))
+    return "\r\n ".join(parts) + "\r\n"
+
+def _utc(value: datetime) -> str:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+def render_event(meeting, exceptions: Sequence[MeetingException] = ()) -> str:
+    """
+    Render a meeting as a VEVENT
+
+    A recurring meeting is rendered once with its RRULE; cancelled
+    occurrences become EXDATEs and moved ones separate VEVENTs that
+    override the occurrence through RECURRENCE-ID.
+    """
+    uid = f"UID:meeting-{meeting.id}@meetyfi"
+    stamp = f"DTSTAMP:{_utc(meeting.updated_at or meeting.created_at or datetime.utcnow())}"
+    lines = [
+        "BEGIN:VEVENT",
+        uid,
+        stamp,
+        f"DTSTART:{_utc(meeting.date)}",
+        f"DTEND:{_utc(meeting.ends_at)}",
+        f"SUMMARY:{_escape(meeting.title or '')}",
+        f"STATUS:{ICS_STATUS.get(str(meeting.status), 'TENTATIVE')}"
+    ]
+    if meeting.recurrence_rule:
+        lines.append(f"RRULE:{meeting.recurrence_rule}")
+        lines.extend(
+            f"EXDATE:{_utc(exception.original_start)}"
+            for exception in exceptions if exception.is_cancelled
+        )
+    if meeting.description:
+        lines.append(f"DESCRIPTION:{_escape(meeting.description)}")
+    if meeting.location:
+        lines.append(f"LOCATION:{_escape(meeting.location)}")
+    lines.append("END:VEVENT")
+
+    for exception in exceptions:
+        if exception.is_cancelled or exception.new_date is None:
+            continue
+        moved_end = exception.new_date + timedelta(minutes=exception.new_duration or meeting.duration)
+        lines.extend([
+            "BEGIN:VEVENT",
+            uid,
+            stamp,
+            f"RECURRENCE-ID:{_utc(exception.original_start)}",
+            f"DTSTART:{_utc(exception.new_date)}",
+            f"DTEND:{_utc(moved_end)}",
+            f"SUMMARY:{_escape(meeting.title or '')}",
+            f"STATUS:{ICS_STATUS.get(str(meeting.status), 'TENTATIVE')}",
+            "END:VEVENT"
+        ])
+    return "".join(_fold(line) for line in lines)
+
+def _render_batch(db: Session, rows: List) -> str:
+    """Render a batch of feed rows, loading the series' exceptions in one query"""
+    series_ids = [row.id for row in rows if row.recurrence_rule]
+    exceptions: Dict[int, List[MeetingException]] = defaultdict(list)
+    if series_ids:
+        for exception in db.query(MeetingException).filter(
+            MeetingException.meeting_id.in_(series_ids)
+        ).order_by(MeetingException.original_start):
+            exceptions[exception.meeting_id].append(exception)
+    return "".join(render_event(row, exceptions.get(row.id, ())) for row in rows)
+
+def stream_calendar(build_query: Callable[[Session], Query], name: str, batch_size: int = 200) -> Iterator[str]:
+    """
+    Stream an iCalendar feed for the meetings a query selects
+
+    The generator opens its own session, since it runs after the request's
+    dependencies have finished, and fetches rows in batches.
+
+    Args:
+        build_query: Builds the meeting query (selecting FEED_COLUMNS) for a session
+        name: Calendar name
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        str: Feed chunks
+    """
+    yield (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//MeetyFi//Meetings//EN\r\n"
+        "CALSCALE:GREGORIAN\r\n" + _fold(f"X-WR-CALNAME:{_escape(name)}")
+    )
+    db = SessionLocal()
+    try:
+        query = build_query(db).filter(Meeting.date.isnot(None)).order_by(Meeting.date)
+        chunk = []
+        for meeting in query.yield_per(batch_size):
+            chunk.append(meeting)
+            if len(chunk) >= batch_size:
+                yield _render_batch(db, chunk)
+                chunk = []
+        if chunk:
+            yield _render_batch(db, chunk)
+    finally:
+        db.close()
+    yield "END:VCALENDAR\r\n"
+
+def calendar_response(
+    db: Session,
+    user_type: str,
+    user_id: int,
+    name: str,
+    build_query: Callable[[Session], Query],
+    if_none_match: str = None
+) -> Response:
+    """
+    Conditional GET for a user's calendar feed
+
+    The ETag comes from the user's version counter, so unchanged feeds are
+    answered with 304 without reading the meetings table.
+    """
+    etag = feed_etag(user_type, user_id, get_calendar_version(db, user_type, user_id))
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return StreamingResponse(
+        stream_calendar(build_query, name),
+        media_type="text/calendar; charset=utf-8",
+        headers=headers
+    )
@@ -1,42 +1,41 @@
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import logging
-from typing import List, Optional, Union
-import random
-import string
+from typing import Any, Dict, List, Optional, Union
+import json
+from html import escape
 from datetime import datetime, timedelta
 
+from sqlalchemy.orm import Session
+
 from app.config import settings
+from app.database import EmailOutbox
+from app.utils.email_templates import RenderedEmail, format_date, render
 
 logger = logging.getLogger(__name__)
 
-def generate_otp(length: int = 6) -> str:
-    """Generate a random OTP of specified length"""
-    return ''.join(random.choices(string.digits, k=length))
-
-def generate_verification_token(length: int = 64) -> str:
-    """Generate a random verification token"""
-    chars = string.ascii_letters + string.digits
-    return ''.join(random.choices(chars, k=length))
+# Notification categories that may be merged into a per-recipient digest
+DIGEST_MEETING_REQUEST = "meeting_request"
+DIGEST_MEETING_STATUS = "meeting_status"
+DIGEST_MEETING_SCHEDULED = "meeting_scheduled"
 
-def send_email(
+def build_message(
     recipient_email: str,
     subject: str,
     html_content: str,
     text_content: Optional[str] = None
-) -> bool:
+) -> MIMEMultipart:
     """
-    Send an email to the specified recipient
-    
+    Build a multipart email message
+
     Args:
         recipient_email: Email address of the recipient
         subject: Email subject
         html_content: HTML content of the email
         text_content: Plain text content of the email (optional)
-        
+
     Returns:
-        bool: True if email was sent successfully, False otherwise
+        MIMEMultipart: The message, ready to send
     """
     if not text_content:
         text_content = "Please view this email in an HTML compatible email client."
@@ -47,160 +46,158 @@ def send_email(
     message["To"] = recipient_email
     
     # Add text and HTML parts to the message
-    part1 = MIMEText(text_content, "plain")
-    part2 = MIMEText(html_content, "html")
-    message.attach(part1)
-    message.attach(part2)
-    
-    try:
-        with smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT) as server:
-            server.starttls()
-            server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-            server.sendmail(settings.EMAIL_FROM, recipient_email, message.as_string())
-        logger.info(f"Email sent successfully to {recipient_email}")
-        return True
-    except Exception as e:
-        logger.error(f"Failed to send email to {recipient_email}: {str(e)}")
-        return False
+    message.attach(MIMEText(text_content, "plain"))
+    message.attach(MIMEText(html_content, "html"))
+    return message
 
-def send_otp_email(email: str, otp: str, name: str = None) -> bool:
+def queue_email(
+    db: Session,
+    recipient_email: str,
+    subject: str,
+    html_content: str,
+    text_content: Optional[str] = None,
+    category: Optional[str] = None,
+    payload: Union[Dict[str, Any], List[Dict[str, Any]], None] = None
+) -> bool:
     """
-    Send OTP verification email to manager
+    Queue an email in the outbox for background delivery
+
+    The outbox row is added to the session but not committed, so the email
+    is only sent if the surrounding business change commits. Emails with a
+    category are held for the digest window so that notifications to the
+    same recipient can be merged into one digest.
+
+    Args:
+        db: Database session
+        recipient_email: Email address of the recipient
+        subject: Email subject
+        html_content: HTML content of the email
+        text_content: Plain text content of the email (optional)
+        category: Digest category (optional)
+        payload: Summary of the notification for digests, or a list of them (optional)
+
+    Returns:
+        bool: True once the email is queued
+    """
+    next_attempt_at = datetime.utcnow()
+    if category and settings.NOTIFICATION_DIGEST_WINDOW_SECONDS > 0:
+        next_attempt_at += timedelta(seconds=settings.NOTIFICATION_DIGEST_WINDOW_SECONDS)
+
+    db.add(EmailOutbox(
+        recipient=recipient_email,
+        subject=subject,
+        html_content=html_content,
+        text_content=text_content,
+        status="pending",
+        category=category,
+        payload=json.dumps(payload, default=str) if payload else None,
+        attempts=0,
+        next_attempt_at=next_attempt_at
+    ))
+    return True
+
+def queue_rendered(
+    db: Session,
+    recipient_email: str,
+    rendered: RenderedEmail,
+    category: Optional[str] = None,
+    payload: Union[Dict[str, Any], List[Dict[str, Any]], None] = None
+) -> bool:
+    """Queue a rendered template for one recipient"""
+    return queue_email(
+        db, recipient_email, rendered.subject, rendered.html_content, rendered.text_content,
+        category=category, payload=payload
+    )
+
+def send_otp_email(db: Session, email: str, otp: str, name: str = None) -> bool:
+    """
+    Queue OTP verification email to manager
     
     Args:
+        db: Database session
         email: Email address to send the OTP to
         otp: One-time password for verification
         name: User's name (optional)
     """
-    subject = "Verify Your Account - OTP"
-    
     # Personalize the greeting if name is provided
     greeting = f"Hello {name}," if name else "Hello,"
     
-    html_content = f"""
-    <html>
-    <body>
-        <h2>Account Verification</h2>
-        <p>{greeting}</p>
-        <p>Thank you for registering with our service. Please use the following OTP to verify your account:</p>
-        <h3 style="background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 24px;">{otp}</h3>
-        <p>This OTP is valid for 10 minutes.</p>
-        <p>If you did not request this verification, please ignore this email.</p>
-    </body>
-    </html>
-    """
-    
-    text_content = f"{greeting}\n\nYour OTP for account verification is: {otp}. This OTP is valid for 10 minutes."
-    
-    return send_email(email, subject, html_content, text_content)
-
-def send_employee_verification_email(email: str, manager_name: str, company_name: str, verification_token: str) -> bool:
-    """Send invitation email to employee with verification token"""
-    
-    subject = f"Invitation to join {company_name}"
-    html_content = f"""
-    <html>
-    <body>
-        <h2>You've been invited!</h2>
-        <p>Hello,</p>
-        <p>{manager_name} from {company_name} has invited you to join their team.</p>
-        <p>Please use the following verification key to set up your account:</p>
-        <p><strong>{verification_token}</strong></p>
-        <p>This key will expire in 7 days.</p>
-        <p>If you did not expect this invitation, please ignore this email.</p>
-    </body>
-    </html>
-    """
-    text_content = f"""
-    Hello,
-    
-    {manager_name} from {company_name} has invited you to join their team.
-    
-    Please use the following verification key to set up your account:
-    {verification_token}
-    
-    This token will expire in 7 days.
-    
-    If you did not expect this invitation, please ignore this email.
-    """
-    
-    return send_email(email, subject, html_content, text_content)
-
-
+    rendered = render("otp", greeting=greeting, otp=otp, expire_minutes=str(settings.OTP_EXPIRE_MINUTES))
+    return queue_rendered(db, email, rendered)
 
+def send_employee_verification_email(db: Session, email: str, manager_name: str, company_name: str, verification_token: str) -> bool:
+    """Queue invitation email to employee with verification token"""
+    rendered = render(
+        "employee_invitation",
+        manager_name=manager_name,
+        company_name=company_name,
+        verification_token=verification_token,
+        expire_days=str(settings.VERIFICATION_TOKEN_EXPIRE_DAYS)
+    )
+    return queue_rendered(db, email, rendered)
 
 def send_meeting_notification(
+    db: Session,
     email: str,
     meeting_title: str,
     meeting_date: Union[datetime, List[datetime]],  # Can be a single date or list of dates
     meeting_location: str,
     created_by: str,
-    is_request: bool = False
+    is_request: bool = False,
+    meeting_id: Optional[int] = None
 ) -> bool:
-    """Send meeting notification email"""
+    """Queue meeting notification email (requests can be merged into a digest)"""
     # Handle single date or multiple proposed dates
     if isinstance(meeting_date, list):
-        # Format multiple proposed dates
-        formatted_dates = "<ul>"
-        for date in meeting_date:
-            formatted_dates += f"<li>{date.strftime('%A, %B %d, %Y at %I:%M %p')}</li>"
-        formatted_dates += "</ul>"
-        date_display = f"Proposed dates: {formatted_dates}"
-
-        # Plain text version
-        plain_dates = "\n".join([f"- {date.strftime('%A, %B %d, %Y at %I:%M %p')}" for date in meeting_date])
-        plain_date_display = f"Proposed dates:\n{plain_dates}"
+        formatted = [format_date(date) for date in meeting_date]
+        html_dates = "".join(f"<li>{date}</li>" for date in formatted)
+        date_display_html = f"Proposed dates: <ul>{html_dates}</ul>"
+        date_display = "Proposed dates:\n" + "\n".join(f"- {date}" for date in formatted)
+        date_summary = "proposed " + "; ".join(formatted)
     else:
-        # Format single date
-        formatted_date = meeting_date.strftime("%A, %B %d, %Y at %I:%M %p")
-        date_display = f"Date & Time: {formatted_date}"
-        plain_date_display = f"Date & Time: {formatted_date}"
+        date_summary = format_date(meeting_date)
+        date_display = f"Date & Time: {date_summary}"
+        date_display_html = escape(date_display)
 
     if is_request:
-        subject = f"New Meeting Request: {meeting_title}"
+        heading = "New Meeting Request"
         action_text = "requested a meeting"
     else:
-        subject = f"New Meeting Scheduled: {meeting_title}"
+        heading = "New Meeting Scheduled"
         action_text = "scheduled a meeting"
 
-    html_content = f"""
-    <html>
-    <body>
-        <h2>{subject}</h2>
-        <p>{created_by} has {action_text} with you:</p>
-        <div style="background-color: #f0f0f0; padding: 15px; margin: 10px 0;">
-            <p><strong>Title:</strong> {meeting_title}</p>
-            <p><strong>{date_display}</strong></p>
-            <p><strong>Location:</strong> {meeting_location}</p>
-        </div>
-        <p>Please log in to your account to view more details or respond to this meeting.</p>
-    </body>
-    </html>
-    """
-
-    text_content = f"""
-    {subject}
-
-    {created_by} has {action_text} with you:
+    rendered = render(
+        "meeting_notification",
+        raw_html={"date_display": date_display_html},
+        heading=heading,
+        action_text=action_text,
+        meeting_title=meeting_title,
+        date_display=date_display,
+        meeting_location=str(meeting_location),
+        created_by=created_by
+    )
 
-    Title: {meeting_title}
-    {plain_date_display}
-    Location: {meeting_location}
+    if not is_request:
+        return queue_rendered(db, email, rendered)
 
-    Please log in to your account to view more details or respond to this meeting.
-    """
-
-    return send_email(email, subject, html_content, text_content)
+    payload = {
+        "meeting_id": meeting_id,
+        "title": meeting_title,
+        "summary": f"Requested by {created_by}, {date_summary}"
+    }
+    return queue_rendered(db, email, rendered, category=DIGEST_MEETING_REQUEST, payload=payload)
 
 def send_meeting_status_update(
+    db: Session,
     email: str,
     meeting_title: str,
     meeting_date: datetime,
     status: str,
-    reason: Optional[str] = None
+    reason: Optional[str] = None,
+    meeting_id: Optional[int] = None
 ) -> bool:
-    """Send meeting status update email"""
-    formatted_date = meeting_date.strftime("%A, %B %d, %Y at %I:%M %p")
+    """Queue meeting status update email (can be merged into a digest)"""
+    formatted_date = format_date(meeting_date) if meeting_date else "To be confirmed"
     
     status_map = {
         "accepted": "accepted",
@@ -209,109 +206,143 @@ def send_meeting_status_update(
     }
     
     status_text = status_map.get(status.lower(), status)
-    subject = f"Meeting {status_text.capitalize()}: {meeting_title}"
-    
-    html_content = f"""
-    <html>
-    <body>
-        <h2>Meeting Update</h2>
-        <p>Your meeting has been <strong>{status_text}</strong>:</p>
-        <div style="background-color: #f0f0f0; padding: 15px; margin: 10px 0;">
-            <p><strong>Title:</strong> {meeting_title}</p>
-            <p><strong>Date & Time:</strong> {formatted_date}</p>
-        </div>
+
+    rendered = render(
+        "meeting_status_update",
+        raw_html={"reason": f"<p><strong>Reason:</strong> {escape(reason)}</p>" if reason else ""},
+        status_text=status_text,
+        status_title=status_text.capitalize(),
+        meeting_title=meeting_title,
+        formatted_date=formatted_date,
+        reason=f"Reason: {reason}\n" if reason else ""
+    )
+
+    payload = {
+        "meeting_id": meeting_id,
+        "title": meeting_title,
+        "summary": f"{status_text.capitalize()}, {formatted_date}" + (f" (reason: {reason})" if reason else "")
+    }
+    return queue_rendered(db, email, rendered, category=DIGEST_MEETING_STATUS, payload=payload)
+
+def send_meeting_reminder(
+    db: Session,
+    email: str,
+    meeting_title: str,
+    meeting_date: datetime,
+    meeting_location: Optional[str],
+    meeting_id: Optional[int] = None
+) -> bool:
+    """Queue a reminder for an upcoming meeting (sent right away, never digested)"""
+    rendered = render(
+        "meeting_reminder",
+        meeting_title=meeting_title,
+        start_time=meeting_date.strftime("%I:%M %p"),
+        formatted_date=format_date(meeting_date),
+        meeting_location=str(meeting_location or "To be confirmed")
+    )
+    return queue_rendered(db, email, rendered)
+
+def render_digest(notifications: List[Dict[str, Any]]) -> RenderedEmail:
     """
-    
-    text_content = f"""
-    Meeting Update
-    
-    Your meeting has been {status_text}:
-    
-    Title: {meeting_title}
-    Date & Time: {formatted_date}
+    Render one digest email for several queued notifications
+
+    Args:
+        notifications: Notification payloads, each with a "category" key
+
+    Returns:
+        RenderedEmail: Digest with counts per category and a summary per meeting
     """
-    
-    if reason:
-        html_content += f"<p><strong>Reason:</strong> {reason}</p>"
-        text_content += f"\nReason: {reason}"
-    
-    html_content += """
-        <p>Please log in to your account to view more details.</p>
-    </body>
-    </html>
+    labels = {
+        DIGEST_MEETING_REQUEST: ("new meeting request", "new meeting requests"),
+        DIGEST_MEETING_STATUS: ("meeting status change", "meeting status changes"),
+        DIGEST_MEETING_SCHEDULED: ("new scheduled meeting", "new scheduled meetings"),
+    }
+    counts: Dict[str, int] = {}
+    meetings: Dict[Any, List[Dict[str, Any]]] = {}
+    for notification in notifications:
+        counts[notification["category"]] = counts.get(notification["category"], 0) + 1
+        key = notification.get("meeting_id") or notification.get("title")
+        meetings.setdefault(key, []).append(notification)
+
+    counts_line = ", ".join(
+        f"{count} {labels.get(category, (category, category))[0 if count == 1 else 1]}"
+        for category, count in counts.items()
+    )
+
+    html_items, text_items = [], []
+    for updates in meetings.values():
+        latest = updates[-1]
+        more = f" ({len(updates)} updates)" if len(updates) > 1 else ""
+        html_items.append(f"<li><strong>{escape(latest['title'])}</strong>{more}: {escape(latest['summary'])}</li>")
+        text_items.append(f"- {latest['title']}{more}: {latest['summary']}")
+
+    return render(
+        "notification_digest",
+        raw_html={"items": "".join(html_items)},
+        updates=f"{len(notifications)} meeting update{'' if len(notifications) == 1 else 's'}",
+        counts_line=counts_line,
+        items="\n".join(text_items)
+    )
+
+def send_scheduled_meetings_digest(db: Session, email: str, meetings: List[Dict[str, Any]], created_by: str) -> bool:
     """
-    
-    text_content += "\nPlease log in to your account to view more details."
-    
-    return send_email(email, subject, html_content, text_content)
+    Queue one digest about several meetings scheduled at once (e.g. an import)
+
+    Args:
+        db: Database session
+        email: Recipient
+        meetings: Dicts with "meeting_id", "title" and "date"
+        created_by: Who scheduled them
 
-def send_manager_approval_email(recipient_email: str, recipient_name: str):
+    Returns:
+        bool: True once the digest is queued
+    """
+    notifications = [
+        {
+            "category": DIGEST_MEETING_SCHEDULED,
+            "meeting_id": meeting["meeting_id"],
+            "title": meeting["title"],
+            "summary": f"Scheduled by {created_by} for {format_date(meeting['date'])}"
+        }
+        for meeting in meetings
+    ]
+    rendered = render_digest(notifications)
+    return queue_rendered(db, email, rendered, category=DIGEST_MEETING_SCHEDULED, payload=notifications)
+
+def send_manager_approval_email(db: Session, recipient_email: str, recipient_name: str):
     """
-    Send an email notification when a manager's account is approved.
+    Queue an email notification when a manager's account is approved.
 
+    :param db: Database session
     :param recipient_email: Email address of the manager
     :param recipient_name: Name of the manager
-    :return: True if the email was sent successfully, False otherwise
+    :return: True if the email was queued, False otherwise
     """
-    subject = "Your Manager Account Has Been Approved"
-
-    # Create the email content
-    content = f"""
-    <html>
-    <body>
-        <h2>Account Approval</h2>
-        <p>Hello {recipient_name},</p>
-        <p>We are pleased to inform you that your manager account has been approved.</p>
-        <p>You can now log in to the MeetyFi platform and start managing your team.</p>
-        <p>If you have any questions or need assistance, please don't hesitate to contact our support team.</p>
-        <p>Thank you for choosing MeetyFi!</p>
-        <p>Best regards,<br>MeetyFi Team</p>
-    </body>
-    </html>
-    """
-
     try:
-        send_email(recipient_email, subject, content)
-        return True
+        rendered = render("manager_approval", recipient_name=recipient_name)
+        return queue_email(db, recipient_email, rendered.subject, rendered.html_content)
     except Exception as e:
         print(f"Error sending manager approval email: {str(e)}")
         return False
 
-def send_manager_rejection_email(recipient_email: str, recipient_name: str, reason: str = None):
+def send_manager_rejection_email(db: Session, recipient_email: str, recipient_name: str, reason: str = None):
     """
-    Send an email notification when a manager's account is rejected.
+    Queue an email notification when a manager's account is rejected.
 
+    :param db: Database session
     :param recipient_email: Email address of the manager
     :param recipient_name: Name of the manager
     :param reason: Reason for rejection (optional)
-    :return: True if the email was sent successfully, False otherwise
-    """
-    subject = "Your Manager Account Application Status"
-
-    # Create the email content
-    content = f"""
-    <html>
-    <body>
-        <h2>Account Application Status</h2>
-        <p>Hello {recipient_name},</p>
-        <p>We regret to inform you that your application for a manager account has not been approved at this time.</p>
+    :return: True if the email was queued, False otherwise
     """
-
-    if reason:
-        content += f"<p><strong>Reason:</strong> {reason}</p>"
-
-    content += """
-        <p>If you believe this decision was made in error or if you would like to provide additional information, 
-        please contact our support team.</p>
-        <p>Thank you for your interest in MeetyFi.</p>
-        <p>Best regards,<br>MeetyFi Team</p>
-    </body>
-    </html>
-    """
-
     try:
-        send_email(recipient_email, subject, content)
-        return True
+        rendered = render(
+            "manager_rejection",
+            raw_html={"reason": f"<p><strong>Reason:</strong> {escape(reason)}</p>" if reason else ""},
+            recipient_name=recipient_name,
+            reason=reason or ""
+        )
+        return queue_email(db, recipient_email, rendered.subject, rendered.html_content)
     except Exception as e:
         print(f"Error sending manager rejection email: {str(e)}")
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,256 @@
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from html import escape
+from string import Template
+from typing import Dict, Optional, Tuple
+
+DATE_FORMAT = "%A, %B %d, %Y at %I:%M %p"
+
+@dataclass(frozen=True)
+class EmailTemplate:
+    subject: Template
+    html: Template
+    text: Template
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    subject: str
+    html_content: str
+    text_content: str
+
+def _compile(subject: str, html: str, text: str) -> EmailTemplate:
+    return EmailTemplate(Template(subject), Template(html), Template(text))
+
+# Compiled once at import; every send renders from these
+TEMPLATES: Dict[str, EmailTemplate] = {
+    "otp": _compile(
+        "Verify Your Account - OTP",
+        """
+    <html>
+    <body>
+        <h2>Account Verification</h2>
+        <p>$greeting</p>
+        <p>Thank you for registering with our service. Please use the following OTP to verify your account:</p>
+        <h3 style="background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 24px;">$otp</h3>
+        <p>This OTP is valid for $expire_minutes minutes.</p>
+        <p>If you did not request this verification, please ignore this email.</p>
+    </body>
+    </html>
+    """,
+        "$greeting\n\nYour OTP for account verification is: $otp. This OTP is valid for $expire_minutes minutes."
+    ),
+    "employee_invitation": _compile(
+        "Invitation to join $company_name",
+        """
+    <html>
+    <body>
+        <h2>You've been invited!</h2>
+        <p>Hello,</p>
+        <p>$manager_name from $company_name has invited you to join their team.</p>
+        <p>Please use the following verification key to set up your account:</p>
+        <p><strong>$verification_token</strong></p>
+        <p>This key will expire in $expire_days days.</p>
+        <p>If you did not expect this invitation, please ignore this email.</p>
+    </body>
+    </html>
+    """,
+        """
+    Hello,
+
+    $manager_name from $company_name has invited you to join their team.
+
+    Please use the following verification key to set up your account:
+    $verification_token
+
+    This token will expire in $expire_days days.
+
+    If you did not expect this invitation, please ignore this email.
+    """
+    ),
+    "meeting_notification": _compile(
+        "$heading: $meeting_title",
+        """
+    <html>
+    <body>
+        <h2>$heading: $meeting_title</h2>
+        <p>$created_by has $action_text with you:</p>
+        <div style="background-color: #f0f0f0; padding: 15px; margin: 10px 0;">
+            <p><strong>Title:</strong> $meeting_title</p>
+            <p><strong>$date_display</strong></p>
+            <p><strong>Location:</strong> $meeting_location</p>
+        </div>
+        <p>Please log in to your account to view more details or respond to this meeting.</p>
+    </body>
+    </html>
+    """,
+        """
+    $heading: $meeting_title
+
+    $created_by has $action_text with you:
+
+    Title: $meeting_title
+    $date_display
+    Location: $meeting_location
+
+    Please log in to your account to view more details or respond to this meeting.
+    """
+    ),
+    "meeting_status_update": _compile(
+        "Meeting $status_title: $meeting_title",
+        """
+    <html>
+    <body>
+        <h2>Meeting Update</h2>
+        <p>Your meeting has been <strong>$status_text</strong>:</p>
+        <div style="background-color: #f0f0f0; padding: 15px; margin: 10px 0;">
+            <p><strong>Title:</strong> $meeting_title</p>
+            <p><strong>Date & Time:</strong> $formatted_date</p>
+        </div>
+    $reason
+        <p>Please log in to your account to view more details.</p>
+    </body>
+    </html>
+    """,
+        """
+    Meeting Update
+
+    Your meeting has been $status_text:
+
+    Title: $meeting_title
+    Date & Time: $formatted_date
+    $reason
+    Please log in to your account to view more details."""
+    ),
+    "meeting_reminder": _compile(
+        "Reminder: $meeting_title starts at $start_time",
+        """
+    <html>
+    <body>
+        <h2>Upcoming Meeting: $meeting_title</h2>
+        <p>This is a reminder that your meeting starts soon:</p>
+        <div style="background-color: #f0f0f0; padding: 15px; margin: 10px 0;">
+            <p><strong>Title:</strong> $meeting_title</p>
+            <p><strong>Date & Time:</strong> $formatted_date</p>
+            <p><strong>Location:</strong> $meeting_location</p>
+        </div>
+        <p>Please log in to your account to view more details.</p>
+    </body>
+    </html>
+    """,
+        """
+    Upcoming Meeting: $meeting_title
+
+    This is a reminder that your meeting starts soon:
+
+    Title: $meeting_title
+    Date & Time: $formatted_date
+    Location: $meeting_location
+
+    Please log in to your account to view more details.
+    """
+    ),
+    "manager_approval": _compile(
+        "Your Manager Account Has Been Approved",
+        """
+    <html>
+    <body>
+        <h2>Account Approval</h2>
+        <p>Hello $recipient_name,</p>
+        <p>We are pleased to inform you that your manager account has been approved.</p>
+        <p>You can now log in to the MeetyFi platform and start managing your team.</p>
+        <p>If you have any questions or need assistance, please don't hesitate to contact our support team.</p>
+        <p>Thank you for choosing MeetyFi!</p>
+        <p>Best regards,<br>MeetyFi Team</p>
+    </body>
+    </html>
+    """,
+        ""
+    ),
+    "manager_rejection": _compile(
+        "Your Manager Account Application Status",
+        """
+    <html>
+    <body>
+        <h2>Account Application Status</h2>
+        <p>Hello $recipient_name,</p>
+        <p>We regret to inform you that your application for a manager account has not been approved at this time.</p>
+    $reason
+        <p>If you believe this decision was made in error or if you would like to provide additional information,
+        please contact our support team.</p>
+        <p>Thank you for your interest in MeetyFi.</p>
+        <p>Best regards,<br>MeetyFi Team</p>
+    </body>
+    </html>
+    """,
+        ""
+    ),
+    "notification_digest": _compile(
+        "You have $updates",
+        """
+    <html>
+    <body>
+        <h2>Your meeting updates</h2>
+        <p>Since our last email: $counts_line.</p>
+        <div style="background-color: #f0f0f0; padding: 15px; margin: 10px 0;">
+            <ul>$items</ul>
+        </div>
+        <p>Please log in to your account to view more details or respond to these meetings.</p>
+    </body>
+    </html>
+    """,
+        """
+    Your meeting updates
+
+    Since our last email: $counts_line.
+
+$items
+
+    Please log in to your account to view more details or respond to these meetings.
+    """
+    ),
+}
+
+@lru_cache(maxsize=4096)
+def format_date(value: datetime) -> str:
+    """Format a meeting date for emails, cached since fan-outs repeat the same dates"""
+    return value.strftime(DATE_FORMAT)
+
+# Templates sent to many recipients with the same values. One-off emails
+# (OTPs, invitations) carry secrets and are never reused, so they are not cached.
+CACHED_TEMPLATES = frozenset({"meeting_notification", "meeting_status_update", "meeting_reminder"})
+
+def _render(name: str, html_params: Tuple[Tuple[str, str], ...], text_params: Tuple[Tuple[str, str], ...]) -> RenderedEmail:
+    template = TEMPLATES[name]
+    text = dict(text_params)
+    return RenderedEmail(
+        subject=template.subject.substitute(text),
+        html_content=template.html.substitute(dict(html_params)),
+        text_content=template.text.substitute(text)
+    )
+
+_render_cached = lru_cache(maxsize=1024)(_render)
+
+def render(name: str, raw_html: Optional[Dict[str, str]] = None, **params: str) -> RenderedEmail:
+    """
+    Render a registered template
+
+    Renders of CACHED_TEMPLATES are reused for the same values.
+
+    Values are HTML-escaped for the HTML body. Pre-built HTML fragments go
+    in `raw_html` and are inserted as-is (with `params` used for the text
+    body under the same name).
+
+    Args:
+        name: Template name in TEMPLATES
+        raw_html: HTML fragments to insert without escaping
+        params: Template values
+
+    Returns:
+        RenderedEmail: Subject, HTML and text bodies
+    """
+    html_params = {key: escape(value) for key, value in params.items()}
+    if raw_html:
+        html_params.update(raw_html)
+    renderer = _render_cached if name in CACHED_TEMPLATES else _render
+    return renderer(name, tuple(sorted(html_params.items())), tuple(sorted(params.items())))
@@ -0,0 +1,189 @@
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+import time
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import Employee, EmployeeMeeting, UserType
+from app.utils.smtp_pool import DeadlineExceeded, smtp_pool
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(
+    max_workers=max(settings.EMAIL_FANOUT_CONCURRENCY, 1),
+    thread_name_prefix="email-fanout"
+)
+
+@dataclass
+class FanoutReport:
+    """Outcome of a fan-out, by index into the messages that were sent"""
+    sent: List[int] = field(default_factory=list)
+    failed: Dict[int, str] = field(default_factory=dict)
+    timed_out: List[int] = field(default_factory=list)  # Never attempted; safe to send again
+    unfinished: List[int] = field(default_factory=list)  # Still sending when we stopped waiting; outcome unknown
+    outages: int = 0  # Failures that point at the SMTP server, not the message
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.timed_out and not self.unfinished
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "sent": len(self.sent),
+            "failed": len(self.failed),
+            "timed_out": len(self.timed_out),
+            "unfinished": len(self.unfinished)
+        }
+
+def meeting_recipients(db: Session, meeting_id: int) -> List[str]:
+    """
+    Get the email addresses of everyone attending a meeting in one query
+
+    Args:
+        db: Database session
+        meeting_id: ID of the meeting
+
+    Returns:
+        List: Attendee email addresses
+    """
+    rows = db.query(Employee.email).join(
+        EmployeeMeeting, EmployeeMeeting.employee_id == Employee.id
+    ).filter(EmployeeMeeting.meeting_id == meeting_id).all()
+    return [row.email for row in rows]
+
+def attendees_by_meeting(db: Session, meeting_ids: List[int]) -> Dict[int, List[Tuple[int, str]]]:
+    """
+    Get the attendees of several meetings in one query
+
+    Args:
+        db: Database session
+        meeting_ids: IDs of the meetings
+
+    Returns:
+        Dict: (employee ID, email) pairs per meeting ID
+    """
+    attendees: Dict[int, List[Tuple[int, str]]] = {meeting_id: [] for meeting_id in meeting_ids}
+    if not meeting_ids:
+        return attendees
+    rows = db.query(EmployeeMeeting.meeting_id, Employee.id, Employee.email).join(
+        Employee, EmployeeMeeting.employee_id == Employee.id
+    ).filter(EmployeeMeeting.meeting_id.in_(meeting_ids)).all()
+    for row in rows:
+        attendees[row.meeting_id].append((row.id, row.email))
+    return attendees
+
+def status_update_recipients(db: Session, meetings: List[Any]) -> Dict[int, Dict[int, str]]:
+    """
+    Who is told about a meeting's status change: its attendees and, for
+    requests, the employee who asked for it
+
+    Args:
+        db: Database session
+        meetings: Rows with id, created_by_type and created_by_id
+
+    Returns:
+        Dict: Email per employee ID, per meeting ID (two queries in total)
+    """
+    attendees = attendees_by_meeting(db, [meeting.id for meeting in meetings])
+    requester_ids = {
+        meeting.created_by_id for meeting in meetings
+        if meeting.created_by_type == UserType.EMPLOYEE.value and meeting.created_by_id is not None
+    }
+    requesters = dict(
+        db.query(Employee.id, Employee.email).filter(Employee.id.in_(requester_ids)).all()
+    ) if requester_ids else {}
+
+    recipients = {}
+    for meeting in meetings:
+        emails = dict(attendees[meeting.id])
+        if meeting.created_by_type == UserType.EMPLOYEE.value and meeting.created_by_id in requesters:
+            emails[meeting.created_by_id] = requesters[meeting.created_by_id]
+        recipients[meeting.id] = emails
+    return recipients
+
+def _collect(report: FanoutReport, chunk: List[int], future: Future) -> FanoutReport:
+    """Add the results of a finished chunk to a report"""
+    try:
+        results = future.result()
+    except Exception as e:
+        results = [e] * len(chunk)
+    for index, error in zip(chunk, results):
+        if error is None:
+            report.sent.append(index)
+        elif isinstance(error, DeadlineExceeded):
+            report.timed_out.append(index)
+            report.outages += 1
+        else:
+            report.failed[index] = str(error)
+            if smtp_pool.is_outage(error):
+                report.outages += 1
+    return report
+
+def fan_out(
+    sender: str,
+    messages: List[Tuple[str, str]],
+    concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    on_unfinished: Optional[Callable[[FanoutReport], None]] = None
+) -> FanoutReport:
+    """
+    Send messages over several pooled SMTP sessions at once
+
+    Messages are split into at most `concurrency` chunks, each sent back to
+    back over its own session, so a batch takes about as long as its
+    largest chunk rather than the sum of every round trip.
+
+    Workers stop starting new messages once `timeout` has passed; those are
+    reported as timed out. A message already in flight is allowed one more
+    SMTP timeout to finish. If a worker is still busy after that, its
+    unsent messages are reported as unfinished: they may yet be delivered,
+    so callers must not queue them again. `on_unfinished` is called from
+    the worker thread with their actual outcome once it is known.
+
+    Args:
+        sender: Envelope sender
+        messages: (recipient, message) pairs
+        concurrency: Parallel sessions (defaults to EMAIL_FANOUT_CONCURRENCY)
+        timeout: Seconds to wait for the whole batch (defaults to EMAIL_FANOUT_TIMEOUT_SECONDS)
+        on_unfinished: Called with the late report of each unfinished chunk
+
+    Returns:
+        FanoutReport: Which messages were sent, failed or timed out
+    """
+    report = FanoutReport()
+    if not messages:
+        return report
+
+    concurrency = max(1, min(concurrency or settings.EMAIL_FANOUT_CONCURRENCY, smtp_pool.max_size, len(messages)))
+    timeout = settings.EMAIL_FANOUT_TIMEOUT_SECONDS if timeout is None else timeout
+
+    # Interleave so each chunk gets a similar share of the batch
+    chunks = [list(range(start, len(messages), concurrency)) for start in range(concurrency)]
+    deadline = time.monotonic() + timeout
+    futures = {
+        _executor.submit(smtp_pool.send_many, sender, [messages[i] for i in chunk], deadline=deadline): chunk
+        for chunk in chunks
+    }
+    done, not_done = wait(futures, timeout=timeout + smtp_pool.timeout)
+
+    for future in done:
+        _collect(report, futures[future], future)
+
+    for future in not_done:
+        chunk = futures[future]
+        report.unfinished.extend(chunk)
+        report.outages += len(chunk)
+        if on_unfinished is not None:
+            future.add_done_callback(
+                lambda finished, chunk=chunk: on_unfinished(_collect(FanoutReport(), chunk, finished))
+            )
+
+    if not report.ok:
+        logger.warning(f"Email fan-out partially failed: {report.summary()}")
+    return report
+
+def shutdown_fanout() -> None:
+    _executor.shutdown(wait=False)
@@ -0,0 +1,121 @@
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import FrozenSet, Hashable, Iterable, List, Tuple
+
+Interval = Tuple[datetime, datetime]
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """
+    Sort intervals and merge the ones that overlap or touch
+
+    Args:
+        intervals: (start, end) pairs in any order
+
+    Returns:
+        List: Disjoint intervals sorted by start
+    """
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+class IntervalSet:
+    """
+    Disjoint, sorted intervals with binary-search lookups
+
+    Built once from a batch of busy intervals, then queried many times
+    (free gaps, overlap checks) without rescanning the input.
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        self.intervals = merge_intervals(intervals)
+        self._starts = [start for start, _ in self.intervals]
+        self._ends = [end for _, end in self.intervals]
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def overlapping(self, start: datetime, end: datetime) -> List[Interval]:
+        """Intervals that overlap [start, end)"""
+        first = bisect_right(self._ends, start)
+        last = bisect_left(self._starts, end)
+        return self.intervals[first:last]
+
+    def is_free(self, start: datetime, end: datetime) -> bool:
+        return not self.overlapping(start, end)
+
+    def gaps(self, window_start: datetime, window_end: datetime) -> List[Interval]:
+        """Free intervals inside [window_start, window_end)"""
+        free: List[Interval] = []
+        cursor = window_start
+        for busy_start, busy_end in self.overlapping(window_start, window_end):
+            if busy_start > cursor:
+                free.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+        if cursor < window_end:
+            free.append((cursor, window_end))
+        return free
+
+def split_slots(free: Iterable[Interval], slot: timedelta, align: timedelta = None) -> List[Interval]:
+    """
+    Cut free intervals into fixed-size slots
+
+    Args:
+        free: Free intervals
+        slot: Slot length
+        align: Slot starts are rounded up to a multiple of this (defaults to `slot`)
+
+    Returns:
+        List: Slots that fit entirely inside a free interval
+    """
+    align = align or slot
+    slots: List[Interval] = []
+    for start, end in free:
+        midnight = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        offset = start - midnight
+        remainder = offset % align
+        cursor = start if not remainder else start + (align - remainder)
+        while cursor + slot <= end:
+            slots.append((cursor, cursor + slot))
+            cursor += slot
+    return slots
+
+def sweep(intervals: Iterable[Tuple[datetime, datetime, Hashable]]) -> List[Tuple[datetime, datetime, FrozenSet[Hashable]]]:
+    """
+    Sweep-line over labelled intervals
+
+    Args:
+        intervals: (start, end, label) triples, e.g. one per participant and meeting
+
+    Returns:
+        List: Disjoint, sorted (start, end, active labels) segments covering
+        every instant at least one interval is active
+    """
+    events = []
+    for start, end, label in intervals:
+        if end > start:
+            events.append((start, 1, label))
+            events.append((end, -1, label))
+    events.sort(key=lambda event: (event[0], event[1]))
+
+    segments = []
+    active = Counter()
+    for index, (point, delta, label) in enumerate(events):
+        active[label] += delta
+        if not active[label]:
+            del active[label]
+        next_point = events[index + 1][0] if index + 1 < len(events) else None
+        if active and next_point is not None and next_point > point:
+            labels = frozenset(active)
+            if segments and segments[-1][1] == point and segments[-1][2] == labels:
+                segments[-1] = (segments[-1][0], next_point, labels)
+            else:
+                segments.append((point, next_point, labels))
+    return segments
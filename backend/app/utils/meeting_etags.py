@@ -0,0 +1,40 @@
+from typing import List, Optional
+import re
+
+from fastapi import Response
+
+from app.exceptions import PreconditionFailedException
+
+# If-Match uses strong comparison, so weak (W/) tags never match
+MEETING_ETAG = re.compile(r'^"meeting-(\d+)-v(\d+)"$')
+
+def meeting_etag(meeting_id: int, version: int) -> str:
+    return f'"meeting-{meeting_id}-v{version}"'
+
+def if_match_versions(if_match: Optional[str], meeting_id: int) -> Optional[List[int]]:
+    """
+    Meeting versions an If-Match header accepts
+
+    Returns:
+        List: Accepted versions, or None if any version will do (no header, or "*")
+
+    Raises:
+        PreconditionFailedException: If no strong tag in the header names this meeting
+    """
+    if not if_match:
+        return None
+    candidates = [candidate.strip() for candidate in if_match.split(",")]
+    if "*" in candidates:
+        return None
+    versions = []
+    for candidate in candidates:
+        match = MEETING_ETAG.match(candidate)
+        if match and int(match.group(1)) == meeting_id:
+            versions.append(int(match.group(2)))
+    if not versions:
+        raise PreconditionFailedException("If-Match does not name this meeting")
+    return versions
+
+def set_meeting_etag(response: Response, meeting: dict) -> None:
+    """Send a changed meeting's new ETag with the response"""
+    response.headers["ETag"] = meeting_etag(meeting["id"], meeting["version"])
@@ -0,0 +1,92 @@
+from typing import Any, Dict, List, Tuple
+import csv
+import io
+import json
+import re
+
+from pydantic import ValidationError
+
+from app.schemas.manager import MeetingCreateRequest
+
+# CSV columns besides the MeetingCreateRequest fields; client_* fill client_info
+CLIENT_COLUMNS = {"client_name": "name", "client_email": "email", "client_phone": "phone"}
+TRUE_VALUES = {"1", "true", "yes", "y"}
+
+RowError = Dict[str, Any]
+
+def _csv_records(content: str) -> List[Dict[str, Any]]:
+    """
+    Turn CSV rows into MeetingCreateRequest-shaped dicts
+
+    Empty cells are treated as missing. `employee_ids` holds IDs separated
+    by spaces or semicolons, `allow_conflicts` a yes/no flag.
+    """
+    records = []
+    for row in csv.DictReader(io.StringIO(content)):
+        record: Dict[str, Any] = {}
+        client: Dict[str, Any] = {}
+        for column, value in row.items():
+            if column is None or value is None:
+                continue
+            column, value = column.strip().lower(), value.strip()
+            if not value:
+                continue
+            if column in CLIENT_COLUMNS:
+                client[CLIENT_COLUMNS[column]] = value
+            elif column == "employee_ids":
+                record[column] = [part for part in re.split(r"[;\s]+", value) if part]
+            elif column == "allow_conflicts":
+                record[column] = value.lower() in TRUE_VALUES
+            else:
+                record[column] = value
+        record["client_info"] = client
+        records.append(record)
+    return records
+
+def parse_meeting_import(body: bytes, content_type: str) -> List[Any]:
+    """
+    Decode an import body (CSV or a JSON array) into raw records
+
+    Raises:
+        ValueError: If the body cannot be decoded
+    """
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValueError("Import must be UTF-8 encoded")
+
+    if "csv" in (content_type or "").lower():
+        return _csv_records(text)
+
+    try:
+        records = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON: {e.msg}")
+    if not isinstance(records, list):
+        raise ValueError("Expected a JSON array of meetings")
+    return records
+
+def validate_meeting_import(records: List[Any]) -> Tuple[List[MeetingCreateRequest], List[RowError]]:
+    """
+    Validate every record before anything is written
+
+    Args:
+        records: Raw records from parse_meeting_import
+
+    Returns:
+        tuple: (validated meetings, errors per row); rows are numbered from 1
+    """
+    meetings: List[MeetingCreateRequest] = []
+    errors: List[RowError] = []
+    for index, record in enumerate(records, start=1):
+        try:
+            meetings.append(MeetingCreateRequest.model_validate(record))
+        except ValidationError as e:
+            errors.append({
+                "row": index,
+                "errors": [
+                    {"field": ".".join(str(part) for part in error["loc"]), "message": error["msg"]}
+                    for error in e.errors()
+                ]
+            })
+    return meetings, errors
@@ -0,0 +1,192 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import heapq
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Query, Session
+
+from app.database import Employee, EmployeeMeeting, Manager, Meeting, ProposedDate
+from app.utils.meeting_queries import expand_series
+
+# Columns behind every meeting list item (and SERIES_COLUMNS, for expanding series)
+LIST_COLUMNS = (
+    Meeting.id, Meeting.title, Meeting.description, Meeting.date, Meeting.duration,
+    Meeting.location, Meeting.status, Meeting.rejection_reason, Meeting.created_by_type,
+    Meeting.created_by_id, Meeting.created_at, Meeting.manager_id,
+    Meeting.recurrence_rule, Meeting.recurrence_until,
+    Meeting.client_name, Meeting.client_email, Meeting.client_phone, Meeting.version
+)
+
+EMPLOYEE_COLUMNS = (Employee.id, Employee.name, Employee.email, Employee.role, Employee.department)
+MANAGER_COLUMNS = (Manager.id, Manager.name, Manager.email, Manager.company_name, Manager.profile_picture)
+
+def list_query(db: Session) -> Query:
+    """Meeting query selecting LIST_COLUMNS, to pass to manager/employee_meetings_query"""
+    return db.query(*LIST_COLUMNS)
+
+def page_rows(query: Query, page: int, limit: int, *order_by) -> Tuple[int, List[Any]]:
+    """
+    Count a list query and fetch one page of it
+
+    Returns:
+        tuple: (total, rows)
+    """
+    total = query.count()
+    rows = query.order_by(*order_by).offset((page - 1) * limit).limit(limit).all()
+    return total, rows
+
+def window_bounds(date_from: date, date_to: date) -> Tuple[datetime, datetime]:
+    """Half-open range [start, end) covering the days date_from to date_to"""
+    return (
+        datetime.combine(date_from, datetime.min.time()),
+        datetime.combine(date_to, datetime.min.time()) + timedelta(days=1)
+    )
+
+def windowed_page(
+    db: Session,
+    singles: Query,
+    series: Query,
+    window_start: datetime,
+    window_end: datetime,
+    page: int,
+    limit: int,
+    *order_by
+) -> Tuple[int, List[Tuple[Any, datetime]]]:
+    """
+    One page of one-off meetings and series occurrences, newest first
+
+    Occurrences are only generated inside the window, and one-off meetings
+    are only read up to the requested page.
+
+    Args:
+        db: Database session
+        singles: One-off meetings, already limited to the window
+        series: Recurring meetings (rows with LIST_COLUMNS)
+        window_start: Start of the window
+        window_end: End of the window (exclusive)
+        page: Page number
+        limit: Items per page
+        order_by: Newest-first ordering of `singles`
+
+    Returns:
+        tuple: (total, [(row, date of the meeting or occurrence)])
+    """
+    series_rows = series.filter(
+        Meeting.date < window_end,
+        or_(Meeting.recurrence_until.is_(None), Meeting.recurrence_until >= window_start)
+    ).all()
+    occurrences = [
+        (row, occurrence_start)
+        for row, occurrence_start, _ in expand_series(db, series_rows, window_start, window_end)
+        if window_start <= occurrence_start < window_end
+    ]
+    occurrences.reverse()
+
+    offset = (page - 1) * limit
+    total = singles.count() + len(occurrences)
+    # One-off meetings never fill more than the pages up to this one
+    single_entries = ((row, row.date) for row in singles.order_by(*order_by).limit(offset + limit))
+    entries = list(islice(
+        heapq.merge(single_entries, occurrences, key=lambda entry: entry[1], reverse=True),
+        offset, offset + limit
+    ))
+    return total, entries
+
+def meeting_item(row: Any, date: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Response dict for a list row
+
+    Args:
+        row: Row with LIST_COLUMNS
+        date: Occurrence date, for recurring meetings (defaults to the row's date)
+    """
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "date": date if date is not None else row.date,
+        "duration": row.duration,
+        "location": row.location,
+        "status": row.status,
+        "rejection_reason": row.rejection_reason,
+        "created_by_type": row.created_by_type,
+        "created_at": row.created_at,
+        "recurrence_rule": row.recurrence_rule,
+        "version": row.version,
+        "client_info": {
+            "name": row.client_name,
+            "email": row.client_email,
+            "phone": row.client_phone
+        }
+    }
+
+def attendees_for(db: Session, meeting_ids: Iterable[int], fields: Iterable[str] = ("id", "name", "email", "role", "department")) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Attendees of a page of meetings, in one query
+
+    Args:
+        db: Database session
+        meeting_ids: IDs of the meetings
+        fields: Employee fields to include
+
+    Returns:
+        Dict: Attendee dicts per meeting ID (every ID present)
+    """
+    meeting_ids = list(dict.fromkeys(meeting_ids))
+    attendees: Dict[int, List[Dict[str, Any]]] = {meeting_id: [] for meeting_id in meeting_ids}
+    if not meeting_ids:
+        return attendees
+    fields = tuple(fields)
+    columns = [column for column in EMPLOYEE_COLUMNS if column.key in fields]
+    rows = db.query(EmployeeMeeting.meeting_id, *columns).join(
+        Employee, EmployeeMeeting.employee_id == Employee.id
+    ).filter(EmployeeMeeting.meeting_id.in_(meeting_ids)).order_by(EmployeeMeeting.id)
+    for row in rows:
+        attendees[row.meeting_id].append({field: getattr(row, field) for field in fields})
+    return attendees
+
+def managers_for(db: Session, manager_ids: Iterable[int], fields: Iterable[str] = ("id", "name", "email", "company_name", "profile_picture")) -> Dict[int, Dict[str, Any]]:
+    """
+    Manager details for a page of meetings, in one query
+
+    Args:
+        db: Database session
+        manager_ids: IDs of the managers
+        fields: Manager fields to include
+
+    Returns:
+        Dict: Manager dict per manager ID
+    """
+    manager_ids = set(manager_ids)
+    if not manager_ids:
+        return {}
+    fields = tuple(fields)
+    columns = [column for column in MANAGER_COLUMNS if column.key in fields or column.key == "id"]
+    return {
+        row.id: {field: getattr(row, field) for field in fields}
+        for row in db.query(*columns).filter(Manager.id.in_(manager_ids))
+    }
+
+def proposed_dates_for(db: Session, meeting_ids: Iterable[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Proposed dates of a page of meeting requests, in one query
+
+    Args:
+        db: Database session
+        meeting_ids: IDs of the meetings
+
+    Returns:
+        Dict: Proposed date dicts per meeting ID, in date order
+    """
+    meeting_ids = list(dict.fromkeys(meeting_ids))
+    proposed: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    if not meeting_ids:
+        return proposed
+    rows = db.query(ProposedDate.meeting_id, ProposedDate.date, ProposedDate.is_selected, ProposedDate.status).filter(
+        ProposedDate.meeting_id.in_(meeting_ids)
+    ).order_by(ProposedDate.meeting_id, ProposedDate.date)
+    for row in rows:
+        proposed[row.meeting_id].append({"date": row.date, "is_selected": row.is_selected, "status": row.status})
+    return proposed
@@ -0,0 +1,356 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, func, null, or_, update
+from sqlalchemy.orm import Query, Session
+
+from app.database import EmployeeMeeting, Meeting, MeetingException, MeetingParticipant, UserType, meeting_end
+from app.exceptions import CustomException, InvalidMeetingStatusException, MeetingConflictException, PreconditionFailedException
+from app.utils.meeting_etags import meeting_etag
+from app.utils.validators import MeetingStatusTransitionValidator
+from app.utils.recurrence import RecurrenceRule, Series
+
+# Meetings in these states block a calendar
+BUSY_STATUSES = ["accepted", "pending"]
+# Longest meeting the schemas allow; bounds how far back an overlapping meeting can start
+MAX_MEETING_MINUTES = 480
+
+SERIES_COLUMNS = (Meeting.id, Meeting.date, Meeting.duration, Meeting.recurrence_rule, Meeting.recurrence_until)
+
+# Returned by set_meeting_status: enough for notifications, caches and calendar owners
+STATUS_CHANGE_COLUMNS = (
+    Meeting.id, Meeting.title, Meeting.date, Meeting.ends_at, Meeting.status, Meeting.rejection_reason,
+    Meeting.manager_id, Meeting.created_by_type, Meeting.created_by_id, Meeting.recurrence_rule, Meeting.version
+)
+
+def manager_meetings_query(db: Session, manager_id: int, query: Optional[Query] = None) -> Query:
+    """Meetings a manager owns (base query for lists and feeds)"""
+    query = query if query is not None else db.query(Meeting)
+    return query.filter(Meeting.manager_id == manager_id)
+
+def employee_meetings_query(db: Session, employee_id: int, query: Optional[Query] = None) -> Query:
+    """
+    Meetings an employee requested or attends (base query for lists and feeds)
+
+    Joins the employee's meeting_participants rows, so callers can filter
+    and sort on MeetingParticipant.date along the (user_type, user_id, date) index.
+    """
+    query = query if query is not None else db.query(Meeting)
+    return query.join(MeetingParticipant, MeetingParticipant.meeting_id == Meeting.id).filter(
+        MeetingParticipant.user_type == UserType.EMPLOYEE.value,
+        MeetingParticipant.user_id == employee_id
+    )
+
+def overlap_condition(db: Session, start: datetime, end: datetime):
+    """
+    SQL condition for meetings overlapping [start, end)
+
+    On Postgres this is a range overlap (&&) that the GiST index on
+    tstzrange(date, ends_at) answers. Elsewhere `date` is bounded on both
+    sides so the (manager_id, date, ends_at) index gives a range scan, with
+    `ends_at` checked from the index entries.
+
+    Requests that have no date yet never overlap. tstzrange(NULL, NULL) is
+    the unbounded range, so they are excluded explicitly on both databases.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return and_(
+            Meeting.date.isnot(None),
+            Meeting.ends_at.isnot(None),
+            func.tstzrange(Meeting.date, Meeting.ends_at).op("&&")(func.tstzrange(start, end))
+        )
+    return and_(
+        Meeting.date.isnot(None),
+        Meeting.ends_at.isnot(None),
+        Meeting.date < end,
+        Meeting.date > start - timedelta(minutes=MAX_MEETING_MINUTES),
+        Meeting.ends_at > start
+    )
+
+def overlapping_meetings(
+    db: Session,
+    manager_id: int,
+    start: datetime,
+    end: datetime,
+    statuses: Optional[List[str]] = None,
+    query: Optional[Query] = None
+) -> Query:
+    """
+    Query a manager's one-off meetings that overlap [start, end)
+
+    Recurring series are not included; see overlapping_series.
+
+    Args:
+        db: Database session
+        manager_id: ID of the manager
+        start: Start of the range
+        end: End of the range
+        statuses: Statuses to include (defaults to BUSY_STATUSES)
+        query: Base query, for selecting specific columns (defaults to Meeting rows)
+
+    Returns:
+        Query: Overlapping meetings
+    """
+    query = query if query is not None else db.query(Meeting)
+    return query.filter(
+        Meeting.manager_id == manager_id,
+        Meeting.status.in_(statuses or BUSY_STATUSES),
+        Meeting.recurrence_rule.is_(None),
+        overlap_condition(db, start, end)
+    )
+
+def overlapping_series(
+    db: Session,
+    manager_id: int,
+    start: datetime,
+    end: datetime,
+    statuses: Optional[List[str]] = None,
+    query: Optional[Query] = None
+) -> Query:
+    """
+    Query a manager's recurring meetings that may have occurrences in [start, end)
+
+    Args:
+        db: Database session
+        manager_id: ID of the manager
+        start: Start of the range
+        end: End of the range
+        statuses: Statuses to include (defaults to BUSY_STATUSES)
+        query: Base query, e.g. selecting SERIES_COLUMNS (defaults to Meeting rows)
+
+    Returns:
+        Query: Candidate series, to be passed to expand_series
+    """
+    query = query if query is not None else db.query(Meeting)
+    return query.filter(
+        Meeting.manager_id == manager_id,
+        Meeting.recurrence_rule.isnot(None),
+        Meeting.status.in_(statuses or BUSY_STATUSES),
+        Meeting.date < end,
+        or_(
+            Meeting.recurrence_until.is_(None),
+            Meeting.recurrence_until > start - timedelta(minutes=MAX_MEETING_MINUTES)
+        )
+    )
+
+def expand_series(db: Session, series_rows: Iterable[Any], start: datetime, end: datetime) -> List[Tuple[Any, datetime, datetime]]:
+    """
+    Occurrences of recurring meetings overlapping [start, end)
+
+    Only occurrences inside the window are generated. Cancelled and moved
+    occurrences are applied from meeting_exceptions, loaded in one query.
+
+    Args:
+        db: Database session
+        series_rows: Rows with the SERIES_COLUMNS (duplicates are ignored)
+        start: Start of the window
+        end: End of the window
+
+    Returns:
+        List: (row, occurrence start, occurrence end), sorted by start
+    """
+    rows = {row.id: row for row in series_rows}
+    if not rows:
+        return []
+
+    lookback = start - timedelta(minutes=MAX_MEETING_MINUTES)
+    exceptions = {
+        (exception.meeting_id, exception.original_start): exception
+        for exception in db.query(MeetingException).filter(
+            MeetingException.meeting_id.in_(list(rows)),
+            or_(
+                and_(MeetingException.original_start > lookback, MeetingException.original_start < end),
+                and_(MeetingException.new_date > lookback, MeetingException.new_date < end)
+            )
+        )
+    }
+
+    occurrences = []
+    for row in rows.values():
+        series = Series(RecurrenceRule.parse(row.recurrence_rule), row.date, row.duration, row.recurrence_until)
+        for occurrence_start, occurrence_end in series.between(start, end):
+            if (row.id, occurrence_start) not in exceptions:
+                occurrences.append((row, occurrence_start, occurrence_end))
+
+    for exception in exceptions.values():
+        if exception.is_cancelled or exception.new_date is None:
+            continue
+        row = rows[exception.meeting_id]
+        moved_end = exception.new_date + timedelta(minutes=exception.new_duration or row.duration)
+        if exception.new_date < end and moved_end > start:
+            occurrences.append((row, exception.new_date, moved_end))
+
+    occurrences.sort(key=lambda item: item[1])
+    return occurrences
+
+def find_conflicts(
+    db: Session,
+    manager_id: int,
+    ranges: List[Tuple[datetime, datetime]],
+    employee_ids: Optional[List[int]] = None,
+    exclude_meeting_id: Optional[int] = None
+) -> Dict[str, List[int]]:
+    """
+    Find busy meetings that overlap any of the given ranges for a participant set
+
+    Employees only attend their own manager's meetings, so the manager's
+    overlap index covers the whole set: one range scan per requested range,
+    with attendance read from employee_meetings for the rows it returns.
+    Recurring series are fetched by a second query and expanded only
+    inside the checked ranges.
+
+    Args:
+        db: Database session
+        manager_id: ID of the manager
+        ranges: (start, end) pairs to check
+        employee_ids: IDs of the attending employees
+        exclude_meeting_id: Meeting being changed, which cannot conflict with itself
+
+    Returns:
+        Dict: Conflicting meeting IDs and the listed employees they involve
+    """
+    if not ranges:
+        return {"meeting_ids": [], "employee_ids": []}
+
+    attendee = (EmployeeMeeting.employee_id if employee_ids else null()).label("employee_id")
+
+    def for_participants(query: Query) -> Query:
+        if employee_ids:
+            query = query.outerjoin(EmployeeMeeting, and_(
+                EmployeeMeeting.meeting_id == Meeting.id,
+                EmployeeMeeting.employee_id.in_(employee_ids)
+            ))
+        if exclude_meeting_id is not None:
+            query = query.filter(Meeting.id != exclude_meeting_id)
+        return query
+
+    singles = for_participants(db.query(Meeting.id, attendee)).filter(
+        Meeting.manager_id == manager_id,
+        Meeting.status.in_(BUSY_STATUSES),
+        Meeting.recurrence_rule.is_(None),
+        or_(*(overlap_condition(db, start, end) for start, end in ranges))
+    )
+
+    meeting_ids, conflicted = set(), set()
+    for meeting_id, employee_id in singles.all():
+        meeting_ids.add(meeting_id)
+        if employee_id is not None:
+            conflicted.add(employee_id)
+
+    window_start = min(start for start, _ in ranges)
+    window_end = max(end for _, end in ranges)
+    series_rows = overlapping_series(
+        db, manager_id, window_start, window_end,
+        query=for_participants(db.query(*SERIES_COLUMNS, attendee))
+    ).all()
+
+    attendees = defaultdict(set)
+    for row in series_rows:
+        if row.employee_id is not None:
+            attendees[row.id].add(row.employee_id)
+    for row, occurrence_start, occurrence_end in expand_series(db, series_rows, window_start, window_end):
+        if any(occurrence_start < end and occurrence_end > start for start, end in ranges):
+            meeting_ids.add(row.id)
+            conflicted |= attendees[row.id]
+
+    return {"meeting_ids": sorted(meeting_ids), "employee_ids": sorted(conflicted)}
+
+def ensure_no_conflicts(
+    db: Session,
+    manager_id: int,
+    ranges: List[Tuple[datetime, datetime]],
+    employee_ids: Optional[List[int]] = None,
+    exclude_meeting_id: Optional[int] = None
+) -> None:
+    """
+    Raise a 409 if the participant set is already booked in any of the ranges
+
+    Raises:
+        MeetingConflictException: With the conflicting meeting and employee IDs
+    """
+    conflicts = find_conflicts(db, manager_id, ranges, employee_ids, exclude_meeting_id)
+    if conflicts["meeting_ids"]:
+        raise MeetingConflictException(conflicts["meeting_ids"], conflicts["employee_ids"])
+
+def backfill_meeting_end_times(db: Session) -> int:
+    """
+    Fill ends_at for meetings written before the column existed
+
+    Args:
+        db: Database session
+
+    Returns:
+        int: Number of meetings updated
+    """
+    rows = db.query(Meeting.id, Meeting.date, Meeting.duration, Meeting.version).filter(
+        Meeting.ends_at.is_(None),
+        Meeting.date.isnot(None),
+        Meeting.duration.isnot(None)
+    ).all()
+    if rows:
+        db.bulk_update_mappings(Meeting, [
+            # The version is checked and bumped like any ORM update
+            {"id": row.id, "version": row.version, "ends_at": meeting_end(row.date, row.duration)} for row in rows
+        ])
+    db.commit()
+    return len(rows)
+
+def set_meeting_status(
+    db: Session,
+    meeting_id: int,
+    new_status: str,
+    *conditions,
+    expected_versions: Optional[List[int]] = None,
+    **values
+) -> Optional[Any]:
+    """
+    Compare-and-set a meeting's status with one UPDATE ... RETURNING
+
+    The guard only matches statuses that MeetingStatusTransitionValidator
+    allows moving to `new_status` from, together with `conditions` (such as
+    ownership) and, if given, the versions an If-Match header accepts, so
+    concurrent changes cannot both pass. The version is bumped. Not committed.
+
+    Args:
+        db: Database session
+        meeting_id: ID of the meeting
+        new_status: Status to set
+        conditions: Extra WHERE clauses
+        expected_versions: Versions the meeting must be at (None for any)
+        values: Other columns to set
+
+    Returns:
+        Row: STATUS_CHANGE_COLUMNS after the change, or None if the guard did not match
+    """
+    guard = [
+        Meeting.id == meeting_id,
+        Meeting.status.in_(MeetingStatusTransitionValidator.sources_for(new_status)),
+        *conditions
+    ]
+    if expected_versions is not None:
+        guard.append(Meeting.version.in_(expected_versions))
+    return db.execute(
+        update(Meeting)
+        .where(*guard)
+        .values(status=new_status, version=Meeting.version + 1, **values)
+        .returning(*STATUS_CHANGE_COLUMNS)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+def status_change_error(
+    meeting_id: int,
+    current_status: str,
+    current_version: int,
+    new_status: str,
+    expected_versions: Optional[List[int]] = None
+) -> CustomException:
+    """Why set_meeting_status did not match a meeting the caller may change"""
+    if expected_versions is not None and current_version not in expected_versions:
+        return PreconditionFailedException("Meeting was modified since it was read", meeting_etag(meeting_id, current_version))
+    try:
+        MeetingStatusTransitionValidator.validate(current_status, new_status)
+    except ValueError as e:
+        return InvalidMeetingStatusException(str(e))
+    # The guard matched nothing yet the meeting allows it now: it changed in between
+    return PreconditionFailedException("Meeting was modified concurrently", meeting_etag(meeting_id, current_version))
@@ -0,0 +1,138 @@
+from typing import Dict, List
+import logging
+import re
+
+from sqlalchemy import and_, column, func, literal_column, or_, table, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Query, Session
+
+from app.database import Meeting, meeting_search_document
+
+logger = logging.getLogger(__name__)
+
+# Longer search strings are cut to this many terms
+MAX_SEARCH_TERMS = 8
+
+SEARCH_COLUMNS = (Meeting.title, Meeting.description, Meeting.client_name, Meeting.client_email)
+
+# SQLite: an external-content FTS5 table over meetings, kept in sync by triggers
+SQLITE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS meetings_fts USING fts5(
+        title, description, client_name, client_email,
+        content='meetings', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS meetings_fts_insert AFTER INSERT ON meetings BEGIN
+        INSERT INTO meetings_fts(rowid, title, description, client_name, client_email)
+        VALUES (new.id, new.title, new.description, new.client_name, new.client_email);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS meetings_fts_delete AFTER DELETE ON meetings BEGIN
+        INSERT INTO meetings_fts(meetings_fts, rowid, title, description, client_name, client_email)
+        VALUES ('delete', old.id, old.title, old.description, old.client_name, old.client_email);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS meetings_fts_update
+    AFTER UPDATE OF title, description, client_name, client_email ON meetings BEGIN
+        INSERT INTO meetings_fts(meetings_fts, rowid, title, description, client_name, client_email)
+        VALUES ('delete', old.id, old.title, old.description, old.client_name, old.client_email);
+        INSERT INTO meetings_fts(rowid, title, description, client_name, client_email)
+        VALUES (new.id, new.title, new.description, new.client_name, new.client_email);
+    END
+    """
+]
+
+MEETINGS_FTS = table("meetings_fts", column("rowid"), column("rank"))
+
+# Whether the FTS5 table exists, per database URL
+_sqlite_fts: Dict[str, bool] = {}
+
+def search_terms(search: str) -> List[str]:
+    """Words of a search string; punctuation (quotes, operators) is dropped"""
+    return re.findall(r"\w+", search or "")[:MAX_SEARCH_TERMS]
+
+def ensure_search_index(db: Session) -> None:
+    """
+    Create the SQLite full-text index and fill it for existing meetings
+
+    The Postgres GIN index is part of the model metadata; other databases
+    fall back to LIKE matching.
+
+    Args:
+        db: Database session
+    """
+    bind = db.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+
+    existed = _fts_table_exists(db)
+    try:
+        for statement in SQLITE_FTS_DDL:
+            db.execute(text(statement))
+        if not existed:
+            db.execute(text("INSERT INTO meetings_fts(meetings_fts) VALUES ('rebuild')"))
+        db.commit()
+    except OperationalError as e:
+        db.rollback()
+        logger.warning(f"FTS5 is not available, meeting search falls back to LIKE: {e}")
+        _sqlite_fts[str(bind.url)] = False
+        return
+    _sqlite_fts[str(bind.url)] = True
+
+def _fts_table_exists(db: Session) -> bool:
+    return db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meetings_fts'")
+    ).first() is not None
+
+def _has_sqlite_fts(db: Session) -> bool:
+    url = str(db.get_bind().url)
+    if url not in _sqlite_fts:
+        _sqlite_fts[url] = _fts_table_exists(db)
+    return _sqlite_fts[url]
+
+def apply_search(db: Session, query: Query, search: str) -> Query:
+    """
+    Restrict a meeting query to matches for a search string, best first
+
+    Matches every word (as a prefix) against the title, description, client
+    name and client email. Postgres uses the GIN tsvector index and SQLite
+    the FTS5 table, both ranked by relevance; elsewhere words are matched
+    with LIKE and results are not ranked. Callers add their own ordering
+    after this one as a tie-breaker.
+
+    Args:
+        db: Database session
+        query: Meeting query
+        search: Search string as typed by the user
+
+    Returns:
+        Query: Filtered and ordered query (unchanged if the string has no words)
+    """
+    terms = search_terms(search)
+    if not terms:
+        return query
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        document = meeting_search_document(*SEARCH_COLUMNS)
+        tsquery = func.to_tsquery(
+            literal_column("'simple'::regconfig"),
+            " & ".join(f"{term}:*" for term in terms)
+        )
+        return query.filter(document.op("@@")(tsquery)).order_by(func.ts_rank(document, tsquery).desc())
+
+    if dialect == "sqlite" and _has_sqlite_fts(db):
+        fts_query = " ".join(f'"{term}"*' for term in terms)
+        return (
+            query.join(MEETINGS_FTS, MEETINGS_FTS.c.rowid == Meeting.id)
+            .filter(text("meetings_fts MATCH :fts_query").bindparams(fts_query=fts_query))
+            .order_by(MEETINGS_FTS.c.rank)
+        )
+
+    return query.filter(and_(*(
+        or_(*(field.ilike(f"%{term}%") for field in SEARCH_COLUMNS)) for term in terms
+    )))
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+from typing import Dict
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import OneTimePassword, Employee
+from app.utils.security import hash_token
+
+logger = logging.getLogger(__name__)
+
+MANAGER_SIGNUP = "manager_signup"
+
+def store_otp(db: Session, email: str, purpose: str, otp: str) -> OneTimePassword:
+    """
+    Store a hashed OTP for an email and purpose, replacing any earlier one
+
+    The row is added to the session but not committed, so it is persisted
+    in the same transaction as the change that issued it.
+
+    Args:
+        db: Database session
+        email: Email address the OTP was sent to
+        purpose: What the OTP is for (e.g. MANAGER_SIGNUP)
+        otp: Plaintext OTP
+
+    Returns:
+        OneTimePassword: The pending OTP row
+    """
+    db.query(OneTimePassword).filter(
+        OneTimePassword.email == email,
+        OneTimePassword.purpose == purpose
+    ).delete(synchronize_session=False)
+
+    record = OneTimePassword(
+        email=email,
+        purpose=purpose,
+        code_hash=hash_token(otp),
+        expires_at=datetime.utcnow() + timedelta(minutes=settings.OTP_EXPIRE_MINUTES)
+    )
+    db.add(record)
+    return record
+
+def consume_otp(db: Session, email: str, purpose: str, otp: str) -> bool:
+    """
+    Check an OTP and delete it if it is valid
+
+    Uses the (email, purpose) index, so the lookup is a single index probe.
+    The deletion is not committed.
+
+    Args:
+        db: Database session
+        email: Email address the OTP was sent to
+        purpose: What the OTP is for
+        otp: Plaintext OTP supplied by the user
+
+    Returns:
+        bool: True if a matching, unexpired OTP was found
+    """
+    deleted = db.query(OneTimePassword).filter(
+        OneTimePassword.email == email,
+        OneTimePassword.purpose == purpose,
+        OneTimePassword.code_hash == hash_token(otp),
+        OneTimePassword.expires_at > datetime.utcnow()
+    ).delete(synchronize_session=False)
+    return deleted > 0
+
+def sweep_expired_verifications(db: Session) -> Dict[str, int]:
+    """
+    Remove expired OTPs and clear expired employee verification tokens
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dict: Number of OTPs deleted and employee tokens cleared
+    """
+    now = datetime.utcnow()
+
+    otps = db.query(OneTimePassword).filter(
+        OneTimePassword.expires_at <= now
+    ).delete(synchronize_session=False)
+
+    tokens = db.query(Employee).filter(
+        Employee.verification_token_hash.isnot(None),
+        Employee.token_expiry <= now
+    ).update(
+        {Employee.verification_token_hash: None, Employee.token_expiry: None},
+        synchronize_session=False
+    )
+
+    db.commit()
+
+    if otps or tokens:
+        logger.info(f"Swept {otps} expired OTPs and {tokens} expired verification tokens")
+
+    return {"otps": otps, "verification_tokens": tokens}
@@ -0,0 +1,301 @@
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+import json
+import logging
+import random
+import threading
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.data import SessionLocal
+from app.database import EmailOutbox
+from app.utils.email import build_message, render_digest
+from app.utils.circuit_breaker import HALF_OPEN
+from app.utils.fanout import FanoutReport, fan_out
+from app.utils.smtp_pool import smtp_breaker
+
+logger = logging.getLogger(__name__)
+
+class OutboxMetrics:
+    """Process-local delivery counters for the email outbox"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {"sent": 0, "failed_attempts": 0, "retried": 0, "dead": 0, "coalesced": 0}
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters)
+
+metrics = OutboxMetrics()
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff with jitter for the given number of failed attempts"""
+    delay = min(settings.EMAIL_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.EMAIL_RETRY_MAX_SECONDS)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+def claim_batch(db: Session, limit: int) -> List[EmailOutbox]:
+    """
+    Claim a batch of due outbox rows for this worker
+
+    Rows are marked "sending" with a conditional UPDATE, so concurrent
+    workers never claim the same row. Rows left in "sending" by a worker
+    that died are released once their lease runs out.
+
+    Args:
+        db: Database session
+        limit: Maximum number of rows to claim
+
+    Returns:
+        List: Claimed outbox rows
+    """
+    now = datetime.utcnow()
+
+    db.execute(
+        update(EmailOutbox)
+        .where(
+            EmailOutbox.status == "sending",
+            EmailOutbox.locked_at < now - timedelta(seconds=settings.EMAIL_SENDING_LEASE_SECONDS)
+        )
+        .values(status="pending", locked_at=None)
+    )
+
+    due_ids = [row.id for row in db.query(EmailOutbox.id).filter(
+        EmailOutbox.status == "pending",
+        EmailOutbox.next_attempt_at <= now
+    ).order_by(EmailOutbox.next_attempt_at).limit(limit).with_for_update(skip_locked=True).all()]
+
+    if not due_ids:
+        db.commit()
+        return []
+
+    claimed_ids = [row.id for row in db.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.id.in_(due_ids), EmailOutbox.status == "pending")
+        .values(status="sending", locked_at=now)
+        .returning(EmailOutbox.id)
+    )]
+    db.commit()
+
+    if not claimed_ids:
+        return []
+    return db.query(EmailOutbox).filter(EmailOutbox.id.in_(claimed_ids)).all()
+
+def _notifications(entry: EmailOutbox) -> List[Dict[str, Any]]:
+    """Digest payloads carried by an outbox row (a digest row carries several)"""
+    if not entry.payload:
+        return [{"category": entry.category, "meeting_id": None, "title": entry.subject, "summary": entry.subject}]
+    payload = json.loads(entry.payload)
+    if isinstance(payload, list):
+        return payload
+    return [dict(payload, category=entry.category)]
+
+def coalesce_batch(db: Session, batch: List[EmailOutbox]) -> List[EmailOutbox]:
+    """
+    Merge pending notifications per recipient into a single digest
+
+    For each recipient with a digestible row in the batch, every other
+    due, pending digestible row for that recipient is claimed as
+    "coalesced" and folded into one digest email sent in place of the
+    first row. Rows still inside their digest window are left for a later
+    digest, so a failed digest never takes undelivered updates with it.
+
+    Args:
+        db: Database session
+        batch: Claimed outbox rows
+
+    Returns:
+        List: Rows to deliver
+    """
+    groups: Dict[str, List[EmailOutbox]] = {}
+    for entry in batch:
+        if entry.category:
+            groups.setdefault(entry.recipient, []).append(entry)
+    if not groups:
+        return batch
+
+    now = datetime.utcnow()
+    dropped = set()
+    for recipient, entries in groups.items():
+        absorbed_ids = [row.id for row in db.execute(
+            update(EmailOutbox)
+            .where(
+                EmailOutbox.recipient == recipient,
+                EmailOutbox.status == "pending",
+                EmailOutbox.category.isnot(None),
+                EmailOutbox.next_attempt_at <= now
+            )
+            .values(status="coalesced", locked_at=now)
+            .returning(EmailOutbox.id)
+        )]
+        absorbed = db.query(EmailOutbox).filter(EmailOutbox.id.in_(absorbed_ids)).all() if absorbed_ids else []
+
+        group = sorted(entries + absorbed, key=lambda row: row.id)
+        if len(group) == 1:
+            continue
+
+        notifications = [notification for row in group for notification in _notifications(row)]
+        digest = render_digest(notifications)
+
+        primary = entries[0]
+        primary.subject = digest.subject
+        primary.html_content = digest.html_content
+        primary.text_content = digest.text_content
+        primary.payload = json.dumps(notifications, default=str)
+
+        for row in entries[1:]:
+            row.status = "coalesced"
+            dropped.add(row.id)
+        metrics.incr("coalesced", len(group) - 1)
+
+    db.commit()
+    return [entry for entry in batch if entry.id not in dropped]
+
+def record_success(entry: EmailOutbox) -> None:
+    entry.status = "sent"
+    entry.sent_at = datetime.utcnow()
+    entry.locked_at = None
+    entry.last_error = None
+    metrics.incr("sent")
+
+def record_failure(entry: EmailOutbox, error: str) -> None:
+    entry.attempts += 1
+    entry.last_error = error
+    entry.locked_at = None
+    metrics.incr("failed_attempts")
+
+    if entry.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+        entry.status = "dead"
+        metrics.incr("dead")
+        logger.error(f"Email {entry.id} to {entry.recipient} moved to dead letter after {entry.attempts} attempts: {error}")
+    else:
+        entry.status = "pending"
+        entry.next_attempt_at = datetime.utcnow() + retry_delay(entry.attempts)
+        metrics.incr("retried")
+        logger.warning(f"Email {entry.id} to {entry.recipient} failed (attempt {entry.attempts}), retrying: {error}")
+
+def record_late_results(batch: List[EmailOutbox]) -> Callable[[FanoutReport], None]:
+    """
+    Callback recording the outcome of rows whose fan-out worker overran
+
+    Those rows were left in "sending". Once the worker finishes they are
+    updated in a session of their own, unless the sending lease has already
+    released them to another worker.
+    """
+    claims = [(entry.id, entry.locked_at) for entry in batch]
+
+    def record(report: FanoutReport) -> None:
+        db = SessionLocal()
+        try:
+            ids = [claims[index][0] for index in report.sent + report.timed_out + list(report.failed)]
+            entries = {
+                entry.id: entry for entry in db.query(EmailOutbox).filter(
+                    EmailOutbox.id.in_(ids), EmailOutbox.status == "sending"
+                )
+            }
+
+            # Skip rows the lease has since handed to another worker
+            owned = {}
+            for index, (entry_id, locked_at) in enumerate(claims):
+                entry = entries.get(entry_id)
+                if entry is not None and entry.locked_at == locked_at:
+                    owned[index] = entry
+
+            for index in report.sent:
+                if index in owned:
+                    record_success(owned[index])
+            for index, error in report.failed.items():
+                if index in owned:
+                    record_failure(owned[index], error)
+            for index in report.timed_out:
+                if index in owned:
+                    record_failure(owned[index], "Timed out waiting for SMTP delivery")
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to record late email results: {str(e)}")
+        finally:
+            db.close()
+
+    return record
+
+def deliver_pending(db: Session) -> int:
+    """
+    Deliver due outbox emails until none are left
+
+    Args:
+        db: Database session
+
+    Returns:
+        int: Number of emails processed
+    """
+    processed = 0
+    while True:
+        # While SMTP is down, rows simply wait in the outbox without
+        # spending their attempts; a half-open circuit sends one probe
+        if not smtp_breaker.allow_request():
+            return processed
+        probing = smtp_breaker.state == HALF_OPEN
+
+        batch = claim_batch(db, 1 if probing else settings.EMAIL_OUTBOX_BATCH_SIZE)
+        if not batch:
+            if probing:
+                smtp_breaker.release_probe()
+            return processed
+
+        batch = coalesce_batch(db, batch)
+
+        # Spread the batch over several pooled SMTP sessions
+        messages = [
+            (entry.recipient, build_message(
+                entry.recipient, entry.subject, entry.html_content, entry.text_content
+            ).as_string())
+            for entry in batch
+        ]
+        report = fan_out(settings.EMAIL_FROM, messages, on_unfinished=record_late_results(batch))
+        if report.outages and not report.sent:
+            smtp_breaker.record_failure()
+        else:
+            smtp_breaker.record_success()
+
+        for index in report.sent:
+            record_success(batch[index])
+        for index, error in report.failed.items():
+            record_failure(batch[index], error)
+        for index in report.timed_out:
+            record_failure(batch[index], "Timed out waiting for SMTP delivery")
+        # Rows whose worker is still sending stay claimed until it finishes
+        # (see record_late_results), so they are not sent twice
+        db.commit()
+        processed += len(batch)
+
+def get_outbox_metrics(db: Session) -> Dict[str, Any]:
+    """
+    Get outbox delivery counters and current queue depth
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dict: Counters for this process and row counts per status
+    """
+    queue = dict(db.query(EmailOutbox.status, func.count(EmailOutbox.id)).group_by(EmailOutbox.status).all())
+
+    return {
+        "workers": settings.EMAIL_OUTBOX_WORKERS,
+        "counters": metrics.snapshot(),
+        "smtp_circuit": smtp_breaker.snapshot(),
+        "queue": {
+            "pending": queue.get("pending", 0),
+            "sending": queue.get("sending", 0),
+            "sent": queue.get("sent", 0),
+            "coalesced": queue.get("coalesced", 0),
+            "dead": queue.get("dead", 0)
+        }
+    }
@@ -0,0 +1,111 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, literal, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.database import EmployeeMeeting, Meeting, MeetingParticipant, ProposedDate, UserType
+
+ORGANIZER = "organizer"
+REQUESTER = "requester"
+ATTENDEE = "attendee"
+
+def participant_rows(
+    meeting_id: int,
+    manager_id: int,
+    date: Optional[datetime],
+    requester_id: Optional[int] = None,
+    attendee_ids: Iterable[int] = ()
+) -> List[Dict[str, Any]]:
+    """
+    meeting_participants rows for a new meeting
+
+    Args:
+        meeting_id: ID of the meeting
+        manager_id: ID of the manager who owns it
+        date: Meeting date (for requests, the earliest proposed date)
+        requester_id: ID of the employee who requested it, if any
+        attendee_ids: IDs of the attending employees
+
+    Returns:
+        List: Rows for add_participants
+    """
+    rows = [{
+        "user_type": UserType.MANAGER.value, "user_id": manager_id,
+        "meeting_id": meeting_id, "role": ORGANIZER, "date": date
+    }]
+    employees = {}
+    for employee_id in attendee_ids:
+        employees[employee_id] = ATTENDEE
+    if requester_id is not None:
+        employees[requester_id] = REQUESTER
+    rows.extend(
+        {
+            "user_type": UserType.EMPLOYEE.value, "user_id": employee_id,
+            "meeting_id": meeting_id, "role": role, "date": date
+        }
+        for employee_id, role in employees.items()
+    )
+    return rows
+
+def add_participants(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """Insert participant rows with one multi-row INSERT (not committed)"""
+    if rows:
+        db.execute(insert(MeetingParticipant), rows)
+
+def set_participant_date(db: Session, meeting_id: int, date: Optional[datetime]) -> None:
+    """Copy a meeting's new date to its participant rows (not committed)"""
+    db.execute(
+        update(MeetingParticipant)
+        .where(MeetingParticipant.meeting_id == meeting_id)
+        .values(date=date)
+        .execution_options(synchronize_session=False)
+    )
+
+def remove_participant(db: Session, user_type: str, user_id: int) -> None:
+    """Drop a deleted user's participant rows (not committed)"""
+    db.execute(
+        delete(MeetingParticipant)
+        .where(MeetingParticipant.user_type == user_type, MeetingParticipant.user_id == user_id)
+        .execution_options(synchronize_session=False)
+    )
+
+def backfill_participants(db: Session) -> int:
+    """
+    Fill meeting_participants for meetings written before it existed
+
+    Runs only while the table is empty, with three INSERT ... SELECTs.
+
+    Args:
+        db: Database session
+
+    Returns:
+        int: Number of rows inserted
+    """
+    if db.query(MeetingParticipant.id).first() is not None:
+        return 0
+
+    first_proposed = select(func.min(ProposedDate.date)).where(
+        ProposedDate.meeting_id == Meeting.id
+    ).scalar_subquery()
+    meeting_date = func.coalesce(Meeting.date, first_proposed)
+    columns = ["user_type", "user_id", "meeting_id", "role", "date"]
+
+    inserted = 0
+    inserted += db.execute(insert(MeetingParticipant).from_select(columns, select(
+        literal(UserType.MANAGER.value), Meeting.manager_id, Meeting.id, literal(ORGANIZER), meeting_date
+    ).where(Meeting.manager_id.isnot(None)))).rowcount
+    inserted += db.execute(insert(MeetingParticipant).from_select(columns, select(
+        literal(UserType.EMPLOYEE.value), Meeting.created_by_id, Meeting.id, literal(REQUESTER), meeting_date
+    ).where(Meeting.created_by_type == UserType.EMPLOYEE.value))).rowcount
+    inserted += db.execute(insert(MeetingParticipant).from_select(columns, select(
+        literal(UserType.EMPLOYEE.value), EmployeeMeeting.employee_id, Meeting.id, literal(ATTENDEE), meeting_date
+    ).join(Meeting, EmployeeMeeting.meeting_id == Meeting.id).where(
+        # The requester already has a row
+        or_(
+            Meeting.created_by_type.is_distinct_from(UserType.EMPLOYEE.value),
+            Meeting.created_by_id != EmployeeMeeting.employee_id
+        )
+    ).distinct())).rowcount
+    db.commit()
+    return inserted
@@ -0,0 +1,119 @@
+from datetime import datetime
+from typing import Dict, Optional
+import logging
+
+from sqlalchemy import exists, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import Employee, Meeting, MeetingStatus, ProposedDate, UserType
+from app.utils.calendar_feed import bump_calendar_versions
+from app.utils.email import send_meeting_status_update
+from app.utils.response_cache import meeting_list_cache
+
+logger = logging.getLogger(__name__)
+
+# ProposedDate.status values
+OPEN = "pending"
+EXPIRED = "expired"
+
+AUTO_CANCEL_REASON = "None of the proposed dates are still available"
+
+def is_open(now: Optional[datetime] = None):
+    """Condition for proposed dates that can still be selected"""
+    return (ProposedDate.status == OPEN) & (ProposedDate.date > (now or datetime.utcnow()))
+
+def sweep_expired_proposed_dates(db: Session) -> Dict[str, int]:
+    """
+    Expire past proposed dates and cancel requests left without any
+
+    Proposed dates that have passed without being selected are marked
+    expired. Pending requests that still have no date and no open proposed
+    date are cancelled, and their requesters are notified. Both steps are
+    set-based UPDATEs on the (status, date) index, each capped at
+    PROPOSED_DATE_SWEEP_BATCH_SIZE rows per run. The meeting lists of
+    affected managers are invalidated.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dict: Number of proposed dates expired and requests cancelled
+    """
+    now = datetime.utcnow()
+
+    due = select(ProposedDate.id).where(
+        ProposedDate.status == OPEN,
+        ProposedDate.date <= now,
+        ProposedDate.is_selected.isnot(True)
+    ).order_by(ProposedDate.date).limit(settings.PROPOSED_DATE_SWEEP_BATCH_SIZE)
+
+    expired = db.scalars(
+        update(ProposedDate)
+        .where(ProposedDate.id.in_(due), ProposedDate.status == OPEN)
+        .values(status=EXPIRED, updated_at=now)
+        .returning(ProposedDate.meeting_id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    expired_managers = {
+        row.manager_id for row in db.query(Meeting.manager_id).filter(Meeting.id.in_(set(expired))).distinct()
+    } if expired else set()
+
+    stranded = db.query(Meeting.id).filter(
+        Meeting.status == MeetingStatus.PENDING.value,
+        Meeting.date.is_(None),
+        Meeting.created_by_type == UserType.EMPLOYEE.value,
+        ~exists().where(ProposedDate.meeting_id == Meeting.id, ProposedDate.status == OPEN)
+    ).order_by(Meeting.id).limit(settings.PROPOSED_DATE_SWEEP_BATCH_SIZE)
+
+    cancelled = db.execute(
+        update(Meeting)
+        .where(
+            Meeting.id.in_([row.id for row in stranded]),
+            # Repeated so a request picked up concurrently is left alone
+            Meeting.status == MeetingStatus.PENDING.value,
+            Meeting.date.is_(None)
+        )
+        .values(
+            status=MeetingStatus.CANCELLED.value,
+            rejection_reason=AUTO_CANCEL_REASON,
+            updated_at=now,
+            version=Meeting.version + 1
+        )
+        .returning(Meeting.id, Meeting.title, Meeting.manager_id, Meeting.created_by_id)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    requesters = dict(
+        db.query(Employee.id, Employee.email).filter(
+            Employee.id.in_({row.created_by_id for row in cancelled})
+        ).all()
+    ) if cancelled else {}
+    for row in cancelled:
+        if row.created_by_id in requesters:
+            send_meeting_status_update(
+                db,
+                requesters[row.created_by_id],
+                row.title,
+                None,
+                MeetingStatus.CANCELLED.value,
+                AUTO_CANCEL_REASON,
+                meeting_id=row.id
+            )
+    if cancelled:
+        bump_calendar_versions(db, sorted(
+            {(UserType.MANAGER.value, row.manager_id) for row in cancelled}
+            | {(UserType.EMPLOYEE.value, row.created_by_id) for row in cancelled}
+        ))
+
+    db.commit()
+
+    # Requests without a date hold no busy time or reminders; only the lists
+    # change (they show each proposed date's status)
+    for manager_id in expired_managers | {row.manager_id for row in cancelled}:
+        meeting_list_cache.bump(manager_id)
+
+    if expired or cancelled:
+        logger.info(f"Expired {len(expired)} proposed dates and cancelled {len(cancelled)} requests without options")
+
+    return {"proposed_dates": len(expired), "cancelled_requests": len(cancelled)}
@@ -0,0 +1,214 @@
+from calendar import monthrange
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional, Tuple
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+# Upper bound for COUNT, which keeps computing the end of a series cheap
+MAX_COUNT = 1000
+# Upper bound for INTERVAL; together with MAX_COUNT it keeps most series within datetime's range
+MAX_INTERVAL = 365
+
+Occurrence = Tuple[datetime, datetime]
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """
+    The supported RRULE subset
+
+    FREQ=DAILY|WEEKLY|MONTHLY, INTERVAL, COUNT or UNTIL, and BYDAY (weekly
+    only, plain weekday codes). Monthly rules repeat on the start's day of
+    month and skip months that do not have it.
+    """
+    freq: str
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+    byday: Tuple[int, ...] = ()
+
+    @classmethod
+    def parse(cls, rule: str) -> "RecurrenceRule":
+        """
+        Parse an RRULE string such as "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10"
+
+        Raises:
+            ValueError: If the rule is malformed or outside the supported subset
+        """
+        parts = {}
+        for part in rule.strip().removeprefix("RRULE:").split(";"):
+            if not part:
+                continue
+            name, _, value = part.partition("=")
+            if not value:
+                raise ValueError(f"Invalid recurrence rule part: {part}")
+            parts[name.upper()] = value.upper()
+
+        freq = parts.pop("FREQ", None)
+        if freq not in FREQUENCIES:
+            raise ValueError(f"FREQ must be one of {', '.join(FREQUENCIES)}")
+
+        try:
+            interval = int(parts.pop("INTERVAL", "1"))
+            count = int(parts.pop("COUNT")) if "COUNT" in parts else None
+        except ValueError:
+            raise ValueError("INTERVAL and COUNT must be integers")
+        if not 1 <= interval <= MAX_INTERVAL:
+            raise ValueError(f"INTERVAL must be between 1 and {MAX_INTERVAL}")
+        if count is not None and not 1 <= count <= MAX_COUNT:
+            raise ValueError(f"COUNT must be between 1 and {MAX_COUNT}")
+
+        until = None
+        if "UNTIL" in parts:
+            value = parts.pop("UNTIL").rstrip("Z")
+            try:
+                until = datetime.strptime(value, "%Y%m%dT%H%M%S" if "T" in value else "%Y%m%d")
+            except ValueError:
+                raise ValueError("UNTIL must look like 20301231 or 20301231T235959Z")
+            if "T" not in value:
+                until = until.replace(hour=23, minute=59, second=59)
+        if count is not None and until is not None:
+            raise ValueError("COUNT and UNTIL cannot be combined")
+
+        byday: Tuple[int, ...] = ()
+        if "BYDAY" in parts:
+            if freq != "WEEKLY":
+                raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+            codes = parts.pop("BYDAY").split(",")
+            if any(code not in WEEKDAYS for code in codes):
+                raise ValueError(f"BYDAY values must be among {', '.join(WEEKDAYS)}")
+            byday = tuple(sorted({WEEKDAYS.index(code) for code in codes}))
+
+        if parts:
+            raise ValueError(f"Unsupported recurrence rule parts: {', '.join(sorted(parts))}")
+        return cls(freq, interval, count, until, byday)
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.byday:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in self.byday))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until.strftime('%Y%m%dT%H%M%SZ')}")
+        return ";".join(parts)
+
+def align(value: Optional[datetime], reference: datetime) -> Optional[datetime]:
+    """
+    `value` in the same convention as `reference`
+
+    Naive datetimes are UTC throughout the app, but timezone-aware columns
+    come back aware on Postgres. Aware values are converted to naive UTC
+    for a naive reference, and naive values are marked UTC for an aware one.
+    """
+    if value is None:
+        return None
+    if reference.tzinfo is None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo is not None else value
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+class Series:
+    """
+    Occurrences of a recurring meeting, generated on demand
+
+    Lookups jump straight to the period containing the requested window,
+    so the cost depends on the window, not on how long the series has run.
+    Every datetime passed in is aligned with `dtstart` (see `align`), and
+    occurrences are returned in its convention.
+    """
+
+    def __init__(self, rule: RecurrenceRule, dtstart: datetime, duration_minutes: int, last_start: Optional[datetime] = None):
+        self.rule = rule
+        self.dtstart = dtstart
+        self.duration = timedelta(minutes=duration_minutes)
+        self.last_start = align(last_start, dtstart) if last_start is not None else self.compute_last_start()
+
+    @classmethod
+    def from_meeting(cls, meeting) -> "Series":
+        return cls(RecurrenceRule.parse(meeting.recurrence_rule), meeting.date, meeting.duration, meeting.recurrence_until)
+
+    def _week_start(self) -> datetime:
+        return self.dtstart - timedelta(days=self.dtstart.weekday())
+
+    def _period_of(self, moment: datetime) -> int:
+        """Index of the period containing `moment` (may be negative)"""
+        rule = self.rule
+        if rule.freq == "DAILY":
+            return (moment - self.dtstart) // timedelta(days=rule.interval)
+        if rule.freq == "WEEKLY":
+            week_start = self._week_start().replace(hour=0, minute=0, second=0, microsecond=0)
+            return (moment - week_start) // timedelta(weeks=rule.interval)
+        months = (moment.year - self.dtstart.year) * 12 + moment.month - self.dtstart.month
+        return months // rule.interval
+
+    def _candidates(self, period: int) -> List[datetime]:
+        """Occurrence starts in a period, before COUNT/UNTIL are applied"""
+        rule = self.rule
+        if rule.freq == "DAILY":
+            starts = [self.dtstart + timedelta(days=period * rule.interval)]
+        elif rule.freq == "WEEKLY":
+            if not rule.byday:
+                starts = [self.dtstart + timedelta(weeks=period * rule.interval)]
+            else:
+                week = self._week_start() + timedelta(weeks=period * rule.interval)
+                starts = [week + timedelta(days=day) for day in rule.byday]
+        else:
+            months = self.dtstart.month - 1 + period * rule.interval
+            year, month = self.dtstart.year + months // 12, months % 12 + 1
+            if self.dtstart.day > monthrange(year, month)[1]:
+                return []
+            starts = [self.dtstart.replace(year=year, month=month)]
+        return [start for start in starts if start >= self.dtstart]
+
+    def compute_last_start(self) -> Optional[datetime]:
+        """
+        Start of the final occurrence, or None for a series without end
+
+        Raises:
+            ValueError: If the series runs past the last representable date
+        """
+        if self.rule.until is not None:
+            return align(self.rule.until, self.dtstart)
+        if self.rule.count is None:
+            return None
+        remaining, period, last = self.rule.count, 0, None
+        try:
+            while remaining:
+                for start in self._candidates(period)[:remaining]:
+                    last = start
+                    remaining -= 1
+                period += 1
+        except (OverflowError, ValueError):
+            raise ValueError("The recurrence runs past the last supported date")
+        return last
+
+    def between(self, start: datetime, end: datetime, reverse: bool = False) -> Iterator[Occurrence]:
+        """
+        Occurrences overlapping [start, end), lazily
+
+        Args:
+            start: Start of the window
+            end: End of the window
+            reverse: Latest first
+
+        Yields:
+            tuple: (occurrence start, occurrence end)
+        """
+        start, end = align(start, self.dtstart), align(end, self.dtstart)
+        earliest = start - self.duration
+        latest = end if self.last_start is None else min(end, self.last_start + timedelta(microseconds=1))
+        if latest <= self.dtstart:
+            return
+        first, last = max(self._period_of(earliest), 0), self._period_of(latest)
+        periods = range(last, first - 1, -1) if reverse else range(first, last + 1)
+        for period in periods:
+            candidates = self._candidates(period)
+            for occurrence in (reversed(candidates) if reverse else candidates):
+                if earliest < occurrence < latest:
+                    yield occurrence, occurrence + self.duration
+
+    def occurs_at(self, moment: datetime) -> bool:
+        moment = align(moment, self.dtstart)
+        return any(start == moment for start, _ in self.between(moment, moment + timedelta(microseconds=1)))
@@ -0,0 +1,273 @@
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+import threading
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import Employee, Manager, Meeting, MeetingStatus, UserType
+from app.utils.email import send_meeting_reminder
+from app.utils.fanout import attendees_by_meeting
+
+Slot = Dict[int, int]  # meeting ID -> due tick
+
+def _timestamp(moment: datetime) -> float:
+    """Seconds since the epoch; naive datetimes are UTC, as stored"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+class TimingWheel:
+    """
+    Two-level hierarchical timing wheel keyed by meeting ID
+
+    Level 0 has one slot per tick for the next `inner_slots` ticks; level 1
+    has one slot per `inner_slots` ticks for the rest of the horizon. Each
+    tick empties one level-0 slot, and once per level-0 rotation the next
+    level-1 slot is spread over level 0, so a tick costs O(1) plus the
+    entries it fires or cascades, however many are scheduled. Scheduling
+    and cancelling are O(1) via the slot index kept per meeting.
+    Entries due past the horizon are not kept.
+    """
+
+    def __init__(self, tick_seconds: int, inner_slots: int, outer_slots: int):
+        self.tick_seconds = tick_seconds
+        self.inner_slots = inner_slots
+        self.outer_slots = outer_slots
+        self.horizon_ticks = inner_slots * outer_slots
+        self.clear(0)
+
+    def clear(self, current_tick: int) -> None:
+        self.current_tick = current_tick
+        self._levels: Tuple[List[Slot], List[Slot]] = (
+            [{} for _ in range(self.inner_slots)],
+            [{} for _ in range(self.outer_slots)]
+        )
+        self._where: Dict[int, Tuple[int, int]] = {}
+        self._overdue: Slot = {}
+
+    def tick_at(self, moment: datetime) -> int:
+        return int(_timestamp(moment) // self.tick_seconds)
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def schedule(self, key: int, due_tick: int) -> bool:
+        """(Re)schedule an entry; returns False if it is past the horizon"""
+        self.cancel(key)
+        delta = due_tick - self.current_tick
+        if delta >= self.horizon_ticks:
+            return False
+        if delta <= 0:
+            slot = (-1, 0)
+            self._overdue[key] = due_tick
+        elif delta < self.inner_slots:
+            slot = (0, due_tick % self.inner_slots)
+        else:
+            slot = (1, (due_tick // self.inner_slots) % self.outer_slots)
+        if slot[0] >= 0:
+            self._levels[slot[0]][slot[1]][key] = due_tick
+        self._where[key] = slot
+        return True
+
+    def cancel(self, key: int) -> None:
+        slot = self._where.pop(key, None)
+        if slot is None:
+            return
+        level, index = slot
+        if level < 0:
+            self._overdue.pop(key, None)
+        else:
+            self._levels[level][index].pop(key, None)
+
+    def _take_overdue(self) -> List[int]:
+        due = list(self._overdue)
+        for key in due:
+            del self._where[key]
+        self._overdue = {}
+        return due
+
+    def advance(self, to_tick: int) -> List[int]:
+        """Move the wheel up to `to_tick`, returning the keys that came due"""
+        due = self._take_overdue()
+        while self.current_tick < to_tick:
+            self.current_tick += 1
+            if self.current_tick % self.inner_slots == 0:
+                # Spread the level-1 slot that starts now over level 0
+                outer = self._levels[1][(self.current_tick // self.inner_slots) % self.outer_slots]
+                cascaded = list(outer.items())
+                outer.clear()
+                for key, due_tick in cascaded:
+                    del self._where[key]
+                    self.schedule(key, due_tick)
+                due.extend(self._take_overdue())
+
+            inner = self._levels[0][self.current_tick % self.inner_slots]
+            if inner:
+                for key in inner:
+                    del self._where[key]
+                due.extend(inner)
+                inner.clear()
+        return due
+
+class ReminderScheduler:
+    """
+    Sends reminder emails `lead_minutes` before accepted meetings
+
+    Only meetings starting within the wheel's horizon (24 hours by default)
+    are held in memory. They are loaded with one range query on the date
+    index at start-up and again every `reload_seconds`, which also picks up
+    changes made by other processes; write paths keep it current in between
+    through `apply_meeting`. Whether a reminder is still wanted is checked
+    against the database when it fires, and `reminder_sent_at` is set with
+    a conditional UPDATE so each meeting is reminded once across processes.
+    Recurring series are not reminded.
+    """
+
+    def __init__(self, lead_minutes: int = 30, tick_seconds: int = 60, horizon_hours: int = 24, reload_seconds: float = 3600):
+        if 3600 % tick_seconds:
+            raise ValueError("tick_seconds must divide an hour evenly")
+        self.lead = timedelta(minutes=lead_minutes)
+        self.reload_seconds = reload_seconds
+        self.wheel = TimingWheel(tick_seconds, 3600 // tick_seconds, horizon_hours)
+        self._lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self.sent = 0
+
+    def _due_tick(self, meeting_date: datetime) -> int:
+        return self.wheel.tick_at(meeting_date - self.lead)
+
+    def load(self, db: Session, now: Optional[datetime] = None) -> int:
+        """Refill the wheel with the meetings whose reminder falls within the horizon"""
+        now = now or datetime.utcnow()
+        horizon = now + self.lead + timedelta(seconds=self.wheel.horizon_ticks * self.wheel.tick_seconds)
+        rows = db.query(Meeting.id, Meeting.date).filter(
+            Meeting.date > now,
+            Meeting.date < horizon,
+            Meeting.status == MeetingStatus.ACCEPTED.value,
+            Meeting.reminder_sent_at.is_(None),
+            Meeting.recurrence_rule.is_(None)
+        ).all()
+        with self._lock:
+            self.wheel.clear(self.wheel.tick_at(now))
+            for row in rows:
+                self.wheel.schedule(row.id, self._due_tick(row.date))
+            self._loaded_at = monotonic()
+            return len(self.wheel)
+
+    def apply(self, meeting_id: int, meeting_date: Optional[datetime], status: str, recurring: bool = False) -> None:
+        """
+        Schedule, move or drop a meeting's reminder after it was written
+
+        Call after the change is committed.
+        """
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            if meeting_date is None or recurring or status != MeetingStatus.ACCEPTED.value:
+                self.wheel.cancel(meeting_id)
+                return
+            self.wheel.schedule(meeting_id, self._due_tick(meeting_date))
+
+    def apply_meeting(self, meeting: Meeting) -> None:
+        status = getattr(meeting.status, "value", meeting.status)
+        self.apply(meeting.id, meeting.date, status, recurring=bool(meeting.recurrence_rule))
+
+    def invalidate(self) -> None:
+        """Reload from the database on the next tick"""
+        with self._lock:
+            self._loaded_at = None
+
+    def run(self, db: Session) -> int:
+        """Periodic task: advance the wheel and send the reminders that came due"""
+        now = datetime.utcnow()
+        with self._lock:
+            stale = (
+                self._loaded_at is None
+                or monotonic() - self._loaded_at >= self.reload_seconds
+                # Asleep for longer than the horizon: reload rather than replay every tick
+                or self.wheel.tick_at(now) - self.wheel.current_tick > self.wheel.horizon_ticks
+            )
+        if stale:
+            self.load(db, now)
+        with self._lock:
+            due = self.wheel.advance(self.wheel.tick_at(now))
+        return self.dispatch(db, due, now) if due else 0
+
+    def dispatch(self, db: Session, meeting_ids: List[int], now: datetime) -> int:
+        """
+        Queue reminders for meetings that came due, if they still need one
+
+        Args:
+            db: Database session
+            meeting_ids: IDs of the meetings that came due
+            now: Current time (naive UTC)
+
+        Returns:
+            int: Number of meetings reminded
+        """
+        rows = db.query(
+            Meeting.id, Meeting.title, Meeting.date, Meeting.location, Meeting.manager_id,
+            Meeting.created_by_id, Meeting.created_by_type
+        ).filter(
+            Meeting.id.in_(meeting_ids),
+            Meeting.status == MeetingStatus.ACCEPTED.value,
+            Meeting.reminder_sent_at.is_(None),
+            Meeting.recurrence_rule.is_(None),
+            Meeting.date > now
+        ).all()
+
+        # Moved later by another process: put them back
+        now_tick = self.wheel.tick_at(now)
+        early = {row.id: row.date for row in rows if self._due_tick(row.date) > now_tick}
+        if early:
+            with self._lock:
+                for meeting_id, meeting_date in early.items():
+                    self.wheel.schedule(meeting_id, self._due_tick(meeting_date))
+        rows = [row for row in rows if row.id not in early]
+        if not rows:
+            return 0
+
+        # Claim the reminders; another process may have sent some already
+        claimed = set(db.scalars(
+            update(Meeting)
+            .where(Meeting.id.in_([row.id for row in rows]), Meeting.reminder_sent_at.is_(None))
+            .values(reminder_sent_at=now)
+            .returning(Meeting.id)
+            .execution_options(synchronize_session=False)
+        ).all())
+        rows = [row for row in rows if row.id in claimed]
+
+        attendees = attendees_by_meeting(db, [row.id for row in rows])
+        requester_ids = {row.created_by_id for row in rows if row.created_by_type == UserType.EMPLOYEE.value}
+        requesters = dict(
+            db.query(Employee.id, Employee.email).filter(Employee.id.in_(requester_ids)).all()
+        ) if requester_ids else {}
+        managers = dict(
+            db.query(Manager.id, Manager.email).filter(Manager.id.in_({row.manager_id for row in rows})).all()
+        )
+
+        for row in rows:
+            recipients = {email for _, email in attendees[row.id]}
+            if row.created_by_type == UserType.EMPLOYEE.value and row.created_by_id in requesters:
+                recipients.add(requesters[row.created_by_id])
+            if row.manager_id in managers:
+                recipients.add(managers[row.manager_id])
+            for email in sorted(recipients):
+                send_meeting_reminder(db, email, row.title, row.date, row.location, meeting_id=row.id)
+        db.commit()
+        self.sent += len(rows)
+        return len(rows)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"scheduled": len(self.wheel), "sent": self.sent}
+
+reminder_scheduler = ReminderScheduler(
+    lead_minutes=settings.REMINDER_LEAD_MINUTES,
+    tick_seconds=settings.REMINDER_TICK_SECONDS,
+    horizon_hours=settings.REMINDER_HORIZON_HOURS,
+    reload_seconds=settings.REMINDER_RELOAD_SECONDS
+)
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import threading
+
+from fastapi import Response
+
+from app.config import settings
+
+class VersionedResponseCache:
+    """
+    Serialized response bodies tagged with a per-manager version
+
+    Keys carry the manager's version at the time the body was built, so a
+    write only has to bump the counter (`bump`): older entries can no
+    longer be looked up and age out of the LRU, without being scanned.
+    Everything an employee sees belongs to their manager, so the manager's
+    counter covers employee lists too. Entries also expire after
+    `ttl_seconds`, which bounds how long another process's writes can go
+    unseen.
+    """
+
+    def __init__(self, max_entries: int = 5000, ttl_seconds: float = 60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[int, int, Hashable], Tuple[bytes, float]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, manager_id: int) -> int:
+        with self._lock:
+            return self._versions.get(manager_id, 0)
+
+    def bump(self, manager_id: int) -> None:
+        """Make every cached response for a manager's team unreachable"""
+        with self._lock:
+            self._versions[manager_id] = self._versions.get(manager_id, 0) + 1
+
+    def get(self, manager_id: int, key: Hashable) -> Tuple[Optional[bytes], int]:
+        """
+        Look up a body under the manager's current version
+
+        Returns:
+            tuple: (body or None, version to store a freshly built body under)
+        """
+        with self._lock:
+            version = self._versions.get(manager_id, 0)
+            full_key = (manager_id, version, key)
+            entry = self._entries.get(full_key)
+            if entry is not None and monotonic() - entry[1] < self.ttl_seconds:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return entry[0], version
+            self.misses += 1
+            return None, version
+
+    def put(self, manager_id: int, version: int, key: Hashable, body: bytes) -> None:
+        with self._lock:
+            if self._versions.get(manager_id, 0) != version:
+                # A write landed while the body was built; it is already stale
+                return
+            self._entries[(manager_id, version, key)] = (body, monotonic())
+            self._entries.move_to_end((manager_id, version, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def respond(self, manager_id: int, key: Hashable, build: Callable[[], bytes]) -> Response:
+        """JSON response from the cache, or from `build` (then cached)"""
+        body, version = self.get(manager_id, key)
+        if body is None:
+            body = build()
+            self.put(manager_id, version, key, body)
+        return Response(content=body, media_type="application/json")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+meeting_list_cache = VersionedResponseCache(
+    max_entries=settings.MEETING_LIST_CACHE_ENTRIES,
+    ttl_seconds=settings.MEETING_LIST_CACHE_TTL_SECONDS
+)
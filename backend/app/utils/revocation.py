@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict
+import logging
+import threading
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import RevokedToken
+from app.utils.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+def token_key(jti: str) -> str:
+    return f"jti:{jti}"
+
+def subject_key(user_type: str, user_id: Any) -> str:
+    return f"{user_type}:{user_id}"
+
+class RevocationList:
+    """
+    Revoked access tokens, fronted by an in-memory Bloom filter
+
+    The filter is rebuilt from the revoked_tokens table periodically and
+    updated immediately for revocations made by this process. Only keys the
+    filter reports as probably present are checked against the database,
+    so valid tokens never cost a query.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._filter = self._new_filter(0)
+        self._recent = set()
+
+    @staticmethod
+    def _new_filter(entries: int) -> BloomFilter:
+        capacity = max(settings.REVOCATION_BLOOM_CAPACITY, entries * 2)
+        return BloomFilter(capacity, settings.REVOCATION_BLOOM_ERROR_RATE)
+
+    def rebuild(self, db: Session) -> int:
+        """
+        Rebuild the filter from the unexpired entries in the database
+
+        Args:
+            db: Database session
+
+        Returns:
+            int: Number of keys loaded
+        """
+        with self._lock:
+            self._recent = set()
+
+        keys = [row.key for row in db.query(RevokedToken.key).filter(
+            RevokedToken.expires_at > datetime.utcnow()
+        ).all()]
+        bloom = self._new_filter(len(keys))
+        bloom.update(keys)
+
+        with self._lock:
+            # Keep anything revoked locally while the snapshot was loading
+            bloom.update(self._recent)
+            self._filter = bloom
+        return len(keys)
+
+    def _remember(self, key: str) -> None:
+        with self._lock:
+            self._filter.add(key)
+            self._recent.add(key)
+
+    def _upsert(self, db: Session, key: str, expires_at: datetime) -> None:
+        now = datetime.utcnow()
+        entry = db.query(RevokedToken).filter(RevokedToken.key == key).first()
+        if entry:
+            entry.revoked_at = now
+            entry.expires_at = max(entry.expires_at, expires_at)
+        else:
+            db.add(RevokedToken(key=key, revoked_at=now, expires_at=expires_at))
+
+    def revoke_token(self, db: Session, jti: str, expires_at: datetime) -> None:
+        """
+        Revoke a single access token by its jti (not committed)
+
+        Args:
+            db: Database session
+            jti: Token ID claim
+            expires_at: Token expiry, after which the entry can be dropped
+        """
+        key = token_key(jti)
+        self._upsert(db, key, expires_at)
+        self._remember(key)
+
+    def revoke_subject(self, db: Session, user_type: str, user_id: Any) -> None:
+        """
+        Revoke every token issued to a user so far (not committed)
+
+        Args:
+            db: Database session
+            user_type: Type of the user (manager, employee or admin)
+            user_id: ID of the user
+        """
+        key = subject_key(user_type, user_id)
+        expires_at = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        self._upsert(db, key, expires_at)
+        self._remember(key)
+
+    def is_revoked(self, db: Session, payload: Dict[str, Any]) -> bool:
+        """
+        Check a decoded token payload against the revocation list
+
+        Args:
+            db: Database session
+            payload: Decoded JWT claims
+
+        Returns:
+            bool: True if the token or its subject has been revoked
+        """
+        jti = payload.get("jti")
+        subject = subject_key(payload.get("type"), payload.get("sub"))
+
+        candidates = []
+        bloom = self._filter
+        if jti and token_key(jti) in bloom:
+            candidates.append(token_key(jti))
+        if subject in bloom:
+            candidates.append(subject)
+        if not candidates:
+            return False
+
+        entries = db.query(RevokedToken).filter(
+            RevokedToken.key.in_(candidates),
+            RevokedToken.expires_at > datetime.utcnow()
+        ).all()
+
+        issued_at = payload.get("iat")
+        for entry in entries:
+            if entry.key != subject:
+                return True
+            # Subject revocations only apply to tokens issued before them
+            if issued_at is None or datetime.utcfromtimestamp(issued_at) <= entry.revoked_at:
+                return True
+        return False
+
+def sweep_expired_revocations(db: Session) -> int:
+    """
+    Delete revocation entries whose tokens have expired and rebuild the filter
+
+    Args:
+        db: Database session
+
+    Returns:
+        int: Number of entries deleted
+    """
+    deleted = db.query(RevokedToken).filter(
+        RevokedToken.expires_at <= datetime.utcnow()
+    ).delete(synchronize_session=False)
+    db.commit()
+    revocation_list.rebuild(db)
+    return deleted
+
+revocation_list = RevocationList()
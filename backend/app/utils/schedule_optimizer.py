@@ -0,0 +1,115 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+from app.utils.intervals import IntervalSet
+
+Option = Tuple[datetime, datetime, Any]  # (start, end, reference such as a proposed date ID)
+
+class _Calendar:
+    """Chosen options, disjoint and sorted by start, with bisect lookups"""
+
+    def __init__(self):
+        self._starts: List[datetime] = []
+        self._entries: List[Tuple[datetime, datetime, Hashable]] = []
+        self.chosen: Dict[Hashable, Option] = {}
+
+    def blockers(self, start: datetime, end: datetime) -> List[Hashable]:
+        # Entries are disjoint, so their ends are sorted too
+        first = bisect_right(self._starts, start) - 1
+        if first < 0 or self._entries[first][1] <= start:
+            first += 1
+        last = bisect_left(self._starts, end)
+        return [entry[2] for entry in self._entries[max(first, 0):last]]
+
+    def add(self, key: Hashable, option: Option) -> None:
+        index = bisect_left(self._starts, option[0])
+        self._starts.insert(index, option[0])
+        self._entries.insert(index, (option[0], option[1], key))
+        self.chosen[key] = option
+
+    def remove(self, key: Hashable) -> Option:
+        option = self.chosen.pop(key)
+        index = bisect_left(self._starts, option[0])
+        while self._entries[index][2] != key:
+            index += 1
+        del self._starts[index]
+        del self._entries[index]
+        return option
+
+def plan_assignments(
+    requests: Dict[Hashable, List[Option]],
+    busy: Optional[IntervalSet] = None,
+    max_depth: int = 3
+) -> Dict[Hashable, Option]:
+    """
+    Pick at most one option per request so that no two picks overlap
+
+    Options that overlap `busy` are dropped first. A greedy pass then takes
+    options by earliest end, which is optimal when every request has a
+    single option. Requests left over are placed by a bounded backtracking
+    search: an option blocked by exactly one pick is taken if the blocking
+    request can move to another of its options, recursively up to
+    `max_depth` moves (augmenting chains, as in bipartite matching).
+
+    Args:
+        requests: Options per request key
+        busy: Time already taken
+        max_depth: Longest chain of moved picks tried per leftover request
+
+    Returns:
+        Dict: Chosen option per assigned request key
+    """
+    options = {
+        key: sorted(
+            (option for option in request_options
+             if option[1] > option[0] and (busy is None or busy.is_free(option[0], option[1]))),
+            key=lambda option: (option[0], option[1])
+        )
+        for key, request_options in requests.items()
+    }
+
+    calendar = _Calendar()
+    by_end = sorted(
+        ((option[1], option[0], index, key, option)
+         for index, (key, key_options) in enumerate(options.items())
+         for option in key_options),
+        key=lambda item: item[:3]
+    )
+    for _, _, _, key, option in by_end:
+        if key not in calendar.chosen and not calendar.blockers(option[0], option[1]):
+            calendar.add(key, option)
+
+    def place(key: Hashable, depth: int, moving: Set[Hashable]) -> bool:
+        for option in options[key]:
+            if not calendar.blockers(option[0], option[1]):
+                calendar.add(key, option)
+                return True
+        if depth == 0:
+            return False
+        for option in options[key]:
+            blocking = calendar.blockers(option[0], option[1])
+            if len(blocking) != 1 or blocking[0] in moving:
+                continue
+            other = blocking[0]
+            previous = calendar.remove(other)
+            calendar.add(key, option)
+            if place(other, depth - 1, moving | {key, other}):
+                return True
+            calendar.remove(key)
+            calendar.add(other, previous)
+        return False
+
+    leftover = sorted(
+        (key for key in options if key not in calendar.chosen and options[key]),
+        key=lambda key: len(options[key])
+    )
+    improved = True
+    while improved and leftover:
+        improved = False
+        for key in leftover:
+            if key not in calendar.chosen and place(key, max_depth, {key}):
+                improved = True
+        leftover = [key for key in leftover if key not in calendar.chosen]
+
+    return calendar.chosen
@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+import logging
+
+from sqlalchemy import DateTime, Integer, String, column, insert, inspect, select, table, text, update
+from sqlalchemy.engine import Connection, Engine
+
+from app.config import settings
+from app.data import Base
+from app.database import OneTimePassword
+from app.utils.otp import MANAGER_SIGNUP
+from app.utils.security import hash_token
+
+logger = logging.getLogger(__name__)
+
+# Columns added to tables that existed before them: (table, column, SQL default for existing rows)
+ADDED_COLUMNS: List[Tuple[str, str, Optional[str]]] = [
+    ("employees", "verification_token_hash", None),
+    ("meetings", "ends_at", None),
+    ("meetings", "recurrence_rule", None),
+    ("meetings", "recurrence_until", None),
+    ("meetings", "reminder_sent_at", None),
+    ("meetings", "version", "1"),
+]
+
+def _add_column(conn: Connection, table_name: str, column_name: str, default: Optional[str]) -> None:
+    model_column = Base.metadata.tables[table_name].c[column_name]
+    ddl = f"ALTER TABLE {table_name} ADD COLUMN {column_name} {model_column.type.compile(dialect=conn.dialect)}"
+    if default is not None:
+        ddl += f" DEFAULT {default}"
+        if not model_column.nullable:
+            ddl += " NOT NULL"
+    conn.execute(text(ddl))
+
+# Columns the models no longer have, for carrying their data over
+_legacy_employees = table(
+    "employees", column("id", Integer), column("verification_token", String),
+    column("verification_token_hash", String)
+)
+_legacy_managers = table(
+    "managers", column("email", String), column("otp", String), column("otp_created_at", DateTime)
+)
+
+def _migrate_verification_tokens(conn: Connection) -> int:
+    """Hash plaintext employee tokens so pending invitations stay valid"""
+    rows = conn.execute(
+        select(_legacy_employees.c.id, _legacy_employees.c.verification_token)
+        .where(_legacy_employees.c.verification_token.isnot(None))
+    ).all()
+    for row in rows:
+        conn.execute(
+            update(_legacy_employees)
+            .where(_legacy_employees.c.id == row.id)
+            .values(verification_token_hash=hash_token(row.verification_token), verification_token=None)
+        )
+    return len(rows)
+
+def _migrate_manager_otps(conn: Connection) -> int:
+    """Move unexpired plaintext signup OTPs to one_time_passwords, hashed"""
+    now = datetime.utcnow()
+    lifetime = timedelta(minutes=settings.OTP_EXPIRE_MINUTES)
+    rows = conn.execute(
+        select(_legacy_managers.c.email, _legacy_managers.c.otp, _legacy_managers.c.otp_created_at)
+        .where(_legacy_managers.c.otp.isnot(None))
+    ).all()
+    pending = [
+        {
+            "email": row.email,
+            "purpose": MANAGER_SIGNUP,
+            "code_hash": hash_token(row.otp),
+            "expires_at": row.otp_created_at + lifetime
+        }
+        for row in rows
+        if row.otp_created_at is not None and row.otp_created_at + lifetime > now
+    ]
+    if pending:
+        conn.execute(insert(OneTimePassword), pending)
+    conn.execute(
+        update(_legacy_managers)
+        .where(_legacy_managers.c.otp.isnot(None))
+        .values(otp=None, otp_created_at=None)
+    )
+    return len(pending)
+
+def upgrade_schema(engine: Engine) -> List[str]:
+    """
+    Bring tables created by earlier releases up to the current models
+
+    `create_tables` only creates missing tables, so columns added since are
+    added here with ALTER TABLE, and indexes on existing tables are created
+    if missing. Data left in replaced columns is carried over: plaintext
+    employee verification tokens are hashed and manager signup OTPs move to
+    one_time_passwords, after which the plaintext is cleared. Safe to run
+    on every start-up.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        List: "table.column" for each column added
+    """
+    added = []
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        existing = {
+            table_name: {info["name"] for info in inspector.get_columns(table_name)}
+            for table_name in inspector.get_table_names()
+        }
+
+        for table_name, column_name, default in ADDED_COLUMNS:
+            if table_name in existing and column_name not in existing[table_name]:
+                _add_column(conn, table_name, column_name, default)
+                existing[table_name].add(column_name)
+                added.append(f"{table_name}.{column_name}")
+
+        if "verification_token" in existing.get("employees", ()):
+            _migrate_verification_tokens(conn)
+        if "otp" in existing.get("managers", ()):
+            _migrate_manager_otps(conn)
+
+        for model_table in Base.metadata.sorted_tables:
+            for index in model_table.indexes:
+                index.create(conn, checkfirst=True)
+
+    if added:
+        logger.info(f"Added columns: {', '.join(added)}")
+    return added
@@ -4,7 +4,8 @@ from datetime import datetime, timedelta
 from typing import Optional
 import string
 from app.config import settings
-import random
+import hashlib
+import secrets
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -37,7 +38,19 @@ def generate_verification_token(length: int = 64) -> str:
         A random string token
     """
     chars = string.ascii_letters + string.digits
-    return ''.join(random.choices(chars, k=length))
+    return ''.join(secrets.choice(chars) for _ in range(length))
 
 def verify_token(token: str):
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
\ No newline at end of file
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+def hash_token(token: str) -> str:
+    """
+    Hash a verification token or OTP for storage and lookup
+
+    Args:
+        token: Plaintext token as sent to the user
+
+    Returns:
+        Hex encoded SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
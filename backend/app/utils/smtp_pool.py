@@ -0,0 +1,231 @@
+from collections import deque
+from typing import List, Optional, Tuple
+import logging
+import smtplib
+import threading
+import time
+
+from app.config import settings
+from app.utils.circuit_breaker import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+class DeadlineExceeded(Exception):
+    """A message was not attempted because the batch ran out of time"""
+
+class PooledConnection:
+    """An authenticated SMTP session plus the bookkeeping the pool needs"""
+
+    def __init__(self, server: smtplib.SMTP):
+        self.server = server
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.messages_sent = 0
+
+    def close(self) -> None:
+        try:
+            self.server.quit()
+        except Exception:
+            try:
+                self.server.close()
+            except Exception:
+                pass
+
+class SMTPConnectionPool:
+    """
+    Small pool of authenticated SMTP sessions reused across messages
+
+    Connections idle for longer than `idle_timeout` are closed, connections
+    idle for longer than `health_check_after` are probed with NOOP before
+    reuse, and a connection is retired after `max_messages` sends. A send
+    that fails on a reused connection is retried once on a fresh one.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+        max_size: int = 4,
+        idle_timeout: float = 60,
+        health_check_after: float = 5,
+        max_messages: int = 100,
+        timeout: float = 10,
+        use_tls: bool = True
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.max_messages = max_messages
+        self.timeout = timeout
+        self.use_tls = use_tls
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    def _connect(self) -> PooledConnection:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.username:
+                server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        return PooledConnection(server)
+
+    @staticmethod
+    def _is_alive(conn: PooledConnection) -> bool:
+        try:
+            return conn.server.noop()[0] == 250
+        except Exception:
+            return False
+
+    def _checkout(self) -> Tuple[PooledConnection, bool]:
+        """Get an idle connection if a healthy one exists, else open one"""
+        while True:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                return self._connect(), False
+
+            idle_for = time.monotonic() - conn.last_used
+            if idle_for > self.idle_timeout:
+                conn.close()
+                continue
+            if idle_for > self.health_check_after and not self._is_alive(conn):
+                conn.close()
+                continue
+            return conn, True
+
+    def _checkin(self, conn: PooledConnection) -> None:
+        if conn.messages_sent >= self.max_messages:
+            conn.close()
+            return
+        conn.last_used = time.monotonic()
+        with self._lock:
+            self._idle.append(conn)
+
+    def _send_on(self, conn: PooledConnection, sender: str, recipient: str, message: str) -> None:
+        conn.server.sendmail(sender, recipient, message)
+        conn.messages_sent += 1
+        conn.last_used = time.monotonic()
+
+    @staticmethod
+    def _session_lost(error: Exception) -> bool:
+        """Whether an error means the SMTP session can no longer be used"""
+        if isinstance(error, smtplib.SMTPServerDisconnected):
+            return True
+        return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+    @staticmethod
+    def is_outage(error: Exception) -> bool:
+        """Whether an error points at the SMTP server rather than the message"""
+        if isinstance(error, (smtplib.SMTPConnectError, smtplib.SMTPServerDisconnected)):
+            return True
+        return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+    def send(self, sender: str, recipient: str, message: str) -> None:
+        """
+        Send one message, reconnecting once if a pooled session has gone away
+
+        Raises:
+            Exception: SMTP or connection errors from the final attempt
+        """
+        self.send_many(sender, [(recipient, message)], raise_errors=True)
+
+    def send_many(
+        self,
+        sender: str,
+        messages: List[Tuple[str, str]],
+        raise_errors: bool = False,
+        deadline: Optional[float] = None
+    ) -> List[Optional[Exception]]:
+        """
+        Send several messages back to back over one borrowed session
+
+        Args:
+            sender: Envelope sender
+            messages: (recipient, message) pairs
+            raise_errors: Raise the first error instead of collecting it
+            deadline: time.monotonic() after which no further message is started
+
+        Returns:
+            List: None for each delivered message, or the error it failed with
+            (DeadlineExceeded for messages that were never attempted)
+        """
+        results: List[Optional[Exception]] = []
+        conn = None
+        self._slots.acquire()
+        try:
+            for recipient, message in messages:
+                if deadline is not None and time.monotonic() >= deadline:
+                    results.extend([DeadlineExceeded("Batch deadline passed before sending")] * (len(messages) - len(results)))
+                    break
+                try:
+                    if conn is None:
+                        conn, reused = self._checkout()
+                    try:
+                        self._send_on(conn, sender, recipient, message)
+                    except Exception as e:
+                        if not (reused and self._session_lost(e)):
+                            raise
+                        # A stale pooled session; retry once on a fresh connection
+                        logger.info(f"SMTP session dropped ({str(e)}), reconnecting")
+                        conn.close()
+                        conn, reused = None, False
+                        conn = self._connect()
+                        self._send_on(conn, sender, recipient, message)
+                    results.append(None)
+                except Exception as e:
+                    if conn is None:
+                        # Could not connect at all; fail the rest without retrying
+                        if raise_errors:
+                            raise
+                        results.extend([e] * (len(messages) - len(results)))
+                        break
+                    if self._session_lost(e):
+                        conn.close()
+                        conn = None
+                    if raise_errors:
+                        raise
+                    results.append(e)
+
+                if conn is not None and conn.messages_sent >= self.max_messages:
+                    conn.close()
+                    conn = None
+        finally:
+            if conn is not None:
+                self._checkin(conn)
+            self._slots.release()
+        return results
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for conn in idle:
+            conn.close()
+
+smtp_breaker = CircuitBreaker(
+    "smtp",
+    failure_threshold=settings.SMTP_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=settings.SMTP_BREAKER_RESET_SECONDS
+)
+
+smtp_pool = SMTPConnectionPool(
+    settings.SMTP_SERVER,
+    settings.SMTP_PORT,
+    settings.SMTP_USERNAME,
+    settings.SMTP_PASSWORD,
+    max_size=settings.SMTP_POOL_SIZE,
+    idle_timeout=settings.SMTP_POOL_IDLE_SECONDS,
+    max_messages=settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+    timeout=settings.SMTP_TIMEOUT,
+    use_tls=settings.SMTP_USE_TLS
+)
@@ -24,6 +24,14 @@ def validate_email(email: str) -> bool:
     return True
 
 class MeetingStatusTransitionValidator:
+    # Allowed transitions
+    ALLOWED_TRANSITIONS: Dict[str, List[str]] = {
+        "pending": ["accepted", "rejected", "cancelled"],
+        "accepted": ["cancelled"],
+        "rejected": [],  # No transitions allowed from rejected
+        "cancelled": []  # No transitions allowed from cancelled
+    }
+
     @staticmethod
     def validate(current_status: str, new_status: str) -> bool:
         """
@@ -36,13 +44,7 @@ class MeetingStatusTransitionValidator:
         Returns:
             True if transition is valid, raises exception otherwise
         """
-        # Define allowed transitions
-        allowed_transitions = {
-            "pending": ["accepted", "rejected", "cancelled"],
-            "accepted": ["cancelled"],
-            "rejected": [],  # No transitions allowed from rejected
-            "cancelled": []  # No transitions allowed from cancelled
-        }
+        allowed_transitions = MeetingStatusTransitionValidator.ALLOWED_TRANSITIONS
         
         # Convert to lowercase for comparison
         current = current_status.lower()
@@ -56,6 +58,20 @@ class MeetingStatusTransitionValidator:
             
         return True
 
+    @staticmethod
+    def sources_for(new_status: str) -> List[str]:
+        """
+        Statuses a meeting may be in to move to `new_status`
+
+        Used as the guard of conditional UPDATEs, so the database enforces
+        the same transitions as `validate`.
+        """
+        new = new_status.lower()
+        return [
+            current for current, targets in MeetingStatusTransitionValidator.ALLOWED_TRANSITIONS.items()
+            if new in targets
+        ]
+
 def validate_password(password: str) -> bool:
     """
     Validate password strength
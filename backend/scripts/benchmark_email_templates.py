@@ -0,0 +1,36 @@
+"""
+Measure email template rendering throughput for a meeting fan-out
+
+Run from the backend directory: python -m scripts.benchmark_email_templates
+"""
+from datetime import datetime
+from typing import Dict
+import time
+
+from app.utils.email_templates import format_date, render
+
+def benchmark(iterations: int = 20000) -> Dict[str, float]:
+    """Renders per second with repeated values (cached) and with distinct ones"""
+    meeting_date = datetime(2030, 1, 7, 15, 30)
+    params = dict(
+        heading="New Meeting Scheduled",
+        meeting_title="Quarterly review",
+        action_text="scheduled a meeting",
+        created_by="Alex",
+        meeting_location="Head office"
+    )
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        render("meeting_notification", date_display=f"Date & Time: {format_date(meeting_date)}", **params)
+    cached = iterations / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        render("meeting_notification", date_display=f"Date & Time: {i}", **params)
+    uncached = iterations / (time.perf_counter() - start)
+
+    return {"cached_renders_per_second": round(cached), "uncached_renders_per_second": round(uncached)}
+
+if __name__ == "__main__":
+    print(benchmark())
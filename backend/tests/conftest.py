@@ -0,0 +1,72 @@
+import os
+import tempfile
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+# Settings the app needs at import time: a throwaway SQLite database and no real SMTP server
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/meetyfi-test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("SMTP_SERVER", "localhost")
+os.environ.setdefault("SMTP_PORT", "2525")
+os.environ.setdefault("SMTP_USERNAME", "")
+os.environ.setdefault("SMTP_PASSWORD", "")
+os.environ.setdefault("EMAIL_FROM", "noreply@meetyfi.test")
+
+PASSWORD = "Passw0rd!"
+
+@pytest.fixture(scope="session")
+def client():
+    """The app with its startup hooks run (tables created, background tasks started)"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def db(client):
+    from app.data import SessionLocal
+
+    session = SessionLocal()
+    yield session
+    session.close()
+
+def login(client, email: str, user_type: str) -> dict:
+    response = client.post("/api/auth/login", json={"email": email, "password": PASSWORD, "user_type": user_type})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+@pytest.fixture
+def team(client, db):
+    """
+    A verified manager with three employees, and auth headers for both roles
+
+    Every test gets its own team, so tests never see each other's meetings.
+    """
+    from app.database import Employee, Manager
+    from app.utils.password import hash_password
+
+    tag = uuid.uuid4().hex[:8]
+    manager = Manager(
+        email=f"manager-{tag}@example.com", password=hash_password(PASSWORD), name="Manager",
+        company_name="Company", company_size=3, manager_id=tag.upper(), is_verified=True, is_approved=True
+    )
+    db.add(manager)
+    db.commit()
+    employees = [
+        Employee(
+            email=f"employee{i}-{tag}@example.com", password=hash_password(PASSWORD),
+            name=f"Employee {i}", manager_id=manager.id, is_verified=True
+        )
+        for i in range(3)
+    ]
+    db.add_all(employees)
+    db.commit()
+    return SimpleNamespace(
+        manager=manager,
+        employees=employees,
+        manager_headers=login(client, manager.email, "manager"),
+        employee_headers=login(client, employees[0].email, "employee")
+    )
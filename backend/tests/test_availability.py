@@ -0,0 +1,38 @@
+from datetime import datetime, time, timedelta
+
+from sqlalchemy import event
+
+from app.data import engine
+from app.services.availability_service import get_free_slots
+from app.utils.busy_cache import busy_cache
+from tests.test_meeting_conflicts import create_meeting, future
+
+def count_statements(db, call):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, [statement for statement in statements if "FROM meetings" in statement]
+
+def test_week_view_loads_the_range_at_once(client, db, team):
+    first_day = future(20, 0).date()
+    for offset in (0, 2, 6):
+        assert create_meeting(client, team, datetime.combine(first_day + timedelta(days=offset), time(10))).status_code == 200
+    busy_cache.invalidate(team.manager.id)
+
+    week, queries = count_statements(db, lambda: get_free_slots(db, team.manager.id, first_day, days=7))
+    # One query for one-off meetings and one for series, not one of each per day
+    assert len(queries) == 2
+
+    busy_cache.invalidate(team.manager.id)
+    for offset, day in enumerate(week["days"]):
+        single = get_free_slots(db, team.manager.id, first_day + timedelta(days=offset))["days"][0]
+        assert day == single
+        booked = offset in (0, 2, 6)
+        assert any(slot["start_time"].hour == 10 for slot in day["slots"]) is not booked
@@ -0,0 +1,30 @@
+from app.utils.email_templates import _render_cached, render
+
+def test_one_off_emails_are_not_cached():
+    _render_cached.cache_clear()
+    render("otp", greeting="Hello,", otp="123456", expire_minutes="10")
+    render("employee_invitation", manager_name="Sam", company_name="Acme", verification_token="secret", expire_days="7")
+
+    assert _render_cached.cache_info().currsize == 0
+
+def test_fan_out_renders_are_reused():
+    _render_cached.cache_clear()
+    params = dict(
+        heading="New Meeting Scheduled",
+        meeting_title="Quarterly review",
+        action_text="scheduled a meeting",
+        created_by="Alex",
+        date_display="Date & Time: Monday",
+        meeting_location="Head office"
+    )
+    first = render("meeting_notification", **params)
+    second = render("meeting_notification", **params)
+
+    assert second is first
+    assert _render_cached.cache_info().hits == 1
+
+def test_values_are_escaped_in_html_only():
+    rendered = render("otp", greeting="Hello <b>,", otp="1", expire_minutes="10")
+
+    assert "Hello &lt;b&gt;," in rendered.html_content
+    assert rendered.text_content.startswith("Hello <b>,")
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+
+from aiosmtpd.controller import Controller
+
+from app.utils import fanout
+from app.utils.smtp_pool import SMTPConnectionPool
+from tests.test_smtp_pool import SENDER, free_port, message
+
+class SlowHandler:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.recipients = []
+
+    async def handle_DATA(self, server, session, envelope):
+        await asyncio.sleep(self.delay)
+        self.recipients.append(envelope.rcpt_tos[0])
+        return "250 OK"
+
+def test_stops_starting_messages_after_the_deadline(monkeypatch):
+    handler = SlowHandler(delay=0.3)
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    pool = SMTPConnectionPool(controller.hostname, controller.port, None, None, use_tls=False, timeout=5)
+    monkeypatch.setattr(fanout, "smtp_pool", pool)
+    try:
+        messages = [(f"user{i}@example.com", message(f"user{i}@example.com")) for i in range(3)]
+        report = fanout.fan_out(SENDER, messages, concurrency=1, timeout=0.1)
+    finally:
+        pool.close_all()
+        controller.stop()
+
+    # The message in flight at the deadline finishes; the rest are never attempted
+    assert report.sent == [0]
+    assert report.timed_out == [1, 2]
+    assert report.unfinished == []
+    assert handler.recipients == ["user0@example.com"]
+
+class StuckPool:
+    """Pool whose send blocks until released, like a server that stops answering"""
+    max_size = 2
+    timeout = 0.05
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def send_many(self, sender, messages, deadline=None):
+        self.release.wait()
+        return [None] * len(messages)
+
+    @staticmethod
+    def is_outage(error):
+        return True
+
+def test_reports_late_outcome_of_unfinished_workers(monkeypatch):
+    pool = StuckPool()
+    monkeypatch.setattr(fanout, "smtp_pool", pool)
+    late = []
+
+    messages = [("a@example.com", "a"), ("b@example.com", "b")]
+    report = fanout.fan_out(SENDER, messages, concurrency=2, timeout=0.05, on_unfinished=late.append)
+
+    assert sorted(report.unfinished) == [0, 1]
+    assert report.timed_out == []
+    assert late == []
+
+    pool.release.set()
+    for _ in range(100):
+        if len(late) == 2:
+            break
+        time.sleep(0.01)
+    assert sorted(index for late_report in late for index in late_report.sent) == [0, 1]
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.database import Meeting
+from app.utils.meeting_queries import overlap_condition
+
+CLIENT = {"name": "Client", "email": "client@example.com", "phone": "1234567890"}
+
+def future(days: int, hour: int) -> datetime:
+    return (datetime.utcnow() + timedelta(days=days)).replace(hour=hour, minute=0, second=0, microsecond=0)
+
+def create_meeting(client, team, start: datetime, duration: int = 60):
+    return client.post("/api/managers/meetings", headers=team.manager_headers, json={
+        "title": "Planning", "date": start.isoformat(), "duration": duration,
+        "employee_ids": [team.employees[0].id], "client_info": CLIENT
+    })
+
+def request_meeting(client, team, *starts: datetime):
+    return client.post("/api/employees/meetings", headers=team.employee_headers, json={
+        "title": "Request", "description": "Review", "location": "Office", "duration": 60,
+        "proposed_dates": [start.isoformat() for start in starts], "client_info": CLIENT
+    })
+
+def test_undated_request_does_not_block_the_calendar(client, team):
+    start = future(5, 10)
+    response = request_meeting(client, team, start, start + timedelta(hours=3))
+    assert response.status_code == 200, response.text
+
+    # The request is pending without a date; booking its proposed time is fine
+    assert create_meeting(client, team, start).status_code == 200
+
+def test_overlapping_meeting_is_rejected_with_the_conflicts(client, team):
+    start = future(6, 10)
+    first = create_meeting(client, team, start).json()["meeting_id"]
+
+    response = create_meeting(client, team, start + timedelta(minutes=30))
+    assert response.status_code == 409
+    assert str(first) in response.text
+
+    # Back-to-back meetings do not overlap
+    assert create_meeting(client, team, start + timedelta(hours=1)).status_code == 200
+
+def test_request_flags_only_the_busy_proposed_dates(client, team):
+    start = future(7, 10)
+    create_meeting(client, team, start)
+
+    response = request_meeting(client, team, start, start + timedelta(hours=2))
+    assert response.status_code == 200, response.text
+    assert len(response.json()["conflicting_proposed_date_ids"]) == 1
+
+    assert request_meeting(client, team, start + timedelta(minutes=15)).status_code == 409
+
+class _Postgres:
+    class dialect:
+        name = "postgresql"
+
+class _PostgresSession:
+    def get_bind(self):
+        return _Postgres
+
+def test_postgres_overlap_excludes_meetings_without_a_date():
+    # tstzrange(NULL, NULL) is unbounded, so the range test alone would match undated requests
+    condition = overlap_condition(_PostgresSession(), datetime(2030, 1, 1, 10), datetime(2030, 1, 1, 11))
+    sql = str(select(Meeting.id).where(condition).compile(dialect=postgresql.dialect()))
+    assert "meetings.date IS NOT NULL" in sql
+    assert "meetings.ends_at IS NOT NULL" in sql
@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from tests.test_meeting_conflicts import create_meeting, future, request_meeting
+
+def set_status(client, team, meeting_id: int, status: str, if_match=None):
+    headers = dict(team.manager_headers)
+    if if_match is not None:
+        headers["If-Match"] = if_match
+    return client.put(f"/api/managers/meetings/{meeting_id}/status", headers=headers, json={"status": status})
+
+def test_if_match_with_a_stale_version_fails(client, team):
+    meeting_id = create_meeting(client, team, future(8, 10)).json()["meeting_id"]
+
+    response = set_status(client, team, meeting_id, "cancelled", if_match=f'"meeting-{meeting_id}-v2"')
+    assert response.status_code == 412
+    assert response.headers["ETag"] == f'"meeting-{meeting_id}-v1"'
+
+def test_if_match_uses_strong_comparison(client, team):
+    meeting_id = create_meeting(client, team, future(8, 12)).json()["meeting_id"]
+
+    assert set_status(client, team, meeting_id, "cancelled", if_match=f'W/"meeting-{meeting_id}-v1"').status_code == 412
+    assert set_status(client, team, meeting_id, "cancelled", if_match=f'"meeting-{meeting_id}-v9"').status_code == 412
+
+def test_if_match_with_the_current_version_succeeds(client, team):
+    meeting_id = create_meeting(client, team, future(8, 14)).json()["meeting_id"]
+
+    response = set_status(client, team, meeting_id, "cancelled", if_match=f'"meeting-{meeting_id}-v1", "other"')
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] == f'"meeting-{meeting_id}-v2"'
+
+    # The old tag is now stale
+    assert set_status(client, team, meeting_id, "cancelled", if_match=f'"meeting-{meeting_id}-v1"').status_code == 412
+
+def test_batch_reports_each_item(client, team):
+    start = future(9, 10)
+    accepted = create_meeting(client, team, start).json()["meeting_id"]
+    requests = [
+        request_meeting(client, team, start + timedelta(hours=hours)).json()["meeting_id"]
+        for hours in (2, 4, 6)
+    ]
+
+    response = client.put("/api/managers/meetings/status", headers=team.manager_headers, json=[
+        {"id": requests[0], "status": "rejected", "reason": "Busy"},
+        {"id": requests[1], "status": "cancelled"},
+        {"id": accepted, "status": "rejected"},
+        {"id": requests[2], "status": "rejected"},
+        {"id": requests[2], "status": "cancelled"},
+        {"id": 10 ** 9, "status": "cancelled"},
+    ])
+    assert response.status_code == 200, response.text
+    body = response.json()
+
+    assert body["updated"] == 2
+    assert [(result["id"], result["updated"]) for result in body["results"]] == [
+        (requests[0], True), (requests[1], True), (accepted, False),
+        (requests[2], False), (requests[2], False), (10 ** 9, False)
+    ]
+    errors = [result["error"] for result in body["results"]]
+    assert errors[:2] == [None, None]
+    assert errors[2] is not None
+    assert errors[3] == errors[4] == "Meeting listed more than once"
+    assert errors[5] == "Meeting not found"
+
+    meetings = {
+        meeting["id"]: meeting["status"]
+        for meeting in client.get("/api/managers/meetings", headers=team.manager_headers, params={"limit": 100}).json()["meetings"]
+    }
+    assert meetings[requests[0]] == "rejected"
+    assert meetings[requests[1]] == "cancelled"
+    assert meetings[accepted] == "accepted"
+    assert meetings[requests[2]] == "pending"
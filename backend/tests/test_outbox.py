@@ -0,0 +1,43 @@
+import json
+import uuid
+from datetime import datetime, timedelta
+
+from app.database import EmailOutbox
+from app.utils.email import DIGEST_MEETING_STATUS
+from app.utils.outbox import coalesce_batch
+
+def notification(recipient: str, title: str, status: str, next_attempt_at: datetime) -> EmailOutbox:
+    return EmailOutbox(
+        recipient=recipient, subject=title, html_content=title, text_content=title, status=status,
+        category=DIGEST_MEETING_STATUS, next_attempt_at=next_attempt_at,
+        payload=json.dumps({"meeting_id": None, "title": title, "summary": "Accepted"})
+    )
+
+def test_digest_absorbs_only_due_notifications(db):
+    recipient = f"{uuid.uuid4().hex[:8]}@example.com"
+    now = datetime.utcnow()
+    claimed = notification(recipient, "Claimed", "sending", now - timedelta(seconds=5))
+    due = notification(recipient, "Due", "pending", now - timedelta(seconds=1))
+    waiting = notification(recipient, "Waiting", "pending", now + timedelta(minutes=5))
+    db.add_all([claimed, due, waiting])
+    # Flushed, not committed, so the app's outbox workers never see these rows
+    db.flush()
+
+    assert coalesce_batch(db, [claimed]) == [claimed]
+    db.refresh(due)
+    db.refresh(waiting)
+
+    assert claimed.subject == "You have 2 meeting updates"
+    assert [item["title"] for item in json.loads(claimed.payload)] == ["Claimed", "Due"]
+    assert due.status == "coalesced"
+    # Still inside its digest window: left for a later digest
+    assert waiting.status == "pending"
+
+def test_lone_notification_is_sent_as_is(db):
+    recipient = f"{uuid.uuid4().hex[:8]}@example.com"
+    claimed = notification(recipient, "Claimed", "sending", datetime.utcnow())
+    db.add(claimed)
+    db.flush()
+
+    assert coalesce_batch(db, [claimed]) == [claimed]
+    assert claimed.subject == "Claimed"
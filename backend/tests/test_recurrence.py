@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils.recurrence import MAX_INTERVAL, RecurrenceRule, Series
+
+def starts(series: Series, start: datetime, end: datetime, **kwargs):
+    return [occurrence for occurrence, _ in series.between(start, end, **kwargs)]
+
+def test_parse_round_trips():
+    rule = RecurrenceRule.parse("RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=WE,MO;COUNT=6")
+    assert rule.byday == (0, 2)
+    assert str(rule) == "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE;COUNT=6"
+
+@pytest.mark.parametrize("rule", [
+    "FREQ=YEARLY",
+    "FREQ=DAILY;COUNT=2;UNTIL=20300101",
+    "FREQ=MONTHLY;BYDAY=MO",
+    "FREQ=WEEKLY;BYDAY=XX",
+    "FREQ=DAILY;INTERVAL=0",
+    f"FREQ=DAILY;INTERVAL={MAX_INTERVAL + 1}",
+    "FREQ=DAILY;COUNT=1001",
+    "FREQ=DAILY;UNTIL=2030",
+    "FREQ=DAILY;BYMONTH=1",
+])
+def test_parse_rejects_unsupported_rules(rule):
+    with pytest.raises(ValueError):
+        RecurrenceRule.parse(rule)
+
+def test_count_counts_byday_occurrences():
+    # Mondays and Wednesdays from Monday 7 January 2030, five in all
+    series = Series(RecurrenceRule.parse("FREQ=WEEKLY;BYDAY=MO,WE;COUNT=5"), datetime(2030, 1, 7, 10), 60)
+    assert series.last_start == datetime(2030, 1, 21, 10)
+    assert starts(series, datetime(2030, 1, 1), datetime(2030, 3, 1)) == [
+        datetime(2030, 1, 7, 10), datetime(2030, 1, 9, 10), datetime(2030, 1, 14, 10),
+        datetime(2030, 1, 16, 10), datetime(2030, 1, 21, 10)
+    ]
+
+def test_byday_skips_days_before_the_start():
+    # Starting on a Wednesday, that week's Monday is not an occurrence
+    series = Series(RecurrenceRule.parse("FREQ=WEEKLY;BYDAY=MO,WE;COUNT=2"), datetime(2030, 1, 9, 10), 60)
+    assert starts(series, datetime(2030, 1, 1), datetime(2030, 2, 1)) == [datetime(2030, 1, 9, 10), datetime(2030, 1, 14, 10)]
+
+def test_date_only_until_includes_that_day():
+    series = Series(RecurrenceRule.parse("FREQ=DAILY;UNTIL=20300103"), datetime(2030, 1, 1, 18), 30)
+    assert starts(series, datetime(2030, 1, 1), datetime(2030, 1, 10)) == [
+        datetime(2030, 1, 1, 18), datetime(2030, 1, 2, 18), datetime(2030, 1, 3, 18)
+    ]
+
+def test_monthly_on_the_31st_skips_shorter_months():
+    series = Series(RecurrenceRule.parse("FREQ=MONTHLY;COUNT=4"), datetime(2030, 1, 31, 9), 60)
+    assert starts(series, datetime(2030, 1, 1), datetime(2031, 1, 1)) == [
+        datetime(2030, 1, 31, 9), datetime(2030, 3, 31, 9), datetime(2030, 5, 31, 9), datetime(2030, 7, 31, 9)
+    ]
+    assert series.last_start == datetime(2030, 7, 31, 9)
+
+def test_window_includes_an_occurrence_already_running():
+    series = Series(RecurrenceRule.parse("FREQ=DAILY"), datetime(2030, 1, 1, 10), 60)
+    # 10:00-11:00 overlaps a window starting at 10:30; one ending at 10:00 does not include it
+    assert starts(series, datetime(2030, 1, 5, 10, 30), datetime(2030, 1, 5, 12)) == [datetime(2030, 1, 5, 10)]
+    assert starts(series, datetime(2030, 1, 5, 9), datetime(2030, 1, 5, 10)) == []
+
+def test_reverse_lists_latest_first():
+    series = Series(RecurrenceRule.parse("FREQ=DAILY;INTERVAL=2"), datetime(2030, 1, 1, 10), 60)
+    assert starts(series, datetime(2030, 1, 1), datetime(2030, 1, 7), reverse=True) == [
+        datetime(2030, 1, 5, 10), datetime(2030, 1, 3, 10), datetime(2030, 1, 1, 10)
+    ]
+
+def test_aware_window_for_a_naive_series():
+    series = Series(RecurrenceRule.parse("FREQ=DAILY;COUNT=3"), datetime(2030, 1, 1, 10), 60)
+    window = (datetime(2030, 1, 2, tzinfo=timezone.utc), datetime(2030, 1, 3, tzinfo=timezone.utc))
+    assert starts(series, *window) == [datetime(2030, 1, 2, 10)]
+    assert series.occurs_at(datetime(2030, 1, 3, 10, tzinfo=timezone.utc))
+
+def test_series_past_the_last_date_is_rejected():
+    with pytest.raises(ValueError):
+        Series(RecurrenceRule.parse(f"FREQ=DAILY;INTERVAL={MAX_INTERVAL};COUNT=1000"), datetime(9900, 1, 1), 60)
@@ -0,0 +1,135 @@
+import socket
+import time
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.utils.smtp_pool import SMTPConnectionPool
+
+SENDER = "noreply@meetyfi.test"
+
+class RecordingHandler:
+    """Keeps each delivered message with the SMTP session it arrived on"""
+
+    def __init__(self):
+        self.deliveries = []
+        self.noops = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.deliveries.append((id(session), envelope.rcpt_tos[0]))
+        return "250 OK"
+
+    async def handle_NOOP(self, server, session, envelope, arg):
+        self.noops += 1
+        return "250 OK"
+
+    def sessions(self):
+        return {session for session, _ in self.deliveries}
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+class SMTPServer:
+    """aiosmtpd stand-in that can be restarted on the same port, dropping open sessions"""
+
+    def __init__(self):
+        self.handler = RecordingHandler()
+        self.hostname = "127.0.0.1"
+        self.port = free_port()
+        self._start()
+
+    def _start(self):
+        self.controller = Controller(self.handler, hostname=self.hostname, port=self.port)
+        self.controller.start()
+
+    def restart(self):
+        self.controller.stop()
+        self._start()
+
+    def stop(self):
+        self.controller.stop()
+
+@pytest.fixture
+def smtp_server():
+    server = SMTPServer()
+    yield server
+    server.stop()
+
+def make_pool(controller, **kwargs) -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        controller.hostname, controller.port, None, None, use_tls=False, timeout=5, **kwargs
+    )
+
+def message(recipient: str) -> str:
+    return f"To: {recipient}\r\nSubject: test\r\n\r\nhello\r\n"
+
+def test_reuses_one_session_across_sends(smtp_server):
+    pool = make_pool(smtp_server)
+    try:
+        for i in range(5):
+            pool.send(SENDER, f"user{i}@example.com", message(f"user{i}@example.com"))
+    finally:
+        pool.close_all()
+
+    assert len(smtp_server.handler.deliveries) == 5
+    assert len(smtp_server.handler.sessions()) == 1
+
+def test_retires_session_after_max_messages(smtp_server):
+    pool = make_pool(smtp_server, max_messages=2)
+    try:
+        results = pool.send_many(SENDER, [(f"user{i}@example.com", message(f"user{i}@example.com")) for i in range(5)])
+    finally:
+        pool.close_all()
+
+    assert results == [None] * 5
+    assert len(smtp_server.handler.sessions()) == 3
+
+def test_health_check_replaces_dead_session(smtp_server):
+    pool = make_pool(smtp_server, health_check_after=0)
+    try:
+        pool.send(SENDER, "first@example.com", message("first@example.com"))
+        # Restart the server so the pooled session is gone
+        smtp_server.restart()
+        time.sleep(0.01)
+        pool.send(SENDER, "second@example.com", message("second@example.com"))
+    finally:
+        pool.close_all()
+
+    assert [recipient for _, recipient in smtp_server.handler.deliveries] == ["first@example.com", "second@example.com"]
+    assert len(smtp_server.handler.sessions()) == 2
+
+def test_health_check_keeps_live_session(smtp_server):
+    pool = make_pool(smtp_server, health_check_after=0)
+    try:
+        pool.send(SENDER, "first@example.com", message("first@example.com"))
+        time.sleep(0.01)
+        pool.send(SENDER, "second@example.com", message("second@example.com"))
+    finally:
+        pool.close_all()
+
+    assert smtp_server.handler.noops == 1
+    assert len(smtp_server.handler.sessions()) == 1
+
+def test_reconnects_when_reused_session_dropped(smtp_server):
+    # No health check, so the dropped session is only noticed when sending on it
+    pool = make_pool(smtp_server, health_check_after=3600)
+    try:
+        pool.send(SENDER, "first@example.com", message("first@example.com"))
+        smtp_server.restart()
+        pool.send(SENDER, "second@example.com", message("second@example.com"))
+    finally:
+        pool.close_all()
+
+    assert [recipient for _, recipient in smtp_server.handler.deliveries] == ["first@example.com", "second@example.com"]
+    assert len(smtp_server.handler.sessions()) == 2
+
+def test_reports_connection_failures_per_message():
+    port = free_port()
+    pool = SMTPConnectionPool("127.0.0.1", port, None, None, use_tls=False, timeout=1)
+
+    results = pool.send_many(SENDER, [("a@example.com", message("a@example.com")), ("b@example.com", message("b@example.com"))])
+
+    assert len(results) == 2
+    assert all(isinstance(error, OSError) for error in results)